@@ -0,0 +1,331 @@
+"""
+Closed-Form Annuity Engine
+Analytic annuity formulas for payoff time, remaining debt and cumulative sums
+
+All functions model the yearly recursion used by FinancingCalculator:
+
+    interest_k = debt_{k-1} * rate
+    debt_k     = debt_{k-1} - (payment - interest_k)
+
+where ``payment`` is the annual payment plus the annual special payment and
+the final amortization is capped at the remaining debt.  Solving the
+recursion gives
+
+    debt_n = debt_0 * (1 + rate)^n - payment * ((1 + rate)^n - 1) / rate
+
+so every quantity below is evaluated in O(1) instead of walking the
+schedule year by year. :func:`schedule_arrays` applies the same formula to
+whole schedules with NumPy.
+"""
+
+import math
+
+import numpy as np
+
+
+def is_feasible(principal: float, rate: float, payment: float) -> bool:
+    """Check whether the payment amortizes the loan at all.
+
+    Args:
+        principal: Loan amount at the start (€)
+        rate: Annual interest rate as a fraction (e.g. 0.04 for 4%)
+        payment: Total annual payment including special payments (€)
+
+    Returns:
+        True if the first year's amortization is positive (or there is no
+        debt to repay), False if the payment does not exceed the interest.
+    """
+    if principal <= 0:
+        return True
+    return payment - principal * rate > 0
+
+
+def debt_after(principal: float, rate: float, payment: float, years: float) -> float:
+    """Debt after ``years`` years of the uncapped annuity recursion.
+
+    The value may become negative once the loan would have been paid off;
+    use :func:`remaining_debt` for the capped balance.
+    """
+    if rate == 0:
+        return principal - payment * years
+    # Written as D0 + (interest - payment) * annuity factor so that an
+    # interest-only payment keeps the debt exactly constant
+    factor = math.expm1(years * math.log1p(rate)) / rate
+    return principal + (principal * rate - payment) * factor
+
+
+def first_year_at_or_below(
+    principal: float, rate: float, payment: float, threshold: float
+) -> float:
+    """Smallest whole year n >= 1 with ``debt_after(n) <= threshold``.
+
+    Args:
+        principal: Loan amount at the start (€)
+        rate: Annual interest rate as a fraction
+        payment: Total annual payment including special payments (€)
+        threshold: Debt level to reach (€)
+
+    Returns:
+        The year as an int, or ``math.inf`` if the debt never falls to the
+        threshold (infeasible payment).
+    """
+    if debt_after(principal, rate, payment, 1) <= threshold:
+        return 1
+    if not is_feasible(principal, rate, payment):
+        return math.inf
+
+    if rate == 0:
+        estimate = (principal - threshold) / payment
+    else:
+        # debt_n <= threshold  <=>  (1+r)^n >= (P - r*T) / (P - r*D0)
+        estimate = math.log(
+            (payment - rate * threshold) / (payment - rate * principal)
+        ) / math.log1p(rate)
+
+    # The logarithm is exact up to rounding, so nudge the estimate by at
+    # most a year in either direction to land on the precise boundary.
+    year = max(1, math.ceil(estimate))
+    while year > 1 and debt_after(principal, rate, payment, year - 1) <= threshold:
+        year -= 1
+    while debt_after(principal, rate, payment, year) > threshold:
+        year += 1
+    return year
+
+
+def payoff_year(principal: float, rate: float, payment: float) -> float:
+    """Whole year in which the loan is fully repaid (``math.inf`` if never)."""
+    return first_year_at_or_below(principal, rate, payment, 0.0)
+
+
+def payoff_years_precise(principal: float, rate: float, payment: float) -> float:
+    """Fractional payoff time in years (``math.inf`` if never repaid).
+
+    The fraction of the final year is the share of that year's amortization
+    needed to clear the remaining debt.
+    """
+    if payment - principal * rate <= 0:
+        return math.inf
+    year = payoff_year(principal, rate, payment)
+    debt_before = debt_after(principal, rate, payment, year - 1)
+    amortization = payment - debt_before * rate
+    return (year - 1) + debt_before / amortization
+
+
+def remaining_debt(principal: float, rate: float, payment: float, years: int) -> float:
+    """Outstanding debt after ``years`` years, capped at zero once repaid."""
+    if years <= 0:
+        return principal
+    return max(0.0, debt_after(principal, rate, payment, years))
+
+
+def cumulative_interest(
+    principal: float, rate: float, payment: float, years: int
+) -> float:
+    """Total interest paid during the first ``years`` years.
+
+    Interest stops accruing after the payoff year, so the horizon is clamped
+    to it before applying ``sum(interest) = n * payment - (D0 - D_n)``.
+    """
+    if years <= 0:
+        return 0.0
+    years = min(years, payoff_year(principal, rate, payment))
+    return years * payment - (principal - debt_after(principal, rate, payment, years))
+
+
+def cumulative_amortization(
+    principal: float, rate: float, payment: float, years: int
+) -> float:
+    """Total principal repaid during the first ``years`` years."""
+    return principal - remaining_debt(principal, rate, payment, years)
+
+
+def schedule_arrays(principal: float, rate: float, payment: float, years: int) -> dict:
+    """Vectorized yearly amortization schedule.
+
+    Each year's opening balance is taken from the closed form
+    ``debt_after(k - 1)`` evaluated for all k at once, so no Python-level
+    loop is involved.  The final year's amortization is capped at the
+    outstanding debt, and balances stay at zero afterwards.
+
+    Args:
+        principal: Loan amount at the start (€)
+        rate: Annual interest rate as a fraction
+        payment: Total annual payment including special payments (€)
+        years: Number of years to generate
+
+    Returns:
+        Dictionary of contiguous arrays of length ``years``: ``year`` (int64)
+        and ``debt_start``, ``interest``, ``amortization``, ``debt_end``
+        (float64).
+    """
+    years = max(int(years), 0)
+    elapsed = np.arange(years, dtype=np.float64)
+
+    if rate == 0:
+        debt_start = principal - payment * elapsed
+    else:
+        factor = np.expm1(elapsed * np.log1p(rate)) / rate
+        debt_start = principal + (principal * rate - payment) * factor
+
+    # Opening balances after the first year never drop below zero; the
+    # first one is the loan itself, exactly as in the yearly recursion.
+    np.maximum(debt_start[1:], 0.0, out=debt_start[1:])
+
+    interest = debt_start * rate
+    amortization = np.minimum(payment - interest, debt_start)
+    debt_end = debt_start - amortization
+
+    return {
+        "year": np.arange(1, years + 1, dtype=np.int64),
+        "debt_start": debt_start,
+        "interest": interest,
+        "amortization": amortization,
+        "debt_end": debt_end,
+    }
+
+
+def schedule_arrays_variable(principal: float, rate: float, payments) -> dict:
+    """Vectorized amortization schedule with a payment per period.
+
+    Until payoff the recursion is linear in the payments, so every opening
+    balance follows from one cumulative sum of discounted payments:
+
+        debt_k = (1 + rate)^k * (debt_0 - sum_{i<=k} payment_i / (1 + rate)^i)
+
+    No Python-level loop or per-period branching is involved.  The final
+    amortization is capped at the outstanding debt, and balances stay at
+    zero afterwards.
+
+    Args:
+        principal: Loan amount at the start (€)
+        rate: Interest rate per period as a fraction (e.g. annual rate / 12
+            for months)
+        payments: Total payment of every period including special payments
+            (€); its length is the number of periods
+
+    Returns:
+        Dictionary of arrays of length ``len(payments)``: ``period`` (int64,
+        1-based) and ``debt_start``, ``payment``, ``interest``,
+        ``amortization``, ``debt_end`` (float64).
+    """
+    payments = np.asarray(payments, dtype=np.float64)
+    periods = len(payments)
+    growth = np.exp(np.arange(periods, dtype=np.float64) * np.log1p(rate))
+
+    debt_start = np.empty(periods)
+    if periods:
+        discounted = np.cumsum(payments[:-1] / growth[1:])
+        debt_start[0] = principal
+        debt_start[1:] = growth[1:] * (principal - discounted)
+    np.maximum(debt_start[1:], 0.0, out=debt_start[1:])
+
+    interest = debt_start * rate
+    amortization = np.minimum(payments - interest, debt_start)
+    return {
+        "period": np.arange(1, periods + 1, dtype=np.int64),
+        "debt_start": debt_start,
+        "payment": payments,
+        "interest": interest,
+        "amortization": amortization,
+        "debt_end": debt_start - amortization,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Array variants
+#
+# The functions below mirror the scalar helpers above but broadcast over
+# NumPy arrays of principals, rates and payments, so many scenarios can be
+# evaluated in one call.  Years are returned as float arrays with ``inf``
+# marking loans that are never repaid.
+# ---------------------------------------------------------------------------
+
+
+def _as_arrays(*values) -> list:
+    """Broadcast the given values against each other as float64 arrays"""
+    return np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in values))
+
+
+def debt_after_array(principal, rate, payment, years) -> np.ndarray:
+    """Array version of :func:`debt_after`"""
+    principal, rate, payment, years = _as_arrays(principal, rate, payment, years)
+    zero_rate = rate == 0
+    factor = np.where(
+        zero_rate,
+        years,
+        np.expm1(years * np.log1p(rate)) / np.where(zero_rate, 1.0, rate),
+    )
+    return principal + (principal * rate - payment) * factor
+
+
+def is_feasible_array(principal, rate, payment) -> np.ndarray:
+    """Array version of :func:`is_feasible`"""
+    principal = np.asarray(principal, dtype=np.float64)
+    return (principal <= 0) | (payment - principal * rate > 0)
+
+
+def first_year_at_or_below_array(principal, rate, payment, threshold) -> np.ndarray:
+    """Array version of :func:`first_year_at_or_below`"""
+    principal, rate, payment, threshold = _as_arrays(
+        principal, rate, payment, threshold
+    )
+    reached_first_year = debt_after_array(principal, rate, payment, 1) <= threshold
+    solvable = is_feasible_array(principal, rate, payment) & ~reached_first_year
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        estimate = np.where(
+            rate == 0,
+            (principal - threshold) / payment,
+            np.log((payment - rate * threshold) / (payment - rate * principal))
+            / np.log1p(rate),
+        )
+    estimate = np.where(solvable & np.isfinite(estimate), estimate, 1.0)
+    year = np.maximum(1.0, np.ceil(estimate))
+
+    # Same one-year nudges as the scalar version, applied element-wise
+    for _ in range(2):
+        step_down = (year > 1) & (
+            debt_after_array(principal, rate, payment, year - 1) <= threshold
+        )
+        year = np.where(step_down, year - 1, year)
+    for _ in range(2):
+        step_up = debt_after_array(principal, rate, payment, year) > threshold
+        year = np.where(solvable & step_up, year + 1, year)
+
+    year = np.where(reached_first_year, 1.0, year)
+    return np.where(reached_first_year | solvable, year, np.inf)
+
+
+def payoff_year_array(principal, rate, payment) -> np.ndarray:
+    """Array version of :func:`payoff_year`"""
+    return first_year_at_or_below_array(principal, rate, payment, 0.0)
+
+
+def payoff_years_precise_array(principal, rate, payment) -> np.ndarray:
+    """Array version of :func:`payoff_years_precise`"""
+    principal, rate, payment = _as_arrays(principal, rate, payment)
+    feasible = payment - principal * rate > 0
+    year = payoff_year_array(principal, rate, payment)
+    finite_year = np.where(np.isfinite(year), year, 1.0)
+    debt_before = debt_after_array(principal, rate, payment, finite_year - 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precise = (finite_year - 1) + debt_before / (payment - debt_before * rate)
+    return np.where(feasible & np.isfinite(year), precise, np.inf)
+
+
+def remaining_debt_array(principal, rate, payment, years) -> np.ndarray:
+    """Array version of :func:`remaining_debt`"""
+    debt = np.maximum(0.0, debt_after_array(principal, rate, payment, years))
+    principal = np.broadcast_to(np.asarray(principal, dtype=np.float64), debt.shape)
+    return np.where(np.asarray(years) <= 0, principal, debt)
+
+
+def cumulative_interest_array(principal, rate, payment, years) -> np.ndarray:
+    """Array version of :func:`cumulative_interest`"""
+    years = np.asarray(years, dtype=np.float64)
+    horizon = np.minimum(years, payoff_year_array(principal, rate, payment))
+    horizon = np.maximum(horizon, 0.0)
+    interest = horizon * payment - (
+        principal - debt_after_array(principal, rate, payment, horizon)
+    )
+    return np.where(years <= 0, 0.0, interest)
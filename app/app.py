@@ -8,6 +8,21 @@ for better maintainability and code organization.
 
 Modules:
 - calculator.py: Core financial calculation engine
+- annuity.py: Closed-form and vectorized annuity formulas
+- monthly.py: Monthly amortization schedules with yearly roll-up
+- cents.py: Integer-cents (bank-exact) amortization kernel
+- kernels.py: Recursive amortization loops with optional numba backend
+- ratepath.py: Amortization under piecewise interest rate paths
+- montecarlo.py: Monte Carlo simulation of follow-up interest rates
+- followup.py: Ranking of follow-up financing offers after the binding period
+- shortrate.py: Vasicek / Hull-White short-rate models
+- schedule.py: Columnar schedule table with row views
+- summary.py: Lazy summary mapping computing KPI groups on first access
+- kpis.py: KPI registry with declared dependencies and execution planner
+- batch.py: Vectorized KPI evaluation for many scenarios
+- solver.py: Goal-seek solver for input fields given a target KPI
+- specialpayments.py: Special payment optimizer under annual caps
+- cache.py: Shared LRU cache for calculation results
 - components.py: Reusable UI components (cards, tables, metric boxes)
 - charts.py: Chart generation functions
 - layout.py: Main dashboard layout structure
@@ -16,6 +31,8 @@ Modules:
 """
 
 import dash
+import kernels
+from config import KERNEL_BACKEND
 from layout import create_layout
 from callbacks import register_callbacks
 
@@ -23,6 +40,7 @@ from callbacks import register_callbacks
 def create_app():
     """Initialize and configure the Dash application"""
     app = dash.Dash(__name__)
+    kernels.set_backend(KERNEL_BACKEND)
     # Note: app.title is set in layout but browser tab title doesn't update dynamically
     # It will use the initial language's title
     from translations import get_text
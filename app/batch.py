@@ -0,0 +1,297 @@
+"""
+Batch Scenario Evaluation
+Evaluates get_summary KPIs for many financing scenarios at once
+
+Every KPI is computed with NumPy broadcasting over all scenarios, using the
+array variants of the closed-form annuity engine, instead of instantiating a
+FinancingCalculator per row.  Results agree with
+``FinancingCalculator(...).get_summary(years)`` to within ``RELATIVE_TOLERANCE``
+(relative) or ``ABSOLUTE_TOLERANCE`` (in euros / years), whichever is larger;
+the difference is floating-point rounding between the closed form and
+year-by-year summation.
+"""
+
+import numpy as np
+import pandas as pd
+
+import annuity
+
+# Documented agreement with the scalar FinancingCalculator
+RELATIVE_TOLERANCE = 1e-9
+ABSOLUTE_TOLERANCE = 1e-6
+
+# Same horizon as FinancingCalculator.calculate_payoff_years
+MAX_YEARS = 100
+
+INPUT_COLUMNS = [
+    "purchase_price",
+    "equity",
+    "interest_rate",
+    "initial_amortization",
+    "annual_special_payment",
+    "interest_binding_years",
+]
+
+# Defaults mirror the optional FinancingInput fields
+INPUT_DEFAULTS = {
+    "annual_special_payment": 0.0,
+    "interest_binding_years": 10,
+}
+
+
+def _read_inputs(inputs) -> dict:
+    """Extract input columns from a DataFrame or mapping as broadcast arrays"""
+    columns = {}
+    for name in INPUT_COLUMNS:
+        if name in inputs:
+            columns[name] = np.asarray(inputs[name], dtype=np.float64)
+        elif name in INPUT_DEFAULTS:
+            columns[name] = np.float64(INPUT_DEFAULTS[name])
+        else:
+            raise ValueError(f"Missing required input column: {name}")
+
+    broadcast = np.broadcast_arrays(*columns.values())
+    return {
+        name: np.atleast_1d(np.array(values, dtype=np.float64))
+        for name, values in zip(columns, broadcast)
+    }
+
+
+def _breakeven(principal, rate, payment, schedule_years) -> tuple:
+    """Vectorized breakeven search over each scenario's payoff schedule.
+
+    Builds (scenarios × years) matrices of the yearly schedule, accumulates
+    amortization and interest along the year axis and finds the first year
+    in which amortization is ahead.
+    """
+    width = int(schedule_years.max()) if schedule_years.size else 0
+    elapsed = np.arange(width, dtype=np.float64)
+    years = elapsed + 1
+
+    debt_start = annuity.debt_after_array(
+        principal[:, None], rate[:, None], payment[:, None], elapsed[None, :]
+    )
+    debt_start[:, 1:] = np.maximum(debt_start[:, 1:], 0.0)
+    interest = debt_start * rate[:, None]
+    amortization = np.minimum(payment[:, None] - interest, debt_start)
+    cumulative_amortization = np.cumsum(amortization, axis=1)
+    cumulative_interest = np.cumsum(interest, axis=1)
+
+    in_schedule = years[None, :] <= schedule_years[:, None]
+    ahead = (cumulative_amortization > cumulative_interest) & in_schedule
+    reached = ahead.any(axis=1)
+
+    # Without breakeven, report the totals at the end of the schedule
+    index = np.where(reached, ahead.argmax(axis=1), schedule_years - 1).astype(int)
+    rows = np.arange(len(principal))
+    amortization_at = cumulative_amortization[rows, index]
+    interest_at = cumulative_interest[rows, index]
+
+    breakeven_year = pd.array(index + 1, dtype="Int64")
+    breakeven_year[~reached] = pd.NA
+    return breakeven_year, amortization_at, interest_at
+
+
+def _time_to_equity_percentage(
+    purchase_price, principal, rate, payment, target_percentage, max_years=MAX_YEARS
+) -> np.ndarray:
+    """Vectorized FinancingCalculator._calculate_time_to_equity_percentage"""
+    debt_threshold = purchase_price - purchase_price * (target_percentage / 100)
+    beyond_payoff = debt_threshold < 0
+
+    year = annuity.first_year_at_or_below_array(
+        principal, rate, payment, np.maximum(debt_threshold, 0.0)
+    )
+    payoff = annuity.payoff_year_array(principal, rate, payment)
+    year = np.where(beyond_payoff, payoff, year)
+    capped = year > max_years
+    year = np.where(capped, max_years, year)
+
+    debt_before = annuity.remaining_debt_array(principal, rate, payment, year - 1)
+    debt_end = annuity.remaining_debt_array(principal, rate, payment, year)
+    progress = debt_before - debt_end
+    with np.errstate(divide="ignore", invalid="ignore"):
+        interpolated = (year - 1) + (debt_before - debt_threshold) / progress
+    interpolated = np.where(progress > 0, interpolated, year)
+    return np.where(capped | beyond_payoff, year, interpolated)
+
+
+def evaluate_batch(inputs, years=None) -> pd.DataFrame:
+    """Evaluate get_summary KPIs for many financing scenarios at once.
+
+    Args:
+        inputs: DataFrame or mapping of array-likes keyed by FinancingInput
+            field names. ``annual_special_payment`` and
+            ``interest_binding_years`` are optional and default like
+            FinancingInput; scalars broadcast against arrays. Scenarios are
+            evaluated with yearly resolution.
+        years: Summary horizon (scalar or per-row array). Defaults to each
+            scenario's payoff years, as shown in the dashboard.
+
+    Returns:
+        DataFrame with one row per scenario and one column per scalar
+        get_summary key. ``equity_buildup_rate`` is a per-year series and is
+        not part of the batch output. ``breakeven_year`` uses the nullable
+        Int64 dtype, with <NA> where breakeven is never reached.
+    """
+    columns = _read_inputs(inputs)
+    purchase_price = columns["purchase_price"]
+    equity = columns["equity"]
+    interest_rate = columns["interest_rate"]
+    initial_amortization = columns["initial_amortization"]
+    special_payment = columns["annual_special_payment"]
+
+    rate = interest_rate / 100
+    principal = purchase_price - equity
+    annual_payment = principal * (rate + initial_amortization / 100)
+    monthly_payment = annual_payment / 12
+    payment = annual_payment + special_payment
+
+    payoff_years = np.minimum(
+        annuity.payoff_year_array(principal, rate, payment), MAX_YEARS
+    )
+    if years is None:
+        horizon = payoff_years
+    else:
+        horizon = np.broadcast_to(
+            np.asarray(years, dtype=np.float64), principal.shape
+        ).copy()
+
+    total_interest = annuity.cumulative_interest_array(
+        principal, rate, payment, horizon
+    )
+    remaining_debt = annuity.remaining_debt_array(principal, rate, payment, horizon)
+    total_amortization = principal - remaining_debt
+
+    # Interest savings: payoff schedules with and without special payments
+    has_special = special_payment != 0
+    payoff_years_without = np.minimum(
+        annuity.payoff_year_array(principal, rate, annual_payment), MAX_YEARS
+    )
+    interest_with_special = np.where(
+        has_special,
+        annuity.cumulative_interest_array(principal, rate, payment, payoff_years),
+        0.0,
+    )
+    interest_without_special = np.where(
+        has_special,
+        annuity.cumulative_interest_array(
+            principal, rate, annual_payment, payoff_years_without
+        ),
+        0.0,
+    )
+    time_saved_years = np.where(has_special, payoff_years_without - payoff_years, 0)
+
+    breakeven_year, amortization_at_breakeven, interest_at_breakeven = _breakeven(
+        principal, rate, payment, payoff_years
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        interest_to_principal_ratio = np.where(
+            total_amortization > 0, total_interest / total_amortization, 0.0
+        )
+        ltv_ratio = np.where(
+            purchase_price > 0, principal / purchase_price * 100, 0.0
+        )
+        buffer_ratio = np.where(equity > 0, (monthly_payment * 6) / equity, 0.0)
+
+    rate_sensitivity_score = (
+        principal * (rate + 0.01 + initial_amortization / 100) / 12 - monthly_payment
+    )
+
+    index = inputs.index if isinstance(inputs, pd.DataFrame) else None
+    return pd.DataFrame(
+        {
+            "purchase_price": purchase_price,
+            "equity": equity,
+            "loan_amount": principal,
+            "annual_payment": annual_payment,
+            "monthly_payment": monthly_payment,
+            "interest_rate": interest_rate,
+            "initial_amortization": initial_amortization,
+            "total_interest": total_interest,
+            "total_amortization": total_amortization,
+            "remaining_debt": remaining_debt,
+            "years": horizon.astype(np.int64),
+            # High-Priority KPIs
+            "total_cost_of_ownership": purchase_price + total_interest,
+            "interest_to_principal_ratio": interest_to_principal_ratio,
+            "ltv_ratio": ltv_ratio,
+            "interest_savings": interest_without_special - interest_with_special,
+            "interest_without_special": interest_without_special,
+            "interest_with_special": interest_with_special,
+            "time_saved_years": time_saved_years.astype(np.int64),
+            # Medium-priority KPIs
+            "breakeven_year": breakeven_year,
+            "cumulative_amortization_at_breakeven": amortization_at_breakeven,
+            "cumulative_interest_at_breakeven": interest_at_breakeven,
+            # Low-priority KPIs
+            "buffer_ratio": buffer_ratio,
+            "time_to_50_equity": _time_to_equity_percentage(
+                purchase_price, principal, rate, payment, 50
+            ),
+            "rate_sensitivity_score": rate_sensitivity_score,
+        },
+        index=index,
+    )
+
+
+def evaluate_sensitivity_grid(
+    input_data, interest_rates, initial_amortizations, years=None
+) -> dict:
+    """Total interest and payoff years over an interest rate × amortization grid.
+
+    Every other input is taken from ``input_data``; the whole surface is one
+    broadcast evaluation of the closed-form annuity engine (rates along the
+    first axis, amortizations along the second) instead of one
+    FinancingCalculator per cell. Cells are evaluated with yearly resolution.
+
+    Args:
+        input_data: FinancingInput providing the fixed inputs
+        interest_rates: Interest rates in percent (grid rows)
+        initial_amortizations: Initial amortization rates in percent
+            (grid columns)
+        years: Summary horizon. Defaults to each cell's payoff years, as
+            shown in the dashboard.
+
+    Returns:
+        Dictionary with the axes ``interest_rate`` and
+        ``initial_amortization`` and (rates × amortizations) arrays
+        ``monthly_payment``, ``payoff_years`` (capped at MAX_YEARS),
+        ``total_interest`` and ``remaining_debt``.
+
+    Raises:
+        ValueError: If input_data.special_payments is set
+    """
+    if input_data.special_payments is not None:
+        raise ValueError(
+            "special_payments are not supported by this analysis; "
+            "use annual_special_payment"
+        )
+    interest_rate = np.atleast_1d(np.asarray(interest_rates, dtype=np.float64))
+    initial_amortization = np.atleast_1d(
+        np.asarray(initial_amortizations, dtype=np.float64)
+    )
+    principal = float(input_data.purchase_price - input_data.equity)
+
+    rate = interest_rate[:, None] / 100
+    annual_payment = principal * (rate + initial_amortization[None, :] / 100)
+    payment = annual_payment + input_data.annual_special_payment
+
+    payoff_years = np.minimum(
+        annuity.payoff_year_array(principal, rate, payment), MAX_YEARS
+    )
+    horizon = payoff_years if years is None else np.full(payoff_years.shape, years)
+
+    return {
+        "interest_rate": interest_rate,
+        "initial_amortization": initial_amortization,
+        "monthly_payment": annual_payment / 12,
+        "payoff_years": payoff_years.astype(np.int64),
+        "total_interest": annuity.cumulative_interest_array(
+            principal, rate, payment, horizon
+        ),
+        "remaining_debt": annuity.remaining_debt_array(
+            principal, rate, payment, horizon
+        ),
+    }
@@ -0,0 +1,438 @@
+"""
+Result Cache
+Process-wide LRU memoization of FinancingCalculator results
+
+Several callbacks build a FinancingCalculator from the same sidebar values
+and recompute payoff years, schedules and summaries from scratch.  The
+helpers in this module serve those results from a bounded LRU cache keyed
+on a canonical, frozen copy of the FinancingInput.
+
+Cached values are shared between callers and must be treated as read-only.
+Schedules and summaries are computed with the side-effect-free calculator
+API and are cached as read-only objects, so they can be served to
+concurrent requests.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+import sys
+import threading
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from batch import evaluate_sensitivity_grid
+from calculator import (
+    SCHEDULE_DATAFRAME_COLUMNS,
+    FinancingCalculator,
+    FinancingInput,
+)
+from config import (
+    CACHE_MAX_BYTES,
+    CACHE_MAX_ENTRIES,
+    INCOME_PERCENTAGE_MAX,
+    INCOME_PERCENTAGE_MIN,
+    SENSITIVITY_AMORTIZATIONS,
+    SENSITIVITY_RATE_SPAN,
+    SENSITIVITY_RATE_STEP,
+)
+from kpis import EQUITY_MILESTONES
+from schedule import ScheduleTable
+from summary import Summary
+
+
+@dataclass(frozen=True)
+class CanonicalInput:
+    """Frozen, hashable form of FinancingInput used as cache key.
+
+    Numbers are normalized so that equal inputs hash equally regardless of
+    how the UI delivered them (e.g. 300000 vs 300000.0, -0.0 vs 0.0).
+    """
+
+    purchase_price: float
+    equity: float
+    interest_rate: float
+    initial_amortization: float
+    annual_special_payment: float
+    interest_binding_years: int
+    special_payment_month: int
+    resolution: str
+    rounding: str
+    special_payments: tuple
+
+    @classmethod
+    def from_input(cls, input_data: FinancingInput) -> "CanonicalInput":
+        """Create the canonical key for a FinancingInput"""
+        return cls(
+            purchase_price=float(input_data.purchase_price) + 0.0,
+            equity=float(input_data.equity) + 0.0,
+            interest_rate=float(input_data.interest_rate) + 0.0,
+            initial_amortization=float(input_data.initial_amortization) + 0.0,
+            annual_special_payment=float(input_data.annual_special_payment) + 0.0,
+            interest_binding_years=int(input_data.interest_binding_years),
+            special_payment_month=int(input_data.special_payment_month),
+            resolution=str(input_data.resolution),
+            rounding=input_data.rounding,
+            # Already normalized to (nested) tuples of floats by FinancingInput
+            special_payments=input_data.special_payments,
+        )
+
+    def to_input(self) -> FinancingInput:
+        """Recreate a FinancingInput with the canonical values"""
+        return FinancingInput(
+            **{field.name: getattr(self, field.name) for field in fields(self)}
+        )
+
+
+def _estimate_size(value) -> int:
+    """Approximate memory footprint of a cached value in bytes"""
+    if isinstance(value, np.ndarray):
+        return sys.getsizeof(value) + (0 if value.base is not None else value.nbytes)
+    if isinstance(value, ScheduleTable):
+        return sys.getsizeof(value) + value.nbytes
+    if isinstance(value, Summary):
+        # Only the KPIs computed so far; estimating must not compute the rest
+        return sys.getsizeof(value) + sum(
+            _estimate_size(key) + _estimate_size(item)
+            for key, item in list(dict.items(value))
+        )
+    if isinstance(value, dict):
+        # Copy the items: calculator caches may grow in another thread
+        return sys.getsizeof(value) + sum(
+            _estimate_size(key) + _estimate_size(item)
+            for key, item in list(value.items())
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_estimate_size(item) for item in value)
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + _estimate_size(vars(value))
+    return sys.getsizeof(value)
+
+
+def _can_grow(value) -> bool:
+    """Whether a cached value computes and keeps more data after caching"""
+    return isinstance(value, (Summary, FinancingCalculator))
+
+
+class ResultCache:
+    """Thread-safe LRU cache with entry and byte limits.
+
+    Entries are keyed by (CanonicalInput, kind, args).  The least recently
+    used entries are evicted once more than ``max_entries`` entries are held
+    or their estimated size exceeds ``max_bytes``.  Summaries and calculators
+    keep computing (lazy KPIs, payoff index, KPI cache) after they were
+    cached, so the size of such an entry is measured again whenever it is
+    read; growth is counted at the next read of the entry.
+    """
+
+    def __init__(
+        self, max_entries: int = CACHE_MAX_ENTRIES, max_bytes: int = CACHE_MAX_BYTES
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(
+        self, input_data: FinancingInput, kind: str, args: tuple, compute: Callable
+    ):
+        """Return the cached value for the key, computing it on a miss.
+
+        Args:
+            input_data: Financing input the value was derived from
+            kind: Name of the cached result (e.g. "summary")
+            args: Further hashable arguments of the result (e.g. years)
+            compute: Zero-argument function producing the value on a miss
+
+        Returns:
+            The cached or freshly computed value
+        """
+        key = (CanonicalInput.from_input(input_data), kind, args)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if entry is not None:
+            value = entry[0]
+            if _can_grow(value):
+                # Measured outside the lock; only the entry being read
+                self._resize(key, value, _estimate_size(value))
+            return value
+
+        # Compute outside the lock so slow misses don't block other requests
+        value = compute()
+        size = _estimate_size(value)
+
+        with self._lock:
+            if key in self._entries or size > self.max_bytes:
+                return value
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self._evict()
+        return value
+
+    def _resize(self, key, value, size: int):
+        """Record the current size of an entry, unless it was replaced"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not value:
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size - entry[1]
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until both limits hold"""
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    def invalidate(self, input_data: FinancingInput = None):
+        """Remove cached results for one input, or everything if None"""
+        with self._lock:
+            if input_data is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            canonical = CanonicalInput.from_input(input_data)
+            for key in [key for key in self._entries if key[0] == canonical]:
+                _, size = self._entries.pop(key)
+                self._bytes -= size
+
+    def configure(self, max_entries: int = None, max_bytes: int = None):
+        """Change the cache limits, evicting entries if necessary"""
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def stats(self) -> dict:
+        """Return hit/miss/eviction counters and current usage"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Process-wide cache shared by all callbacks
+result_cache = ResultCache()
+
+
+def _indexed_calculator(input_data: FinancingInput) -> FinancingCalculator:
+    """Calculator with its payoff index built, shared by all horizons.
+
+    Summaries for different years_to_show values are then lookups in the
+    same prefix sums instead of fresh simulations.
+    """
+
+    def compute():
+        calculator = FinancingCalculator(input_data)
+        calculator._get_payoff_index()
+        return calculator
+
+    return result_cache.get_or_compute(input_data, "payoff_index", (), compute)
+
+
+def cached_payoff_years(input_data: FinancingInput) -> int:
+    """Cached FinancingCalculator.calculate_payoff_years"""
+    return result_cache.get_or_compute(
+        input_data,
+        "payoff_years",
+        (),
+        lambda: FinancingCalculator(input_data).calculate_payoff_years(),
+    )
+
+
+def cached_payoff_years_precise(input_data: FinancingInput) -> float:
+    """Cached FinancingCalculator.calculate_payoff_years_precise"""
+    return result_cache.get_or_compute(
+        input_data,
+        "payoff_years_precise",
+        (),
+        lambda: FinancingCalculator(input_data).calculate_payoff_years_precise(),
+    )
+
+
+def cached_schedule(input_data: FinancingInput, years: int) -> ScheduleTable:
+    """Cached FinancingCalculator.compute_schedule (a read-only table)"""
+    return result_cache.get_or_compute(
+        input_data,
+        "schedule",
+        (years,),
+        lambda: FinancingCalculator(input_data).compute_schedule(years),
+    )
+
+
+def cached_schedule_dataframe(
+    input_data: FinancingInput, years: int, column_names: dict = None
+) -> pd.DataFrame:
+    """Schedule DataFrame wrapping the cached schedule arrays.
+
+    The frame shares the read-only column buffers of the cached schedule
+    instead of copying them, so writes to its values raise ValueError.  A
+    new DataFrame is still returned on every call because chart helpers add
+    columns to the frame they receive.
+
+    Args:
+        input_data: Financing input parameters
+        years: Number of years
+        column_names: Labels by schedule column, e.g. from
+            translations.get_schedule_columns; defaults to the German labels
+    """
+    schedule = cached_schedule(input_data, years)
+    if not schedule:
+        return pd.DataFrame()
+    return schedule.to_dataframe(column_names or SCHEDULE_DATAFRAME_COLUMNS, copy=False)
+
+
+def cached_summary(input_data: FinancingInput, years: int) -> dict:
+    """Cached FinancingCalculator.get_summary (a read-only Summary)"""
+    return result_cache.get_or_compute(
+        input_data,
+        "summary",
+        (years,),
+        lambda: _indexed_calculator(input_data).get_summary(years, read_only=True),
+    )
+
+
+def cached_equity_milestones(
+    input_data: FinancingInput, percentages=EQUITY_MILESTONES
+) -> dict:
+    """Cached FinancingCalculator.calculate_equity_milestones.
+
+    Uses the calculator shared with cached_summary, so the milestones are
+    lookups in its payoff index.
+    """
+    percentages = tuple(percentages)
+    return result_cache.get_or_compute(
+        input_data,
+        "equity_milestones",
+        percentages,
+        lambda: _indexed_calculator(input_data).calculate_equity_milestones(
+            percentages
+        ),
+    )
+
+
+def cached_rate_change(input_data: FinancingInput, new_interest_rate: float) -> dict:
+    """Cached FinancingCalculator.calculate_with_rate_change"""
+    return result_cache.get_or_compute(
+        input_data,
+        "rate_change",
+        (float(new_interest_rate),),
+        lambda: FinancingCalculator(input_data).calculate_with_rate_change(
+            new_interest_rate
+        ),
+    )
+
+
+def cached_years_to_payoff(
+    input_data: FinancingInput, affordable_monthly_payment: float
+) -> dict:
+    """Cached FinancingCalculator.payoff_for_payment"""
+    return result_cache.get_or_compute(
+        input_data,
+        "years_to_payoff",
+        (float(affordable_monthly_payment),),
+        lambda: FinancingCalculator(input_data).payoff_for_payment(
+            affordable_monthly_payment
+        ),
+    )
+
+
+def cached_affordability_curve(
+    input_data: FinancingInput, household_income: float
+) -> pd.DataFrame:
+    """Cached FinancingCalculator.calculate_affordability_curve.
+
+    Covers every step of the income percentage slider, so slider changes
+    only look up a row of the cached curve.
+    """
+    return result_cache.get_or_compute(
+        input_data,
+        "affordability_curve",
+        (float(household_income),),
+        lambda: FinancingCalculator(input_data).calculate_affordability_curve(
+            household_income,
+            np.arange(INCOME_PERCENTAGE_MIN, INCOME_PERCENTAGE_MAX + 1),
+        ),
+    )
+
+
+def cached_sensitivity_grid(input_data: FinancingInput) -> dict:
+    """Cached batch.evaluate_sensitivity_grid around the input's interest rate.
+
+    Rates span SENSITIVITY_RATE_SPAN points either side of the input rate
+    (negative rates are left out); the amortization axis is
+    SENSITIVITY_AMORTIZATIONS.
+    """
+    offsets = np.arange(
+        -SENSITIVITY_RATE_SPAN,
+        SENSITIVITY_RATE_SPAN + SENSITIVITY_RATE_STEP / 2,
+        SENSITIVITY_RATE_STEP,
+    )
+    rates = input_data.interest_rate + offsets
+    return result_cache.get_or_compute(
+        input_data,
+        "sensitivity_grid",
+        (),
+        lambda: evaluate_sensitivity_grid(
+            input_data, rates[rates >= 0], SENSITIVITY_AMORTIZATIONS
+        ),
+    )
+
+
+def cached_affordability(
+    input_data: FinancingInput, household_income: float, income_percentage: float
+) -> dict:
+    """Affordability for one income percentage, read from the cached curve.
+
+    Returns the same dictionary as FinancingCalculator.calculate_years_to_payoff.
+    Percentages outside the slider steps fall back to cached_years_to_payoff.
+    """
+    curve = cached_affordability_curve(input_data, household_income)
+    if income_percentage not in curve.index:
+        return cached_years_to_payoff(
+            input_data, (household_income * income_percentage) / 100
+        )
+
+    row = curve.loc[income_percentage]
+    result = {
+        "years_to_payoff": (
+            None if pd.isna(row["years_to_payoff"]) else int(row["years_to_payoff"])
+        ),
+        "total_interest": (
+            None if pd.isna(row["total_interest"]) else float(row["total_interest"])
+        ),
+        "remaining_debt": float(row["remaining_debt"]),
+        "monthly_payment": float(row["monthly_payment"]),
+        "annual_payment": float(row["annual_payment"]),
+        "feasible": bool(row["feasible"]),
+        "loan_amount": input_data.purchase_price - input_data.equity,
+        "interest_rate": input_data.interest_rate,
+    }
+    if row["error_key"] is not None:
+        result["error_key"] = row["error_key"]
+    if row["error_key"] == "error_payment_insufficient":
+        result["error_payment"] = result["monthly_payment"]
+    return result
@@ -3,10 +3,46 @@ Financing Calculator Module
 Calculates loan amortization schedules and financing summaries
 """
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import astuple, dataclass, replace
+from typing import Iterator, List, Mapping
+import copy
+import math
+import threading
+import numpy as np
 import pandas as pd
 
+import annuity
+import cents
+import kernels
+import kpis
+import monthly
+import ratepath
+from schedule import ScheduleTable
+from summary import Summary
+
+YEARLY_RESOLUTION = "yearly"
+MONTHLY_RESOLUTION = "monthly"
+
+# DataFrame labels of the ScheduleTable columns
+SCHEDULE_DATAFRAME_COLUMNS = {
+    "year": "Jahr",
+    "debt_start": "Restschuld Anfang (€)",
+    "annual_payment": "Jahresrate (€)",
+    "interest_payment": "Zinsanteil (€)",
+    "amortization": "Tilgung (€)",
+    "debt_end": "Restschuld Ende (€)",
+}
+
+
+def _special_payment_tuple(special_payments) -> tuple:
+    """FinancingInput.special_payments as (nested) tuples of floats"""
+    amounts = np.asarray(special_payments, dtype=np.float64) + 0.0
+    if amounts.ndim == 1:
+        return tuple(amounts.tolist())
+    if amounts.ndim == 2 and amounts.shape[1] == monthly.MONTHS_PER_YEAR:
+        return tuple(map(tuple, amounts.tolist()))
+    raise ValueError("special_payments must hold one amount per year or 12 per year")
+
 
 @dataclass
 class FinancingInput:
@@ -18,6 +54,17 @@ class FinancingInput:
     initial_amortization: float  # Initial, in percent
     annual_special_payment: float = 0.0
     interest_binding_years: int = 10
+    special_payment_month: int = 12  # Month (1-12) of the special payment
+    resolution: str = YEARLY_RESOLUTION  # "yearly" or "monthly" amortization
+    rounding: str = None  # None (binary floats) or a cents.ROUNDING_MODES entry
+    # Special payments that vary by year, replacing annual_special_payment in
+    # schedules: one amount per year (paid in special_payment_month) or one
+    # row of 12 monthly amounts per year; later years have none
+    special_payments: tuple = None
+
+    def __post_init__(self):
+        if self.special_payments is not None:
+            self.special_payments = _special_payment_tuple(self.special_payments)
 
 
 @dataclass
@@ -32,26 +79,349 @@ class YearlySchedule:
     debt_end: float
 
 
+@dataclass(frozen=True)
+class FinancingResult:
+    """Immutable result of FinancingCalculator.evaluate.
+
+    The schedule columns are read-only arrays, the summary and its nested
+    values reject changes, and input is a copy that changes of the caller's
+    FinancingInput do not reach, so a result can be cached and shared
+    between threads.
+    """
+
+    input: FinancingInput
+    annual_payment: float
+    monthly_payment: float
+    payoff_years: int
+    years: int  # Horizon of schedule and summary
+    schedule: ScheduleTable
+    summary: Mapping
+
+
 class FinancingCalculator:
-    """Calculator for property financing with amortization schedules"""
+    """Calculator for property financing with amortization schedules.
+
+    The evaluation methods (evaluate, compute_schedule, get_summary,
+    payoff_for_payment, ...) do not change the calculator, and its internal
+    caches are built under a lock, so one instance can serve concurrent
+    requests. calculate_schedule and calculate_years_to_payoff are the
+    older mutating variants: they store the schedule on the calculator or
+    replace its payment (use with_monthly_payment instead).
+    """
 
-    def __init__(self, input_data: FinancingInput):
+    def __init__(self, input_data: FinancingInput, annual_payment: float = None):
+        """
+        Args:
+            input_data: Financing input
+            annual_payment: Regular annual payment (€) replacing the one
+                derived from initial_amortization
+        """
         self.input = input_data
         self.loan_amount = input_data.purchase_price - input_data.equity
-        self.annual_payment = self._calculate_annual_payment()
+        if annual_payment is None:
+            annual_payment = self._calculate_annual_payment()
+        self.annual_payment = annual_payment
         self.monthly_payment = self.annual_payment / 12
-        self.schedule: List[YearlySchedule] = []
+        self.schedule: ScheduleTable = ScheduleTable.empty()
+        self.schedule_arrays: dict = {}
+        self._payoff_index: dict = {}
+        self._kpi_cache: dict = {}
+        self._exact_schedules: dict = {}
+        self._lock = threading.RLock()
+
+    def with_monthly_payment(self, monthly_payment: float) -> "FinancingCalculator":
+        """New calculator for the same loan with a different monthly payment"""
+        return FinancingCalculator(self.input, annual_payment=monthly_payment * 12)
 
     def _calculate_annual_payment(self) -> float:
         """Calculate annual payment based on initial amortization and interest rate"""
         rate = self.input.interest_rate / 100
-        return self.loan_amount * (rate + self.input.initial_amortization / 100)
+        amortization = self.input.initial_amortization / 100
+        annual_payment = self.loan_amount * (rate + amortization)
+        if self._is_exact():
+            # Banks fix the payment of every period in whole cents
+            periods = self._periods_per_year()
+            payment = cents.to_cents(annual_payment / periods, self.input.rounding)
+            annual_payment = payment * periods / 100
+        return annual_payment
+
+    def _annuity_terms(self) -> tuple:
+        """Return (annual rate as fraction, annual payment incl. special payment)"""
+        return (
+            self.input.interest_rate / 100,
+            self.annual_payment + self.input.annual_special_payment,
+        )
+
+    def _is_monthly(self) -> bool:
+        """Whether the schedule is computed with monthly resolution"""
+        return self.input.resolution == MONTHLY_RESOLUTION
+
+    def _is_exact(self) -> bool:
+        """Whether the schedule is computed in integer cents"""
+        return self.input.rounding is not None
+
+    def _has_variable_special_payments(self) -> bool:
+        """Whether special payments vary by year (FinancingInput.special_payments)"""
+        return self.input.special_payments is not None
+
+    def _has_special_payments(self) -> bool:
+        """Whether any special payment is made"""
+        if self._has_variable_special_payments():
+            return any(np.ravel(self.input.special_payments))
+        return self.input.annual_special_payment != 0
+
+    def _has_closed_form(self) -> bool:
+        """Whether the closed-form annuity engine describes the schedule"""
+        return not (
+            self._is_monthly()
+            or self._is_exact()
+            or self._has_variable_special_payments()
+        )
+
+    def _require_annual_special_payment(self):
+        """Reject special_payments where only annual_special_payment is modeled"""
+        if self._has_variable_special_payments():
+            raise ValueError(
+                "special_payments are not supported by this analysis; "
+                "use annual_special_payment"
+            )
+
+    def _periods_per_year(self) -> int:
+        """Payment periods per year of the configured resolution"""
+        return monthly.MONTHS_PER_YEAR if self._is_monthly() else 1
+
+    def _special_payment_grid(
+        self, years: int, special_payment: float = None
+    ) -> np.ndarray:
+        """Special payment of every month of the first years (€).
+
+        Args:
+            years: Number of years
+            special_payment: Constant annual special payment replacing the
+                input's special payments (e.g. 0 for the scenario without)
+
+        Returns:
+            (years × 12) array; amounts per year sit in special_payment_month
+        """
+        grid = np.zeros((years, monthly.MONTHS_PER_YEAR))
+        special_index = self.input.special_payment_month - 1
+        if special_payment is None and self._has_variable_special_payments():
+            amounts = np.asarray(self.input.special_payments)[:years]
+            if amounts.ndim == 2:
+                grid[: len(amounts)] = amounts
+            else:
+                grid[: len(amounts), special_index] = amounts
+        else:
+            if special_payment is None:
+                special_payment = self.input.annual_special_payment
+            grid[:, special_index] = special_payment
+        return grid
+
+    def _special_payment_periods(
+        self, periods: int, special_payment: float = None
+    ) -> np.ndarray:
+        """Special payment of every payment period (month or year) in €"""
+        per_year = self._periods_per_year()
+        grid = self._special_payment_grid(-(-periods // per_year), special_payment)
+        if per_year == 1:
+            return grid.sum(axis=1)[:periods]
+        return grid.ravel()[:periods]
+
+    def _variable_schedule(self, periods: int, special_payment: float = None) -> dict:
+        """Schedule arrays per payment period with per-period special payments.
+
+        Evaluated by the vectorized kernel annuity.schedule_arrays_variable;
+        used for FinancingInput.special_payments without a rounding mode.
+        """
+        per_year = self._periods_per_year()
+        payments = self.annual_payment / per_year + self._special_payment_periods(
+            periods, special_payment
+        )
+        return annuity.schedule_arrays_variable(
+            self.loan_amount, self.input.interest_rate / 100 / per_year, payments
+        )
+
+    def _exact_schedule(
+        self, periods: int, special_payment=None, principal: float = None
+    ) -> dict:
+        """Integer-cents schedule arrays per payment period (month or year).
+
+        Schedules of the loan itself are computed for at least 100 years and
+        kept per set of terms; shorter horizons are prefixes of them.
+
+        Args:
+            periods: Number of payment periods
+            special_payment: Constant annual special payment replacing the
+                input's special payments; with a principal, the special
+                payment of every period (array of length periods)
+            principal: Opening debt of an uncached schedule, e.g. for one
+                year of iter_schedule
+        """
+        per_year = self._periods_per_year()
+        if principal is None:
+            if special_payment is not None:
+                specials = special_payment
+            elif self._has_variable_special_payments():
+                specials = self.input.special_payments
+            else:
+                specials = self.input.annual_special_payment
+            terms = (
+                specials,
+                self.loan_amount,
+                self.annual_payment,
+                self.input.interest_rate,
+                self.input.special_payment_month,
+                self.input.resolution,
+                self.input.rounding,
+            )
+            with self._lock:
+                schedule = self._exact_schedules.get(terms)
+                if schedule is None or len(schedule["period"]) < periods:
+                    horizon = max(periods, 100 * per_year)
+                    schedule = self._exact_schedule(
+                        horizon,
+                        self._special_payment_periods(horizon, special_payment),
+                        self.loan_amount,
+                    )
+                    self._exact_schedules[terms] = schedule
+            return {key: values[:periods] for key, values in schedule.items()}
+
+        rounding = self.input.rounding
+        amounts, index = np.unique(special_payment, return_inverse=True)
+        special_cents = np.array(
+            [cents.to_cents(amount, rounding) for amount in amounts], dtype=np.int64
+        )
+        payments = cents.to_cents(self.annual_payment / per_year, rounding) + (
+            special_cents[index.ravel()]
+        )
+        return cents.schedule_cents(
+            cents.to_cents(principal, rounding),
+            cents.period_rate(self.input.interest_rate, per_year),
+            payments,
+            rounding,
+        )
+
+    def _monthly_schedule(self, months: int, special_payment: float = None) -> dict:
+        """Monthly schedule arrays for the given number of months"""
+        if self._is_exact():
+            arrays = cents.to_euros(self._exact_schedule(months, special_payment))
+            return {"month": arrays.pop("period"), **arrays}
+        if special_payment is None and self._has_variable_special_payments():
+            arrays = self._variable_schedule(months)
+            return {"month": arrays.pop("period"), **arrays}
+        if special_payment is None:
+            special_payment = self.input.annual_special_payment
+        return monthly.monthly_schedule_arrays(
+            self.loan_amount,
+            self.input.interest_rate / 100,
+            self.monthly_payment,
+            special_payment,
+            self.input.special_payment_month,
+            months,
+        )
+
+    def _schedule_kernel(self, years: int, special_payment: float = None) -> dict:
+        """Yearly schedule arrays from the configured amortization engine.
+
+        In monthly resolution the monthly schedule is rolled up into years;
+        otherwise the yearly annuity kernel is used directly.  With a rounding
+        mode the integer-cents kernel (cents.schedule_cents) is used instead,
+        and special payments that vary by year use the variable-payment
+        kernel (annuity.schedule_arrays_variable).
+        """
+        if self._is_exact():
+            # Yearly totals are summed in whole cents, then converted to euros
+            periods = self._exact_schedule(
+                years * self._periods_per_year(), special_payment
+            )
+            if self._is_monthly():
+                return cents.to_euros(
+                    monthly.yearly_rollup({"month": periods["period"], **periods})
+                )
+            return cents.to_euros(
+                {
+                    "year": periods["period"],
+                    "debt_start": periods["debt_start"],
+                    "interest": periods["interest"],
+                    "amortization": periods["amortization"],
+                    "debt_end": periods["debt_end"],
+                }
+            )
+        if self._is_monthly():
+            return monthly.yearly_rollup(
+                self._monthly_schedule(years * monthly.MONTHS_PER_YEAR, special_payment)
+            )
+        if special_payment is None and self._has_variable_special_payments():
+            arrays = self._variable_schedule(years)
+            return {
+                "year": arrays["period"],
+                "debt_start": arrays["debt_start"],
+                "interest": arrays["interest"],
+                "amortization": arrays["amortization"],
+                "debt_end": arrays["debt_end"],
+            }
+        if special_payment is None:
+            special_payment = self.input.annual_special_payment
+        return annuity.schedule_arrays(
+            self.loan_amount,
+            self.input.interest_rate / 100,
+            self.annual_payment + special_payment,
+            years,
+        )
+
+    def _monthly_payoff_months(
+        self, special_payment: float = None, max_years: int = 100
+    ) -> float:
+        """Fractional months until payoff in monthly resolution (inf if never)"""
+        months = max_years * monthly.MONTHS_PER_YEAR
+        if special_payment is None and self._has_variable_special_payments():
+            if self._is_exact():
+                return cents.payoff_periods_precise(self._exact_schedule(months))
+            return cents.payoff_periods_precise(self._variable_schedule(months))
+        if special_payment is None:
+            special_payment = self.input.annual_special_payment
+        schedule = self._monthly_schedule(months, special_payment)
+        return monthly.payoff_months_precise(
+            schedule,
+            self.monthly_payment,
+            special_payment,
+            self.input.special_payment_month,
+        )
+
+    def _kernel_payoff_years(
+        self, special_payment: float = None, max_years: int = 100
+    ) -> float:
+        """Fractional years until payoff from the schedule kernel (inf if never).
+
+        Used where the closed form does not apply: monthly resolution,
+        integer-cents arithmetic or special payments that vary by year.
+        """
+        if self._is_monthly():
+            months = self._monthly_payoff_months(special_payment, max_years)
+            return months / monthly.MONTHS_PER_YEAR
+        if self._is_exact():
+            schedule = self._exact_schedule(max_years, special_payment)
+        else:
+            schedule = self._variable_schedule(max_years, special_payment)
+        return cents.payoff_periods_precise(schedule)
+
+    def _kernel_payoff_year(
+        self, special_payment: float = None, max_years: int = 100
+    ) -> int:
+        """Whole payoff year from the schedule kernel, capped at max_years"""
+        years = self._kernel_payoff_years(special_payment, max_years)
+        if math.isinf(years):
+            return max_years
+        return int(min(max(1, math.ceil(years)), max_years))
 
     def _calculate_time_to_equity_percentage(
         self, target_percentage: float, max_years: int = 100
     ) -> float:
         """Calculate years until owning a certain percentage of the property.
 
+        Uses the closed-form annuity engine instead of a year-by-year loop;
+        other schedules use the milestone search of get_summary.
+
         Args:
             target_percentage: Target equity percentage (e.g., 50 for 50%)
             max_years: Maximum years to calculate (default 100)
@@ -60,41 +430,76 @@ class FinancingCalculator:
             Years as a float until target equity is reached, or max_years if not reached
         """
         target_equity = self.input.purchase_price * (target_percentage / 100)
-        current_equity = self.input.equity
-        remaining_debt = self.loan_amount
-        rate = self.input.interest_rate / 100
+        rate, payment = self._annuity_terms()
+
+        # Owning the target share means the debt has fallen to this level
+        debt_threshold = self.loan_amount + self.input.equity - target_equity
+        if not self._has_closed_form():
+            # Same search as get_summary and calculate_equity_milestones
+            index = self._get_payoff_index()
+            years = float(
+                kpis.equity_milestone_years(
+                    self.input.equity + index["cumulative_amortization"][1:],
+                    index["arrays"]["amortization"],
+                    target_equity,
+                )
+            )
+            if math.isnan(years):
+                years = index["payoff_years"]
+            return float(min(years, max_years))
+        if debt_threshold < 0:
+            # Target lies beyond full ownership: report the payoff year
+            year = annuity.payoff_year(self.loan_amount, rate, payment)
+            return float(min(year, max_years))
+
+        year = annuity.first_year_at_or_below(
+            self.loan_amount, rate, payment, debt_threshold
+        )
+        if year > max_years:
+            return float(max_years)
+
+        debt_before = annuity.remaining_debt(self.loan_amount, rate, payment, year - 1)
+        debt_end = annuity.remaining_debt(self.loan_amount, rate, payment, year)
+        equity_progress = debt_before - debt_end
+        if equity_progress > 0:
+            fraction = (debt_before - debt_threshold) / equity_progress
+            return (year - 1) + fraction
+        return float(year)
+
+    def _calculate_time_to_equity_percentage_iterative(
+        self, target_percentage: float, max_years: int = 100
+    ) -> float:
+        """Reference year-by-year version of _calculate_time_to_equity_percentage.
 
-        for year in range(1, max_years + 1):
-            # Interest for this year
-            interest = remaining_debt * rate
+        Calculate years until owning a certain percentage of the property.
+        Walks iter_schedule and stops at the first year reaching the target.
 
-            # Amortization = Annual payment - Interest + Special payment
-            amortization = (
-                self.annual_payment - interest + self.input.annual_special_payment
-            )
+        Args:
+            target_percentage: Target equity percentage (e.g., 50 for 50%)
+            max_years: Maximum years to calculate (default 100)
 
-            # Ensure we don't amortize more than remaining debt
-            if amortization > remaining_debt:
-                amortization = remaining_debt
+        Returns:
+            Years as a float until target equity is reached, or max_years if not reached
+        """
+        target_equity = self.input.purchase_price * (target_percentage / 100)
+        current_equity = self.input.equity
 
-            # Update current equity
-            current_equity += amortization
-            remaining_debt -= amortization
+        for entry in self.iter_schedule(max_years):
+            previous_equity = current_equity
+            current_equity += entry.amortization
 
             # Check if we've reached the target equity
             if current_equity >= target_equity:
                 # Return precise year including fraction
                 # Estimate the fraction within this year
-                previous_equity = current_equity - amortization
-                equity_progress = current_equity - previous_equity
-                if equity_progress > 0:
-                    fraction = (target_equity - previous_equity) / equity_progress
-                    return (year - 1) + fraction
-                return float(year)
+                if entry.amortization > 0:
+                    fraction = (target_equity - previous_equity) / entry.amortization
+                    return (entry.year - 1) + fraction
+                return float(entry.year)
 
             # If loan is paid off but haven't reached target
-            if remaining_debt <= 0:
-                return float(year)
+            if entry.debt_end <= 0:
+                return float(entry.year)
 
         return float(max_years)
 
@@ -120,60 +525,6 @@ class FinancingCalculator:
         # Return the difference
         return new_monthly_payment - current_payment
 
-    def _calculate_interest_savings(self) -> dict:
-        """Calculate interest savings from special payments.
-
-        Compares total interest with vs. without special payments.
-
-        Returns:
-            Dictionary with:
-            - interest_with_special: Total interest with special payments
-            - interest_without_special: Total interest without special payments
-            - interest_savings: Amount saved (without - with)
-            - time_saved_years: Years saved by making special payments
-        """
-        # If no special payments, no savings
-        if self.input.annual_special_payment == 0:
-            return {
-                "interest_with_special": 0,
-                "interest_without_special": 0,
-                "interest_savings": 0,
-                "time_saved_years": 0,
-            }
-
-        # Calculate scenario WITH special payments (current)
-        payoff_years_with = self.calculate_payoff_years()
-        schedule_with = self.calculate_schedule(payoff_years_with)
-        interest_with_special = sum(item.interest_payment for item in schedule_with)
-
-        # Calculate scenario WITHOUT special payments
-        # Create a temporary calculator with no special payments
-        input_no_special = FinancingInput(
-            purchase_price=self.input.purchase_price,
-            equity=self.input.equity,
-            interest_rate=self.input.interest_rate,
-            initial_amortization=self.input.initial_amortization,
-            annual_special_payment=0,  # No special payment
-            interest_binding_years=self.input.interest_binding_years,
-        )
-        calc_no_special = FinancingCalculator(input_no_special)
-        payoff_years_without = calc_no_special.calculate_payoff_years()
-        schedule_without = calc_no_special.calculate_schedule(payoff_years_without)
-        interest_without_special = sum(
-            item.interest_payment for item in schedule_without
-        )
-
-        # Calculate savings
-        interest_savings = interest_without_special - interest_with_special
-        time_saved_years = payoff_years_without - payoff_years_with
-
-        return {
-            "interest_with_special": interest_with_special,
-            "interest_without_special": interest_without_special,
-            "interest_savings": interest_savings,
-            "time_saved_years": time_saved_years,
-        }
-
     def _calculate_breakeven_point(self) -> dict:
         """Calculate the breakeven point where cumulative amortization exceeds cumulative interest.
 
@@ -186,13 +537,11 @@ class FinancingCalculator:
             - cumulative_amortization_at_breakeven: Total amortization at breakeven
             - cumulative_interest_at_breakeven: Total interest at breakeven
         """
-        payoff_years = self.calculate_payoff_years()
-        schedule = self.calculate_schedule(payoff_years)
-
         cumulative_amortization = 0
         cumulative_interest = 0
 
-        for entry in schedule:
+        # Stops at the breakeven year; only runs to payoff if never reached
+        for entry in self.iter_schedule():
             cumulative_amortization += entry.amortization
             cumulative_interest += entry.interest_payment
 
@@ -210,48 +559,307 @@ class FinancingCalculator:
             "cumulative_interest_at_breakeven": cumulative_interest,
         }
 
-    def _calculate_equity_buildup_rate(self) -> list:
-        """Calculate year-by-year equity buildup showing acceleration over time.
+    def _loan_terms(self) -> tuple:
+        """Everything the schedule depends on, to detect changed terms"""
+        return (
+            self.loan_amount,
+            self.annual_payment,
+            self.monthly_payment,
+            astuple(self.input),
+        )
+
+    def _kpi_values(self) -> dict:
+        """Horizon-independent KPI values (see kpis.py), kept per set of terms"""
+        terms = self._loan_terms()
+        with self._lock:
+            if self._kpi_cache.get("terms") != terms:
+                self._kpi_cache = {"terms": terms, "values": {}}
+            return self._kpi_cache["values"]
 
-        This shows how equity grows each year and helps visualize the accelerating
-        nature of amortization (more principal paid as interest decreases).
+    def _snapshot(self) -> "FinancingCalculator":
+        """Copy with the current terms, sharing the caches built for them.
+
+        Calculator changes (calculate_years_to_payoff) rebuild the caches of
+        the calculator under new terms and leave the copy unchanged.
+        """
+        with self._lock:
+            self._get_payoff_index()
+            self._kpi_values()
+            snapshot = copy.copy(self)
+            snapshot.input = replace(self.input)
+        return snapshot
+
+    def _get_payoff_index(self) -> dict:
+        """Payoff schedule with prefix sums, computed once per set of terms.
+
+        The index holds the schedule arrays up to the payoff year (capped at
+        100 years) and prefix sums of interest and amortization with a
+        leading zero, so totals for any horizon are array lookups.  It is
+        rebuilt when the loan terms change, e.g. after
+        calculate_years_to_payoff replaced the payment.
 
         Returns:
-            List of dictionaries with year, equity_gained, equity_percentage, and cumulative_equity
+            Dictionary with payoff_years, arrays, cumulative_interest and
+            cumulative_amortization
         """
+        terms = self._loan_terms()
+        with self._lock:
+            if self._payoff_index.get("terms") != terms:
+                self._build_payoff_index(terms)
+            return self._payoff_index
+
+    def _build_payoff_index(self, terms: tuple):
+        """Compute the payoff index for _get_payoff_index"""
         payoff_years = self.calculate_payoff_years()
-        schedule = self.calculate_schedule(payoff_years)
+        arrays = self._schedule_kernel(payoff_years)
+        cumulative_interest = np.cumsum(arrays["interest"])
+        cumulative_amortization = np.cumsum(arrays["amortization"])
+        if self._is_exact():
+            # Keep cent amounts exact despite the floating-point sums
+            cumulative_interest = np.round(cumulative_interest, 2)
+            cumulative_amortization = np.round(cumulative_amortization, 2)
+        self._payoff_index = {
+            "terms": terms,
+            "payoff_years": payoff_years,
+            "arrays": arrays,
+            "cumulative_interest": np.concatenate(([0.0], cumulative_interest)),
+            "cumulative_amortization": np.concatenate(
+                ([0.0], cumulative_amortization)
+            ),
+        }
 
-        equity_buildup = []
-        cumulative_equity = self.input.equity  # Start with initial equity
+    def _horizon_totals(self, years: int) -> tuple:
+        """Total interest, total amortization and remaining debt after years.
 
-        for entry in schedule:
-            # Equity gained in this year = amortization (principal repaid)
-            equity_gained = entry.amortization
-            cumulative_equity += equity_gained
+        Horizons within the payoff schedule, or beyond it once the loan is
+        repaid, are answered from the payoff index in O(1).  Only horizons
+        past the 100-year cap of a loan that is never repaid are computed
+        separately.
+        """
+        index = self._get_payoff_index()
+        payoff_years = index["payoff_years"]
+        debt_end = index["arrays"]["debt_end"]
+        repaid = payoff_years == 0 or debt_end[-1] <= 0
+        if years <= payoff_years or repaid:
+            years = max(min(years, payoff_years), 0)
+            return (
+                float(index["cumulative_interest"][years]),
+                float(index["cumulative_amortization"][years]),
+                float(debt_end[years - 1]) if years > 0 else self.loan_amount,
+            )
 
-            # Equity percentage = (cumulative equity / purchase price) × 100
-            equity_percentage = (
-                (cumulative_equity / self.input.purchase_price * 100)
-                if self.input.purchase_price > 0
-                else 0
+        if not self._has_closed_form():
+            arrays = self._schedule_kernel(years)
+            return (
+                float(arrays["interest"].sum()),
+                float(arrays["amortization"].sum()),
+                float(arrays["debt_end"][-1]),
             )
+        rate, payment = self._annuity_terms()
+        return (
+            annuity.cumulative_interest(self.loan_amount, rate, payment, years),
+            annuity.cumulative_amortization(self.loan_amount, rate, payment, years),
+            annuity.remaining_debt(self.loan_amount, rate, payment, years),
+        )
 
-            equity_buildup.append(
-                {
-                    "year": entry.year,
-                    "equity_gained": equity_gained,
-                    "equity_percentage": equity_percentage,
-                    "cumulative_equity": cumulative_equity,
-                }
+    def calculate_schedule(self, years: int) -> ScheduleTable:
+        """Generate amortization schedule for given number of years.
+
+        The schedule is produced by the vectorized kernel in
+        annuity.schedule_arrays (or, in monthly resolution, rolled up from
+        monthly.monthly_schedule_arrays; with FinancingInput.rounding set, by
+        the integer-cents kernel) and kept as columnar arrays in
+        self.schedule_arrays. self.schedule is a ScheduleTable sharing those
+        arrays; its rows expose the same attributes as YearlySchedule.
+        """
+        self.schedule_arrays = self._schedule_kernel(years)
+        self.schedule = ScheduleTable.from_arrays(
+            self.schedule_arrays, self.annual_payment
+        )
+        return self.schedule
+
+    def compute_schedule(self, years: int) -> ScheduleTable:
+        """Amortization schedule for the given number of years.
+
+        Same values as calculate_schedule, but the schedule is returned as a
+        read-only table and not stored on the calculator.
+        """
+        arrays = self._schedule_kernel(years)
+        return ScheduleTable.from_arrays(arrays, self.annual_payment).read_only()
+
+    def evaluate(self, years: int = None) -> FinancingResult:
+        """Schedule and summary as one immutable result.
+
+        Args:
+            years: Horizon of schedule and summary, defaults to the payoff
+                years
+
+        Returns:
+            FinancingResult with a read-only schedule and a read-only, lazily
+            evaluated summary (see get_summary)
+        """
+        payoff_years = self.calculate_payoff_years()
+        if years is None:
+            years = payoff_years
+        return FinancingResult(
+            input=replace(self.input),
+            annual_payment=self.annual_payment,
+            monthly_payment=self.monthly_payment,
+            payoff_years=payoff_years,
+            years=years,
+            schedule=self.compute_schedule(years),
+            summary=self.get_summary(years, read_only=True),
+        )
+
+    def calculate_schedule_with_rules(
+        self,
+        years: int,
+        interest_rates=None,
+        special_payments=None,
+        special_payment_limit: float = None,
+        payment_holidays=(),
+        backend: str = None,
+    ) -> ScheduleTable:
+        """Schedule with per-year rules that have no closed form.
+
+        The periods are computed by the recursive kernel
+        (kernels.amortization_schedule) on the selected backend; in monthly
+        resolution they are rolled up into years.  Unlike calculate_schedule
+        the result is not stored on the calculator, and the rounding mode is
+        ignored.
+
+        Args:
+            years: Number of years to generate
+            interest_rates: Annual interest rate (percent) of every year,
+                defaults to the input rate for all years
+            special_payments: Special payment of every year (€), defaults to
+                the input's special payments
+            special_payment_limit: Largest special payments per year in percent
+                of the loan amount (e.g. 5), None for no limit; larger ones
+                are scaled down
+            payment_holidays: Years (1-based) without any payment; their
+                interest is added to the debt
+            backend: Kernel backend, see kernels.set_backend
+
+        Returns:
+            ScheduleTable whose annual_payment is 0 in holiday years
+        """
+        years = max(int(years), 0)
+        if interest_rates is None:
+            interest_rates = self.input.interest_rate
+        yearly_rates = np.broadcast_to(np.asarray(interest_rates) / 100, (years,))
+        specials = self._special_payment_grid(years)
+        if special_payments is not None:
+            specials[:] = 0.0
+            specials[:, self.input.special_payment_month - 1] = np.broadcast_to(
+                np.asarray(special_payments, dtype=np.float64), (years,)
             )
+        if special_payment_limit is not None:
+            limit = self.loan_amount * special_payment_limit / 100
+            yearly_specials = specials.sum(axis=1, keepdims=True)
+            over = yearly_specials[:, 0] > limit
+            specials[over] *= limit / yearly_specials[over]
+        holiday_years = np.isin(np.arange(1, years + 1), list(payment_holidays))
+
+        if self._is_monthly():
+            periods_per_year = monthly.MONTHS_PER_YEAR
+            payment = self.monthly_payment
+        else:
+            periods_per_year = 1
+            payment = self.annual_payment
+            specials = specials.sum(axis=1)
+        periods = kernels.amortization_schedule(
+            self.loan_amount,
+            np.repeat(yearly_rates / periods_per_year, periods_per_year),
+            payment,
+            np.ravel(specials),
+            np.repeat(holiday_years, periods_per_year),
+            backend,
+        )
+
+        if self._is_monthly():
+            arrays = monthly.yearly_rollup({"month": periods["period"], **periods})
+        else:
+            arrays = {"year": periods["period"], **periods}
+        return ScheduleTable.from_arrays(
+            arrays, np.where(holiday_years, 0.0, self.annual_payment)
+        )
+
+    def iter_schedule(self, max_years: int = 100) -> Iterator[YearlySchedule]:
+        """Yield schedule entries year by year until payoff or max_years.
+
+        Each year is only computed when the consumer asks for it, so searches
+        over the schedule (breakeven, equity milestones, payoff) stop at the
+        first qualifying year instead of building the whole payoff schedule.
+        The final entry is the payoff year, i.e. the first with no debt left.
+        In monthly resolution every entry is the roll-up of twelve months;
+        with a rounding mode every year is computed in integer cents.
 
-        return equity_buildup
+        Args:
+            max_years: Maximum number of years to yield (default 100)
 
-    def calculate_schedule(self, years: int) -> List[YearlySchedule]:
-        """Generate amortization schedule for given number of years"""
-        self.schedule = []
+        Yields:
+            YearlySchedule entries starting with year 1
+        """
+        rate = self.input.interest_rate / 100
+        special_payment = self.input.annual_special_payment
+        per_year = self._periods_per_year()
+        special_periods = self._special_payment_periods(max_years * per_year)
+        debt = self.loan_amount
+
+        for year in range(1, max_years + 1):
+            year_specials = special_periods[(year - 1) * per_year:year * per_year]
+            if self._is_exact():
+                periods = self._exact_schedule(per_year, year_specials, principal=debt)
+                interest = int(periods["interest"].sum()) / 100
+                amortization = int(periods["amortization"].sum()) / 100
+                debt_end = int(periods["debt_end"][-1]) / 100
+            elif self._is_monthly():
+                if self._has_variable_special_payments():
+                    months = annuity.schedule_arrays_variable(
+                        debt,
+                        rate / monthly.MONTHS_PER_YEAR,
+                        self.monthly_payment + year_specials,
+                    )
+                else:
+                    months = monthly.monthly_schedule_arrays(
+                        debt,
+                        rate,
+                        self.monthly_payment,
+                        special_payment,
+                        self.input.special_payment_month,
+                        monthly.MONTHS_PER_YEAR,
+                    )
+                interest = float(months["interest"].sum())
+                amortization = float(months["amortization"].sum())
+                debt_end = debt - amortization
+            else:
+                interest = debt * rate
+                payment = self.annual_payment + float(year_specials[0])
+                amortization = min(payment - interest, debt)
+                debt_end = debt - amortization
+
+            yield YearlySchedule(
+                year=year,
+                debt_start=debt,
+                annual_payment=self.annual_payment,
+                interest_payment=interest,
+                amortization=amortization,
+                debt_end=debt_end,
+            )
+            if debt_end <= 0:
+                return
+            debt = debt_end
+
+    def calculate_schedule_iterative(self, years: int) -> List[YearlySchedule]:
+        """Reference year-by-year version of calculate_schedule.
+
+        Unlike calculate_schedule this does not store the result on the
+        calculator; it only returns the generated entries.
+        """
+        schedule = []
         remaining_debt = self.loan_amount
+        special_payments = self._special_payment_grid(years).sum(axis=1)
 
         for year in range(1, years + 1):
             debt_start = remaining_debt
@@ -262,7 +870,7 @@ class FinancingCalculator:
 
             # Amortization = Annual payment - Interest + Special payment
             amortization = (
-                self.annual_payment - interest + self.input.annual_special_payment
+                self.annual_payment - interest + float(special_payments[year - 1])
             )
 
             # Ensure we don't amortize more than remaining debt
@@ -280,122 +888,97 @@ class FinancingCalculator:
                 amortization=amortization,
                 debt_end=debt_end,
             )
-            self.schedule.append(schedule_entry)
+            schedule.append(schedule_entry)
             remaining_debt = debt_end
 
-        return self.schedule
-
-    def get_summary(self, years: int) -> dict:
-        """Get summary statistics for the financing"""
-        if not self.schedule:
-            self.calculate_schedule(years)
+        return schedule
 
-        if years > len(self.schedule):
-            self.calculate_schedule(years)
+    def get_summary(self, years: int, read_only: bool = False) -> Summary:
+        """Get summary statistics for the financing.
 
-        total_interest = sum(item.interest_payment for item in self.schedule[:years])
-        total_amortization = sum(item.amortization for item in self.schedule[:years])
-        remaining_debt = (
-            self.schedule[years - 1].debt_end if years <= len(self.schedule) else 0
+        The result is a Summary: a dict whose KPI groups are computed on
+        first access, so callers reading only a few keys do not pay for the
+        rest; with read_only it rejects changes and can be shared. The KPIs
+        and the intermediate results they share are declared in kpis.py.
+        The payoff schedule is computed once per calculator (see
+        _get_payoff_index); summaries for further horizons are lookups in
+        its prefix sums and do not recompute or replace self.schedule.
+        KPIs read later still describe the terms at the time of the call.
+        """
+        context = kpis.KpiContext(self._snapshot(), years)
+        # Horizon totals are read by nearly every caller and are lookups in
+        # the payoff index, so they are computed right away
+        context.evaluate(("totals",))
+        return Summary(
+            [
+                (node.keys, lambda name=name: context.evaluate((name,)))
+                for name, node in kpis.KPIS.items()
+            ],
+            read_only=read_only,
         )
 
-        # Calculate new KPIs
-        # 1. Total Cost of Ownership: Purchase price + total interest paid
-        total_cost_of_ownership = self.input.purchase_price + total_interest
+    def evaluate_kpis(self, names, years: int = None) -> dict:
+        """Evaluate selected KPIs and only what they depend on.
 
-        # 2. Interest-to-Principal Ratio: Total Interest / Total Amortization
-        interest_to_principal_ratio = (
-            (total_interest / total_amortization) if total_amortization > 0 else 0
-        )
+        Args:
+            names: KPI names registered in kpis.py (e.g. "totals",
+                "breakeven", "interest_savings")
+            years: Summary horizon, required by horizon-dependent KPIs
 
-        # 3. LTV Ratio (Loan-to-Value): (Loan Amount / Purchase Price) × 100
-        ltv_ratio = (
-            (self.loan_amount / self.input.purchase_price * 100)
-            if self.input.purchase_price > 0
-            else 0
-        )
+        Returns:
+            Dictionary with the summary keys of the requested KPIs
+        """
+        return kpis.KpiContext(self, years).evaluate(tuple(names))
 
-        # 4. Interest Savings from Special Payments
-        # Calculate scenario without special payments
-        interest_savings_data = self._calculate_interest_savings()
+    def calculate_equity_milestones(self, percentages=None) -> dict:
+        """Years until the equity reaches each share of the purchase price.
 
-        # Medium-priority KPIs
-        # 1. Breakeven Point: Year when cumulative amortization exceeds cumulative interest
-        breakeven_data = self._calculate_breakeven_point()
+        All milestones are read from the cumulative equity of the payoff
+        schedule with one binary search (see kpis.equity_milestone_years),
+        so they cost no simulation beyond the one shared with get_summary.
 
-        # 2. Equity Buildup Rate: Year-by-year equity progression
-        equity_buildup_data = self._calculate_equity_buildup_rate()
+        Args:
+            percentages: Target equity percentages, defaults to
+                kpis.EQUITY_MILESTONES (25, 50, 75 and 100%)
 
-        # Low-priority KPIs (nice-to-have)
-        # 1. Buffer Ratio: How many months of emergency fund needed
-        # Formula: (Monthly Payment × 6) / Current Equity
-        buffer_ratio = (
-            ((self.monthly_payment * 6) / self.input.equity)
-            if self.input.equity > 0
-            else 0
+        Returns:
+            Dictionary mapping each percentage to fractional years (0 if the
+            initial equity already reaches it), or None if it is not reached
+            within the payoff schedule
+        """
+        if percentages is None:
+            percentages = kpis.EQUITY_MILESTONES
+        context = kpis.KpiContext(self)
+        context.evaluate(("cumulative_equity",))
+        targets = np.asarray(percentages, dtype=np.float64) / 100
+        years = kpis.equity_milestone_years(
+            context["cumulative_equity"],
+            context["payoff_index"]["arrays"]["amortization"],
+            targets * self.input.purchase_price,
         )
-
-        # 2. Time to 50% Equity: Years until you own 50% of the property
-        time_to_50_equity = self._calculate_time_to_equity_percentage(50)
-
-        # 3. Rate Sensitivity Score: Payment increase if rates rise by 1%
-        rate_sensitivity_score = self._calculate_rate_sensitivity()
-
         return {
-            "purchase_price": self.input.purchase_price,
-            "equity": self.input.equity,
-            "loan_amount": self.loan_amount,
-            "annual_payment": self.annual_payment,
-            "monthly_payment": self.monthly_payment,
-            "interest_rate": self.input.interest_rate,
-            "initial_amortization": self.input.initial_amortization,
-            "total_interest": total_interest,
-            "total_amortization": total_amortization,
-            "remaining_debt": remaining_debt,
-            "years": years,
-            # High-Priority KPIs
-            "total_cost_of_ownership": total_cost_of_ownership,
-            "interest_to_principal_ratio": interest_to_principal_ratio,
-            "ltv_ratio": ltv_ratio,
-            "interest_savings": interest_savings_data["interest_savings"],
-            "interest_without_special": interest_savings_data["interest_without_special"],
-            "interest_with_special": interest_savings_data["interest_with_special"],
-            "time_saved_years": interest_savings_data["time_saved_years"],
-            # Medium-priority KPIs
-            "breakeven_year": breakeven_data["breakeven_year"],
-            "cumulative_amortization_at_breakeven": breakeven_data[
-                "cumulative_amortization_at_breakeven"
-            ],
-            "cumulative_interest_at_breakeven": breakeven_data[
-                "cumulative_interest_at_breakeven"
-            ],
-            "equity_buildup_rate": equity_buildup_data,
-            # Low-priority KPIs
-            "buffer_ratio": buffer_ratio,
-            "time_to_50_equity": time_to_50_equity,
-            "rate_sensitivity_score": rate_sensitivity_score,
+            percentage: None if math.isnan(value) else max(value, 0.0)
+            for percentage, value in zip(percentages, years.tolist())
         }
 
-    def schedule_to_dataframe(self) -> pd.DataFrame:
-        """Convert schedule to pandas DataFrame for display"""
+    def schedule_to_dataframe(self, column_names: dict = None) -> pd.DataFrame:
+        """Convert schedule to pandas DataFrame for display.
+
+        Args:
+            column_names: Labels by schedule column, defaults to the German
+                labels (SCHEDULE_DATAFRAME_COLUMNS)
+        """
         if not self.schedule:
             return pd.DataFrame()
-
-        data = {
-            "Jahr": [item.year for item in self.schedule],
-            "Restschuld Anfang (€)": [item.debt_start for item in self.schedule],
-            "Jahresrate (€)": [item.annual_payment for item in self.schedule],
-            "Zinsanteil (€)": [item.interest_payment for item in self.schedule],
-            "Tilgung (€)": [item.amortization for item in self.schedule],
-            "Restschuld Ende (€)": [item.debt_end for item in self.schedule],
-        }
-        return pd.DataFrame(data)
+        return self.schedule.to_dataframe(column_names or SCHEDULE_DATAFRAME_COLUMNS)
 
     def calculate_payoff_years(self, max_years: int = 100) -> int:
         """Calculate total years until the loan is fully paid back.
 
         This method returns a whole number of years, which is used for UI
-        elements like slider limits.
+        elements like slider limits. The result is derived analytically from
+        the annuity formula; see calculate_payoff_years_iterative for the
+        year-by-year reference.
 
         Args:
             max_years: Maximum years to calculate (default 100)
@@ -403,33 +986,60 @@ class FinancingCalculator:
         Returns:
             Number of years until loan is paid off, or max_years if not paid by then
         """
-        remaining_debt = self.loan_amount
-        rate = self.input.interest_rate / 100
+        if not self._has_closed_form():
+            return self._kernel_payoff_year(max_years=max_years)
 
-        for year in range(1, max_years + 1):
-            # Interest for this year
-            interest = remaining_debt * rate
+        rate, payment = self._annuity_terms()
+        year = annuity.payoff_year(self.loan_amount, rate, payment)
+        return int(min(year, max_years))
 
-            # Amortization = Annual payment - Interest + Special payment
-            amortization = (
-                self.annual_payment - interest + self.input.annual_special_payment
-            )
+    def calculate_payoff_years_precise(self, max_years: int = 100) -> float:
+        """Calculate payoff duration in years (including fractional year).
 
-            # Ensure we don't amortize more than remaining debt
-            if amortization > remaining_debt:
-                amortization = remaining_debt
+        This is useful to display a more accurate payoff time (years + months)
+        and avoid showing a remaining debt that is negative due to rounding to
+        whole years.
 
-            # New debt
-            remaining_debt -= amortization
+        Args:
+            max_years: Maximum years to calculate (default 100)
+
+        Returns:
+            Payoff years as a float, capped at max_years.
+        """
+        if not self._has_closed_form():
+            years = self._kernel_payoff_years(max_years=max_years)
+        else:
+            rate, payment = self._annuity_terms()
+            years = annuity.payoff_years_precise(self.loan_amount, rate, payment)
+        if years > max_years:
+            return float(max_years)
+        return float(years)
+
+    def calculate_payoff_years_iterative(self, max_years: int = 100) -> int:
+        """Reference year-by-year version of calculate_payoff_years.
+
+        Calculate total years until the loan is fully paid back.
+
+        This method returns a whole number of years, which is used for UI
+        elements like slider limits.
+
+        Args:
+            max_years: Maximum years to calculate (default 100)
 
+        Returns:
+            Number of years until loan is paid off, or max_years if not paid by then
+        """
+        for entry in self.iter_schedule(max_years):
             # Check if loan is paid off (essentially zero or negative debt)
-            if remaining_debt <= 0:
-                return year
+            if entry.debt_end <= 0:
+                return entry.year
 
         return max_years
 
-    def calculate_payoff_years_precise(self, max_years: int = 100) -> float:
-        """Calculate payoff duration in years (including fractional year).
+    def calculate_payoff_years_precise_iterative(self, max_years: int = 100) -> float:
+        """Reference year-by-year version of calculate_payoff_years_precise.
+
+        Calculate payoff duration in years (including fractional year).
 
         This is useful to display a more accurate payoff time (years + months)
         and avoid showing a remaining debt that is negative due to rounding to
@@ -443,6 +1053,7 @@ class FinancingCalculator:
         """
         remaining_debt = self.loan_amount
         rate = self.input.interest_rate / 100
+        special_payments = self._special_payment_grid(max_years).sum(axis=1)
 
         for year in range(1, max_years + 1):
             # Interest for this year
@@ -450,7 +1061,7 @@ class FinancingCalculator:
 
             # Amortization = Annual payment - Interest + Special payment
             amortization = (
-                self.annual_payment - interest + self.input.annual_special_payment
+                self.annual_payment - interest + float(special_payments[year - 1])
             )
 
             if amortization <= 0:
@@ -472,22 +1083,37 @@ class FinancingCalculator:
         """
         Calculate loan payoff with interest rate change after binding period.
 
+        This is the two-segment case of the rate path engine: the original
+        rate for interest_binding_years, then new_interest_rate. Both the
+        original and the changed path are evaluated in one vectorized call.
+        The comparison always uses yearly resolution, independent of
+        FinancingInput.resolution.
+
         Args:
             new_interest_rate: New interest rate (in percent) after binding period
             max_years: Maximum years to calculate
 
         Returns:
             Dictionary with comparison between original and changed scenarios
+
+        Raises:
+            ValueError: If FinancingInput.special_payments is set
         """
         binding_years = self.input.interest_binding_years
-
-        # Calculate original scenario to payoff
-        original_payoff_years = self.calculate_payoff_years(max_years)
-        original_schedule = self.calculate_schedule(original_payoff_years)
-        original_total_interest = sum(e.interest_payment for e in original_schedule)
-
-        # If rate doesn't change, return original values
-        if abs(new_interest_rate - self.input.interest_rate) < 0.01:
+        original_path = [(None, self.input.interest_rate)]
+        changed_path = [(None, new_interest_rate)]
+        if binding_years > 0:
+            changed_path.insert(0, (binding_years, self.input.interest_rate))
+        paths = self.compare_rate_paths([original_path, changed_path], max_years)
+        original, changed = paths.to_dict("records")
+        original_payoff_years = int(original["payoff_years"])
+        original_total_interest = float(original["total_interest"])
+
+        # Unchanged rate, or loan already paid off during the binding period
+        if (
+            abs(new_interest_rate - self.input.interest_rate) < 0.01
+            or binding_years >= original_payoff_years
+        ):
             return {
                 "original_payoff_years": original_payoff_years,
                 "new_payoff_years": original_payoff_years,
@@ -500,85 +1126,262 @@ class FinancingCalculator:
                 "binding_years": binding_years,
             }
 
-        # Get debt after binding period
-        if binding_years < len(original_schedule):
-            debt_at_change = original_schedule[binding_years - 1].debt_end
-        else:
-            debt_at_change = 0
+        total_payoff_years_with_change = int(changed["payoff_years"])
+        total_interest_with_change = float(changed["total_interest"])
+        interest_difference = total_interest_with_change - original_total_interest
+        years_difference = total_payoff_years_with_change - original_payoff_years
 
-        if debt_at_change <= 0:
-            # Already paid off during binding period
-            return {
-                "original_payoff_years": original_payoff_years,
-                "new_payoff_years": original_payoff_years,
-                "original_total_interest": original_total_interest,
-                "new_total_interest": original_total_interest,
-                "interest_difference": 0,
-                "years_difference": 0,
-                "new_interest_rate": new_interest_rate,
-                "original_interest_rate": self.input.interest_rate,
-                "binding_years": binding_years,
-            }
+        return {
+            "original_payoff_years": original_payoff_years,
+            "new_payoff_years": total_payoff_years_with_change,
+            "original_total_interest": original_total_interest,
+            "new_total_interest": total_interest_with_change,
+            "interest_difference": interest_difference,
+            "years_difference": years_difference,
+            "new_interest_rate": new_interest_rate,
+            "original_interest_rate": self.input.interest_rate,
+            "binding_years": binding_years,
+        }
+
+    def calculate_with_rate_path(self, segments: list, max_years: int = 100) -> dict:
+        """Calculate loan payoff along a piecewise interest rate path.
+
+        Args:
+            segments: Sequence of (years, interest rate in percent); the last
+                segment may have years=None and continues until payoff, e.g.
+                [(10, 3.5), (5, 4.2), (None, 5.0)]
+            max_years: Maximum years to calculate (default 100)
+
+        Returns:
+            Dictionary with payoff_years, total_interest and remaining_debt
+            (after max_years), see ratepath.evaluate_rate_paths
 
-        # Calculate new scenario with changed interest rate
-        new_rate = new_interest_rate / 100
-        original_rate = self.input.interest_rate / 100
+        Raises:
+            ValueError: If FinancingInput.special_payments is set
+        """
+        result = self.compare_rate_paths([segments], max_years).iloc[0]
+        return {
+            "payoff_years": int(result["payoff_years"]),
+            "total_interest": float(result["total_interest"]),
+            "remaining_debt": float(result["remaining_debt"]),
+        }
 
-        # Interest paid during binding period
-        interest_binding_period = sum(
-            e.interest_payment for e in original_schedule[:binding_years]
+    def compare_rate_paths(self, paths: list, max_years: int = 100) -> pd.DataFrame:
+        """Evaluate many candidate rate paths for this loan in one call.
+
+        The annual payment and special payment stay fixed; only the split
+        between interest and amortization follows the rate path.
+
+        Args:
+            paths: List of rate paths in the format of calculate_with_rate_path
+            max_years: Maximum years to calculate (default 100)
+
+        Returns:
+            DataFrame with one row per path, see ratepath.evaluate_rate_paths
+
+        Raises:
+            ValueError: If FinancingInput.special_payments is set
+        """
+        self._require_annual_special_payment()
+        _, payment = self._annuity_terms()
+        return ratepath.evaluate_rate_paths(
+            self.loan_amount, payment, paths, max_years
         )
 
-        # Recalculate from year binding_years+1 with new rate
-        # Keep the same annual payment as original - only the interest/principal split changes
-        remaining_debt = debt_at_change
-        annual_payment = self.annual_payment
+    def calculate_years_to_payoff(self, affordable_monthly_payment: float) -> dict:
+        """
+        Calculate how many years needed to pay off loan given an affordable monthly payment.
+        This is a reverse calculation for affordability analysis.
 
-        years_after_change = 0
-        interest_after_change = 0
+        Same result as payoff_for_payment; for a feasible payment the
+        calculator then keeps that payment for subsequent schedules.
 
-        for year in range(binding_years + 1, max_years + 1):
-            years_after_change += 1
+        Args:
+            affordable_monthly_payment: Maximum affordable monthly payment (€)
 
-            # Interest with new rate
-            interest = remaining_debt * new_rate
-            interest_after_change += interest
+        Returns:
+            Dictionary with payoff analysis including years needed and total interest
+        """
+        result = self.payoff_for_payment(affordable_monthly_payment)
+        if result["feasible"]:
+            # Persist the payment used for this payoff calculation so
+            # subsequent schedule generation uses the same payment.
+            self.annual_payment = result["annual_payment"]
+            self.monthly_payment = affordable_monthly_payment
+        return result
+
+    def payoff_for_payment(self, affordable_monthly_payment: float) -> dict:
+        """Payoff analysis for an affordable monthly payment.
+
+        Infeasible payments are detected up front and the payoff year and total
+        interest come from the closed-form annuity engine, so the analysis
+        always uses yearly resolution. The calculator is not changed; see
+        with_monthly_payment for schedules at that payment.
 
-            # Amortization = Annual payment - Interest + Special payment
-            amortization = annual_payment - interest + self.input.annual_special_payment
+        Args:
+            affordable_monthly_payment: Maximum affordable monthly payment (€)
 
-            if amortization <= 0:
-                # Payment insufficient to cover interest
-                break
+        Returns:
+            Dictionary as described for calculate_years_to_payoff
 
-            # Ensure we don't amortize more than remaining debt
-            if amortization > remaining_debt:
-                amortization = remaining_debt
+        Raises:
+            ValueError: If FinancingInput.special_payments is set
+        """
+        self._require_annual_special_payment()
+        if affordable_monthly_payment <= 0:
+            return {
+                "years_to_payoff": 0,
+                "total_interest": 0,
+                "remaining_debt": self.loan_amount,
+                "monthly_payment": 0,
+                "feasible": False,
+                "error_key": "error_payment_positive",
+            }
 
-            remaining_debt -= amortization
+        annual_payment = affordable_monthly_payment * 12
+        rate = self.input.interest_rate / 100
+        payment = annual_payment + self.input.annual_special_payment
+        max_years = 500  # Same horizon as the iterative reference
 
-            if remaining_debt <= 0:
-                break
+        if self.loan_amount <= 0:
+            years = 0
+            total_interest = 0
+        else:
+            if not annuity.is_feasible(self.loan_amount, rate, payment):
+                return {
+                    "years_to_payoff": None,
+                    "total_interest": None,
+                    "remaining_debt": self.loan_amount,
+                    "monthly_payment": affordable_monthly_payment,
+                    "feasible": False,
+                    "error_key": "error_payment_insufficient",
+                    "error_payment": affordable_monthly_payment,
+                }
 
-        total_payoff_years_with_change = binding_years + years_after_change
-        total_interest_with_change = interest_binding_period + interest_after_change
-        interest_difference = total_interest_with_change - original_total_interest
-        years_difference = total_payoff_years_with_change - original_payoff_years
+            # A residual debt below one euro counts as paid off
+            years = annuity.first_year_at_or_below(
+                self.loan_amount, rate, payment, math.nextafter(1.0, 0.0)
+            )
+            if years >= max_years:
+                return {
+                    "years_to_payoff": None,
+                    "total_interest": None,
+                    "remaining_debt": annuity.remaining_debt(
+                        self.loan_amount, rate, payment, max_years
+                    ),
+                    "monthly_payment": affordable_monthly_payment,
+                    "feasible": False,
+                    "error_key": "error_payoff_too_long",
+                }
+            total_interest = years * payment - (
+                self.loan_amount
+                - annuity.debt_after(self.loan_amount, rate, payment, years)
+            )
 
         return {
-            "original_payoff_years": original_payoff_years,
-            "new_payoff_years": total_payoff_years_with_change,
-            "original_total_interest": original_total_interest,
-            "new_total_interest": total_interest_with_change,
-            "interest_difference": interest_difference,
-            "years_difference": years_difference,
-            "new_interest_rate": new_interest_rate,
-            "original_interest_rate": self.input.interest_rate,
-            "binding_years": binding_years,
+            "years_to_payoff": years,
+            "total_interest": total_interest,
+            "remaining_debt": 0,
+            "monthly_payment": affordable_monthly_payment,
+            "annual_payment": annual_payment,
+            "feasible": True,
+            "loan_amount": self.loan_amount,
+            "interest_rate": self.input.interest_rate,
         }
 
-    def calculate_years_to_payoff(self, affordable_monthly_payment: float) -> dict:
+    def calculate_affordability_curve(
+        self, household_income: float, income_percentages
+    ) -> pd.DataFrame:
+        """
+        calculate_years_to_payoff for many shares of the household income at once.
+
+        The affordable monthly payment of every share is evaluated in one
+        broadcast call of the closed-form annuity engine, so the whole income
+        percentage slider range is precomputed and slider changes become
+        lookups.
+
+        Args:
+            household_income: Monthly household income (€)
+            income_percentages: Shares of the income spent on the loan (%)
+
+        Returns:
+            DataFrame indexed by income_percentage with the
+            calculate_years_to_payoff keys as columns: monthly_payment,
+            annual_payment, years_to_payoff (nullable Int64, <NA> if not
+            feasible), total_interest (NaN if not feasible), remaining_debt,
+            feasible and error_key (None if feasible)
+
+        Raises:
+            ValueError: If FinancingInput.special_payments is set
+        """
+        self._require_annual_special_payment()
+        income_percentages = np.atleast_1d(np.asarray(income_percentages))
+        monthly_payment = (household_income * income_percentages) / 100
+        annual_payment = monthly_payment * 12
+        rate = self.input.interest_rate / 100
+        payment = annual_payment + self.input.annual_special_payment
+        max_years = 500  # Same horizon as calculate_years_to_payoff
+
+        positive = monthly_payment > 0
+        if self.loan_amount <= 0:
+            years = np.zeros(monthly_payment.shape)
+            total_interest = np.zeros(monthly_payment.shape)
+            remaining_debt = np.zeros(monthly_payment.shape)
+            insufficient = too_long = np.zeros(monthly_payment.shape, dtype=bool)
+        else:
+            insufficient = positive & ~annuity.is_feasible_array(
+                self.loan_amount, rate, payment
+            )
+            # A residual debt below one euro counts as paid off
+            years = annuity.first_year_at_or_below_array(
+                self.loan_amount, rate, payment, math.nextafter(1.0, 0.0)
+            )
+            too_long = positive & ~insufficient & (years >= max_years)
+            years = np.where(positive, np.minimum(years, max_years), 0.0)
+            total_interest = np.where(
+                positive,
+                years * payment
+                - (
+                    self.loan_amount
+                    - annuity.debt_after_array(self.loan_amount, rate, payment, years)
+                ),
+                0.0,
+            )
+            remaining_debt = np.where(
+                too_long,
+                annuity.remaining_debt_array(
+                    self.loan_amount, rate, payment, max_years
+                ),
+                np.where(positive & ~insufficient, 0.0, self.loan_amount),
+            )
+
+        failed = insufficient | too_long
+        years_to_payoff = pd.array(years.astype(np.int64), dtype="Int64")
+        years_to_payoff[failed] = pd.NA
+        error_key = np.full(monthly_payment.shape, None, dtype=object)
+        error_key[~positive] = "error_payment_positive"
+        error_key[insufficient] = "error_payment_insufficient"
+        error_key[too_long] = "error_payoff_too_long"
+
+        return pd.DataFrame(
+            {
+                "monthly_payment": monthly_payment,
+                "annual_payment": annual_payment,
+                "years_to_payoff": years_to_payoff,
+                "total_interest": np.where(failed, np.nan, total_interest),
+                "remaining_debt": remaining_debt,
+                "feasible": positive & ~failed,
+                "error_key": error_key,
+            },
+            index=pd.Index(income_percentages, name="income_percentage"),
+        )
+
+    def calculate_years_to_payoff_iterative(
+        self, affordable_monthly_payment: float
+    ) -> dict:
         """
+        Reference year-by-year version of calculate_years_to_payoff.
+
         Calculate how many years needed to pay off loan given an affordable monthly payment.
         This is a reverse calculation for affordability analysis.
 
@@ -588,6 +1391,7 @@ class FinancingCalculator:
         Returns:
             Dictionary with payoff analysis including years needed and total interest
         """
+        self._require_annual_special_payment()
         if affordable_monthly_payment <= 0:
             return {
                 "years_to_payoff": 0,
@@ -658,11 +1462,6 @@ class FinancingCalculator:
                 "error_key": "error_payoff_too_long",
             }
 
-        # Persist the payment used for this payoff calculation so
-        # subsequent schedule generation uses the same payment.
-        self.annual_payment = annual_payment
-        self.monthly_payment = affordable_monthly_payment
-
         return {
             "years_to_payoff": years,
             "total_interest": total_interest,
@@ -4,10 +4,30 @@ Handles all Dash callbacks for user interactions and data updates
 """
 
 from dash import Input, Output, State, dcc, html
-from calculator import FinancingCalculator, FinancingInput
+from calculator import FinancingInput
+from cache import (
+    cached_affordability,
+    cached_affordability_curve,
+    cached_payoff_years,
+    cached_payoff_years_precise,
+    cached_rate_change,
+    cached_schedule,
+    cached_equity_milestones,
+    cached_schedule_dataframe,
+    cached_sensitivity_grid,
+    cached_summary,
+)
 from components import create_card, create_metric_box, create_table, create_metric_with_description
-from config import COLORS, DEFAULT_INTEREST_BINDING_YEARS
-from translations import get_text
+from config import (
+    CALCULATION_RESOLUTION,
+    CALCULATION_ROUNDING,
+    COLORS,
+    DEFAULT_INTEREST_BINDING_YEARS,
+    DEFAULT_SPECIAL_PAYMENT_MONTH,
+    INCOME_PERCENTAGE_MAX,
+    INCOME_PERCENTAGE_MIN,
+)
+from translations import get_schedule_columns, get_text
 from charts import (
     create_debt_development_chart,
     create_interest_vs_amortization_chart,
@@ -16,6 +36,8 @@ from charts import (
     create_cumulative_progress_chart,
     create_rate_change_comparison_chart,
     create_equity_buildup_chart,
+    create_affordability_curve_chart,
+    create_sensitivity_heatmap,
 )
 
 
@@ -348,9 +370,11 @@ def register_callbacks(app):
                 annual_special_payment=annual_special_payment or 0,
                 interest_binding_years=interest_binding_years
                 or DEFAULT_INTEREST_BINDING_YEARS,
+                special_payment_month=DEFAULT_SPECIAL_PAYMENT_MONTH,
+                resolution=CALCULATION_RESOLUTION,
+                rounding=CALCULATION_ROUNDING,
             )
-            calculator = FinancingCalculator(input_data)
-            payoff_years = calculator.calculate_payoff_years()
+            payoff_years = cached_payoff_years(input_data)
             return payoff_years, payoff_years, payoff_years
         except:
             return 50, 50, 50
@@ -367,6 +391,7 @@ def register_callbacks(app):
             Output("interest_development_chart", "figure"),
             Output("rate_change_comparison_chart", "figure"),
             Output("equity_buildup_chart", "figure"),
+            Output("sensitivity_heatmap_chart", "figure"),
         ],
         [
             Input("purchase_price", "value"),
@@ -410,33 +435,25 @@ def register_callbacks(app):
                 annual_special_payment=annual_special_payment or 0,
                 interest_binding_years=interest_binding_years
                 or DEFAULT_INTEREST_BINDING_YEARS,
+                special_payment_month=DEFAULT_SPECIAL_PAYMENT_MONTH,
+                resolution=CALCULATION_RESOLUTION,
+                rounding=CALCULATION_ROUNDING,
             )
 
-            # Perform calculations
-            calculator = FinancingCalculator(input_data)
+            # Perform calculations (served from the shared result cache)
             # determine how many years should be shown
             if years_to_show:
                 years = years_to_show
             elif payoff_years_store is not None:
                 years = payoff_years_store
             else:
-                years = calculator.calculate_payoff_years()
-
-            schedule = calculator.calculate_schedule(years)
-            summary = calculator.get_summary(years)
-            payoff_years = calculator.calculate_payoff_years()
-            payoff_years_precise = calculator.calculate_payoff_years_precise()
-            df = calculator.schedule_to_dataframe()
-
-            # Rename columns based on language
-            df.columns = [
-                t("table_year"),
-                t("table_beginning_debt"),
-                t("table_annual_rate"),
-                t("table_interest"),
-                t("table_amortization"),
-                t("table_ending_debt"),
-            ]
+                years = cached_payoff_years(input_data)
+
+            summary = cached_summary(input_data, years)
+            payoff_years_precise = cached_payoff_years_precise(input_data)
+            df = cached_schedule_dataframe(
+                input_data, years, get_schedule_columns(lang)
+            )
 
             # Create summary cards
             summary_cards = build_summary_cards(
@@ -446,9 +463,7 @@ def register_callbacks(app):
             # Add rate change comparison cards if enabled
             rate_change_result = None
             if len(enable_rate_change) > 0 and new_interest_rate is not None:
-                rate_change_result = calculator.calculate_with_rate_change(
-                    new_interest_rate
-                )
+                rate_change_result = cached_rate_change(input_data, new_interest_rate)
 
                 summary_cards.extend(
                     [
@@ -629,7 +644,14 @@ def register_callbacks(app):
 
             # Create equity buildup chart
             equity_buildup_fig = create_equity_buildup_chart(
-                summary.get("equity_buildup_rate", []), t
+                summary.get("equity_buildup_rate", []),
+                t,
+                cached_equity_milestones(input_data),
+            )
+
+            # Create sensitivity heatmap over interest rate × amortization
+            sensitivity_fig = create_sensitivity_heatmap(
+                cached_sensitivity_grid(input_data), t
             )
 
             return (
@@ -643,6 +665,7 @@ def register_callbacks(app):
                 interest_dev_fig,
                 rate_change_fig,
                 equity_buildup_fig,
+                sensitivity_fig,
             )
 
         except Exception as e:
@@ -652,7 +675,9 @@ def register_callbacks(app):
                 f"{error_msg}: {str(e)}",
                 style={"color": "red", "padding": "1rem"},
             )
-            return [error_div], [error_div], error_div, {}, {}, {}, {}, {}, {}, {}
+            return (
+                [error_div], [error_div], error_div, {}, {}, {}, {}, {}, {}, {}, {}
+            )
 
     @app.callback(
         Output("download_csv", "data"),
@@ -691,24 +716,12 @@ def register_callbacks(app):
             annual_special_payment=annual_special_payment or 0,
             interest_binding_years=interest_binding_years
             or DEFAULT_INTEREST_BINDING_YEARS,
+            special_payment_month=DEFAULT_SPECIAL_PAYMENT_MONTH,
+            resolution=CALCULATION_RESOLUTION,
+            rounding=CALCULATION_ROUNDING,
         )
-        calculator = FinancingCalculator(input_data)
-        years = (
-            years_to_show or payoff_years_store or calculator.calculate_payoff_years()
-        )
-        calculator.calculate_schedule(years)
-        df = calculator.schedule_to_dataframe()
-
-        # Rename columns based on language
-        t = lambda key: get_text(lang, key)
-        df.columns = [
-            t("table_year"),
-            t("table_beginning_debt"),
-            t("table_annual_rate"),
-            t("table_interest"),
-            t("table_amortization"),
-            t("table_ending_debt"),
-        ]
+        years = years_to_show or payoff_years_store or cached_payoff_years(input_data)
+        df = cached_schedule_dataframe(input_data, years, get_schedule_columns(lang))
 
         filename = get_text(lang, "export_csv_filename")
         return dcc.send_data_frame(df.to_csv, filename)
@@ -750,27 +763,17 @@ def register_callbacks(app):
             annual_special_payment=annual_special_payment or 0,
             interest_binding_years=interest_binding_years
             or DEFAULT_INTEREST_BINDING_YEARS,
+            special_payment_month=DEFAULT_SPECIAL_PAYMENT_MONTH,
+            resolution=CALCULATION_RESOLUTION,
+            rounding=CALCULATION_ROUNDING,
         )
-        calculator = FinancingCalculator(input_data)
-        years = (
-            years_to_show or payoff_years_store or calculator.calculate_payoff_years()
-        )
-        schedule = calculator.calculate_schedule(years)
-        summary = calculator.get_summary(years)
+        years = years_to_show or payoff_years_store or cached_payoff_years(input_data)
+        schedule = cached_schedule(input_data, years)
+        summary = cached_summary(input_data, years)
 
         data = {
             "summary": summary,
-            "schedule": [
-                {
-                    "year": s.year,
-                    "debt_start": s.debt_start,
-                    "annual_payment": s.annual_payment,
-                    "interest_payment": s.interest_payment,
-                    "amortization": s.amortization,
-                    "debt_end": s.debt_end,
-                }
-                for s in schedule
-            ],
+            "schedule": schedule.to_records(),
         }
 
         filename = get_text(lang, "export_json_filename")
@@ -816,7 +819,11 @@ def register_callbacks(app):
                 )
             )
 
-        if not income_percentage or income_percentage < 5 or income_percentage > 40:
+        if (
+            not income_percentage
+            or income_percentage < INCOME_PERCENTAGE_MIN
+            or income_percentage > INCOME_PERCENTAGE_MAX
+        ):
             return html.Div(
                 html.P(
                     t("error_calculation"),
@@ -841,7 +848,7 @@ def register_callbacks(app):
         # Calculate affordable monthly payment
         affordable_monthly_payment = (household_income * income_percentage) / 100
 
-        # Create calculator and calculate payoff
+        # Look up the payoff in the cached curve for the whole slider range
         try:
             input_data = FinancingInput(
                 purchase_price=purchase_price,
@@ -850,10 +857,12 @@ def register_callbacks(app):
                 initial_amortization=initial_amortization,
                 annual_special_payment=annual_special_payment or 0,
                 interest_binding_years=interest_binding or 10,
+                special_payment_month=DEFAULT_SPECIAL_PAYMENT_MONTH,
+                resolution=CALCULATION_RESOLUTION,
+                rounding=CALCULATION_ROUNDING,
             )
-            calculator = FinancingCalculator(input_data)
-            affordability = calculator.calculate_years_to_payoff(
-                affordable_monthly_payment
+            affordability = cached_affordability(
+                input_data, household_income, income_percentage
             )
 
             # Build result display
@@ -957,7 +966,7 @@ def register_callbacks(app):
                     create_metric_box(
                         t("payoff_summary"),
                         {
-                            t("loan_amount"): f"€{calculator.loan_amount:,.2f}",
+                            t("loan_amount"): f"€{affordability['loan_amount']:,.2f}",
                             t(
                                 "monthly_payment_affordable"
                             ): f"€{affordable_monthly_payment:,.2f}",
@@ -972,12 +981,20 @@ def register_callbacks(app):
                             ): f"€{affordability['total_interest']:,.2f}",
                             t(
                                 "interest_rate_label"
-                            ): f"{calculator.input.interest_rate}%",
+                            ): f"{input_data.interest_rate}%",
                             t(
                                 "final_remaining_debt"
                             ): f"€{max(0, affordability['remaining_debt']):,.2f}",
                         },
                     ),
+                    dcc.Graph(
+                        figure=create_affordability_curve_chart(
+                            cached_affordability_curve(input_data, household_income),
+                            t,
+                            income_percentage,
+                        ),
+                        style={"marginTop": "2rem"},
+                    ),
                 ]
             )
 
@@ -0,0 +1,197 @@
+"""
+Integer-Cents Amortization Engine
+Bank-exact schedules with interest rounded to whole cents every period
+
+Banks keep loan accounts in whole cents: each period's interest is rounded
+to the cent (round half up or round half to even) before the payment is
+applied, so their Tilgungsplan drifts by cents from a binary floating-point
+schedule.  This module reproduces that arithmetic with int64 cents.
+
+The recursion is
+
+    interest_k = round(debt_{k-1} * rate)
+    debt_k     = debt_{k-1} - (payment_k - interest_k)
+
+Given the interest of every period, all balances follow from one cumulative
+sum, and given the balances all interest amounts follow from one rounded
+division.  The kernel alternates the two vectorized steps, starting from
+the floating-point closed form, until the interest no longer changes.  The
+fixed point is the exact schedule; each pass fixes at least one more
+period, and in practice a handful of passes suffice.
+
+The interest rate is taken as an exact decimal with RATE_DECIMALS places of
+the percentage, so ``rate = numerator / denominator`` with integers.
+"""
+
+from decimal import ROUND_HALF_EVEN as DECIMAL_HALF_EVEN
+from decimal import ROUND_HALF_UP as DECIMAL_HALF_UP
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+
+ROUND_HALF_UP = "half_up"
+ROUND_HALF_EVEN = "half_even"
+ROUNDING_MODES = (ROUND_HALF_UP, ROUND_HALF_EVEN)
+
+# Decimal places of the interest rate in percent (e.g. 3.875 %)
+RATE_DECIMALS = 6
+
+_DECIMAL_ROUNDING = {
+    ROUND_HALF_UP: DECIMAL_HALF_UP,
+    ROUND_HALF_EVEN: DECIMAL_HALF_EVEN,
+}
+
+# Largest intermediate product debt * numerator the int64 kernel allows
+_MAX_PRODUCT = 2**62
+
+
+def _check_rounding(rounding: str):
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Unknown rounding mode: {rounding}")
+
+
+def to_cents(amount: float, rounding: str = ROUND_HALF_UP) -> int:
+    """Convert a euro amount to whole cents.
+
+    The amount is read as the decimal number it was entered as (its
+    shortest repr), so 1234.565 becomes 123457 cents with round half up.
+    """
+    _check_rounding(rounding)
+    cents = Decimal(repr(float(amount))) * 100
+    return int(cents.quantize(Decimal(1), rounding=_DECIMAL_ROUNDING[rounding]))
+
+
+@lru_cache(maxsize=256)
+def period_rate(interest_rate: float, periods_per_year: int = 1) -> tuple:
+    """Exact interest rate per period as (numerator, denominator).
+
+    Args:
+        interest_rate: Nominal annual interest rate in percent
+        periods_per_year: 1 for yearly, 12 for monthly interest
+
+    Returns:
+        Tuple of ints with rate = numerator / denominator
+    """
+    percent = Decimal(repr(float(interest_rate))).quantize(
+        Decimal(1).scaleb(-RATE_DECIMALS), rounding=DECIMAL_HALF_UP
+    )
+    rate = Fraction(percent) / 100 / periods_per_year
+    return rate.numerator, rate.denominator
+
+
+def divide_rounded(dividend, divisor: int, rounding: str = ROUND_HALF_UP):
+    """Vectorized integer division rounded to the nearest integer.
+
+    Args:
+        dividend: Non-negative int64 array (or int)
+        divisor: Positive int
+        rounding: ROUND_HALF_UP or ROUND_HALF_EVEN for exact halves
+
+    Returns:
+        int64 array of rounded quotients
+    """
+    _check_rounding(rounding)
+    quotient, remainder = np.divmod(np.asarray(dividend, dtype=np.int64), divisor)
+    twice = 2 * remainder
+    if rounding == ROUND_HALF_UP:
+        round_up = twice >= divisor
+    else:
+        round_up = (twice > divisor) | ((twice == divisor) & (quotient % 2 == 1))
+    return quotient + round_up
+
+
+def schedule_cents(
+    principal: int, rate: tuple, payments, rounding: str = ROUND_HALF_UP
+) -> dict:
+    """Exact amortization schedule in integer cents.
+
+    Args:
+        principal: Loan amount at the start (cents)
+        rate: Interest rate per period as (numerator, denominator)
+        payments: Total payment of every period including special payments
+            (cents, int64 array); its length is the number of periods
+        rounding: Rounding of the interest of every period
+
+    Returns:
+        Dictionary of int64 arrays of length ``len(payments)``: ``period``
+        (1-based), ``debt_start``, ``payment``, ``interest``,
+        ``amortization`` and ``debt_end``. The final amortization is capped
+        at the outstanding debt and balances stay at zero afterwards.
+    """
+    _check_rounding(rounding)
+    numerator, denominator = rate
+    payments = np.asarray(payments, dtype=np.int64)
+    periods = len(payments)
+    if principal * numerator >= _MAX_PRODUCT:
+        raise ValueError("Loan amount is too large for the integer-cents kernel")
+
+    def balances(interest):
+        # Opening balance of every period, zero once the loan is repaid
+        debt_start = np.empty(periods, dtype=np.int64)
+        if periods:
+            debt_start[0] = principal
+            debt_start[1:] = principal - np.cumsum(payments - interest)[:-1]
+        return np.maximum(debt_start, 0, out=debt_start)
+
+    def rounded_interest(debt_start):
+        if debt_start.size and int(debt_start.max()) * numerator >= _MAX_PRODUCT:
+            raise ValueError("Debt grows too large for the integer-cents kernel")
+        return divide_rounded(debt_start * numerator, denominator, rounding)
+
+    # Start from the floating-point closed form of the same recursion:
+    # debt_k = g^k * (D0 - sum_{i<=k} payment_i / g^i)
+    growth = 1 + numerator / denominator
+    powers = growth ** np.arange(periods)
+    discounted = np.cumsum(payments[:-1] / powers[1:]) if periods > 1 else []
+    guess = powers * (principal - np.concatenate(([0.0], discounted)))
+    interest = rounded_interest(np.rint(np.maximum(guess, 0.0)).astype(np.int64))
+
+    # Each pass makes at least one more period exact
+    for _ in range(periods + 1):
+        debt_start = balances(interest)
+        updated = rounded_interest(debt_start)
+        if np.array_equal(updated, interest):
+            break
+        interest = updated
+
+    amortization = np.minimum(payments - interest, debt_start)
+    return {
+        "period": np.arange(1, periods + 1, dtype=np.int64),
+        "debt_start": debt_start,
+        "payment": payments,
+        "interest": interest,
+        "amortization": amortization,
+        "debt_end": debt_start - amortization,
+    }
+
+
+def payoff_periods_precise(schedule: dict) -> float:
+    """Fractional number of periods until a cents schedule is repaid.
+
+    The fraction of the final period is the share of that period's full
+    amortization needed to clear the remaining debt.  Works the same for
+    float schedules with a ``payment`` column, such as those of
+    annuity.schedule_arrays_variable.
+
+    Returns:
+        Periods as a float, or ``inf`` if the debt is not repaid within the
+        schedule.
+    """
+    paid = schedule["debt_end"] <= 0
+    if not paid.any():
+        return np.inf
+    index = int(paid.argmax())
+    full_amortization = schedule["payment"][index] - schedule["interest"][index]
+    if full_amortization <= 0:
+        return float(index + 1)
+    return index + float(schedule["debt_start"][index] / full_amortization)
+
+
+def to_euros(schedule: dict) -> dict:
+    """Convert the money columns of a cents schedule to float euros"""
+    return {
+        key: values if key in ("period", "month", "year") else values / 100
+        for key, values in schedule.items()
+    }
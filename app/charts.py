@@ -3,6 +3,7 @@ Chart Generation for Financing Calculator
 Creates all Plotly figures for financial visualizations
 """
 
+import pandas as pd
 import plotly.graph_objects as go
 from config import COLORS, CHART_HEIGHT
 
@@ -282,12 +283,15 @@ def create_rate_change_comparison_chart(rate_change_result, binding_years, lang_
     
     return fig
 
-def create_equity_buildup_chart(equity_buildup_data, lang_text_func):
+def create_equity_buildup_chart(equity_buildup_data, lang_text_func, milestones=None):
     """Create chart showing year-by-year equity buildup progression.
 
     Args:
         equity_buildup_data: List of dictionaries with equity buildup information
         lang_text_func: Translation function
+        milestones: Optional mapping of equity percentage to fractional years
+            (see FinancingCalculator.calculate_equity_milestones); each
+            reached milestone is marked on the equity percentage line
 
     Returns:
         Plotly figure showing equity buildup over time
@@ -335,6 +339,29 @@ def create_equity_buildup_chart(equity_buildup_data, lang_text_func):
         )
     )
 
+    # Mark the equity milestones on the percentage line
+    reached = [
+        (percentage, years)
+        for percentage, years in (milestones or {}).items()
+        if years is not None and years > 0
+    ]
+    if reached:
+        fig.add_trace(
+            go.Scatter(
+                x=[years for _, years in reached],
+                y=[percentage for percentage, _ in reached],
+                name=t("equity_milestones"),
+                mode="markers+text",
+                text=[
+                    f"{percentage:g}%: {years:.1f} {t('years_short')}"
+                    for percentage, years in reached
+                ],
+                textposition="top left",
+                marker=dict(color=COLORS["warning"], size=12, symbol="diamond"),
+                yaxis="y2",
+            )
+        )
+
     # Update layout with dual y-axes
     fig.update_layout(
         title=t("equity_buildup_progression"),
@@ -363,3 +390,111 @@ def create_equity_buildup_chart(equity_buildup_data, lang_text_func):
     )
 
     return fig
+
+
+def create_sensitivity_heatmap(grid, lang_text_func, metric="total_interest"):
+    """Create heatmap of a KPI over interest rate × initial amortization.
+
+    Args:
+        grid: Result of batch.evaluate_sensitivity_grid
+        lang_text_func: Translation function
+        metric: Grid KPI to show ("total_interest" or "payoff_years")
+
+    Returns:
+        Plotly figure with interest rates on the y-axis and initial
+        amortization on the x-axis
+    """
+    t = lang_text_func
+    labels = {
+        "total_interest": t("total_interest"),
+        "payoff_years": t("years_to_payoff"),
+    }
+    fig = go.Figure(
+        data=go.Heatmap(
+            x=grid["initial_amortization"],
+            y=grid["interest_rate"],
+            z=grid[metric],
+            colorscale="RdYlGn_r",
+            colorbar=dict(title=labels.get(metric, metric)),
+            hovertemplate=(
+                f"{t('initial_amortization')}: %{{x:.2f}}<br>"
+                f"{t('interest_rate')}: %{{y:.2f}}<br>"
+                f"{labels.get(metric, metric)}: %{{z:,.0f}}<extra></extra>"
+            ),
+        )
+    )
+    fig.update_layout(
+        title=t("sensitivity_heatmap"),
+        xaxis_title=t("initial_amortization"),
+        yaxis_title=t("interest_rate"),
+        template="plotly_white",
+        height=CHART_HEIGHT,
+    )
+    return fig
+
+
+def create_affordability_curve_chart(curve, lang_text_func, selected_percentage=None):
+    """Create chart of years to payoff and total interest by income share.
+
+    Args:
+        curve: Result of FinancingCalculator.calculate_affordability_curve
+        lang_text_func: Translation function
+        selected_percentage: Income percentage to highlight (optional)
+
+    Returns:
+        Plotly figure with years to payoff (left axis) and total interest
+        (right axis); infeasible shares are left as gaps
+    """
+    t = lang_text_func
+    percentages = list(curve.index)
+    years = [
+        None if pd.isna(value) else int(value) for value in curve["years_to_payoff"]
+    ]
+    interest = [
+        None if pd.isna(value) else float(value) for value in curve["total_interest"]
+    ]
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scatter(
+            x=percentages,
+            y=years,
+            name=t("years_to_payoff"),
+            mode="lines+markers",
+            line=dict(color=COLORS["primary"], width=3),
+            marker=dict(size=6),
+            yaxis="y",
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=percentages,
+            y=interest,
+            name=t("total_interest_by_payoff"),
+            mode="lines",
+            line=dict(color=COLORS["danger"], width=2, dash="dash"),
+            yaxis="y2",
+        )
+    )
+    if selected_percentage is not None:
+        fig.add_vline(
+            x=selected_percentage,
+            line_dash="dot",
+            line_color=COLORS["gray"],
+        )
+
+    fig.update_layout(
+        title=t("affordability_curve"),
+        xaxis_title=t("income_percentage"),
+        yaxis=dict(title=t("years_to_payoff"), side="left"),
+        yaxis2=dict(
+            title=t("total_interest_by_payoff") + " (€)",
+            side="right",
+            overlaying="y",
+        ),
+        hovermode="x unified",
+        template="plotly_white",
+        height=CHART_HEIGHT,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    )
+    return fig
@@ -71,6 +71,36 @@ DEFAULT_INITIAL_AMORTIZATION = _env_float(
 DEFAULT_INTEREST_BINDING_YEARS = _env_int("DEFAULT_INTEREST_BINDING_YEARS", 10)
 DEFAULT_ANNUAL_SPECIAL_PAYMENT = _env_float("DEFAULT_ANNUAL_SPECIAL_PAYMENT", 0.0)
 DEFAULT_HOUSEHOLD_INCOME = _env_float("DEFAULT_HOUSEHOLD_INCOME", 6000)
+DEFAULT_SPECIAL_PAYMENT_MONTH = _env_int("DEFAULT_SPECIAL_PAYMENT_MONTH", 12)
+
+# Range of the income percentage slider (share of household income spent
+# on the loan); the affordability curve is precomputed for every step
+INCOME_PERCENTAGE_MIN = 5
+INCOME_PERCENTAGE_MAX = 40
+
+# Axes of the sensitivity heatmap (percent): interest rates up to
+# SENSITIVITY_RATE_SPAN points either side of the input rate, in steps of
+# SENSITIVITY_RATE_STEP, against the listed initial amortization rates
+SENSITIVITY_RATE_SPAN = 2.0
+SENSITIVITY_RATE_STEP = 0.25
+SENSITIVITY_AMORTIZATIONS = (1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 5.0)
+
+# Amortization resolution: "yearly" (one payment per year) or "monthly"
+# (monthly payments and interest, rolled up into the yearly schedule)
+CALCULATION_RESOLUTION = os.getenv("CALCULATION_RESOLUTION", "yearly")
+
+# Interest rounding: unset for binary floating point, or "half_up" /
+# "half_even" for bank-exact integer-cents schedules (see cents.py)
+CALCULATION_ROUNDING = os.getenv("CALCULATION_ROUNDING") or None
+
+# Backend of the recursive amortization kernels (see kernels.py): "auto"
+# uses numba when it is installed, "python" forces the pure-Python loops
+KERNEL_BACKEND = os.getenv("KERNEL_BACKEND", "auto")
+
+# Result cache limits (see cache.py).  Entries are evicted least recently
+# used first once either limit is exceeded.
+CACHE_MAX_ENTRIES = _env_int("CACHE_MAX_ENTRIES", 256)
+CACHE_MAX_BYTES = _env_int("CACHE_MAX_BYTES", 32 * 1024 * 1024)
 
 # Font settings
 PRIMARY_FONT = "-apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif"
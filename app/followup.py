@@ -0,0 +1,289 @@
+"""
+Follow-Up Financing Offers
+Ranking of follow-up offers (Anschlussfinanzierung) at the end of the
+interest binding period
+
+When the interest binding period ends, the remaining debt is refinanced with
+one of several offers that differ in interest rate, new binding period and
+initial amortization.  Every offer sets a new annual payment of
+debt × (rate + amortization) on the remaining debt; the annual special
+payment carries over.  After the new binding period the offer's rate is
+assumed to continue unless a follow-up rate is given.
+
+All offers start from the same debt, taken once from the calculator's
+schedule of the binding period (so resolution, rounding and special payments
+of the input apply there).  The follow-up years of all offers form one
+yearly rate matrix that runs through the vectorized kernel
+(ratepath.evaluate_rate_matrix); large grids are split into chunks and
+spread across a ProcessPoolExecutor.  The scored offers are ranked by total
+interest, payoff year and payment shock (the change of the monthly payment).
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence
+import os
+
+import numpy as np
+import pandas as pd
+
+import ratepath
+from calculator import FinancingCalculator, FinancingInput
+
+OFFER_COLUMNS = ("interest_rate", "binding_years", "initial_amortization")
+
+# Offers scored per task; also the threshold below which no pool is used
+DEFAULT_CHUNK_SIZE = 2000
+
+# Ranking criteria, compared in this order
+RANKING = ("total_interest", "payoff_years", "payment_shock")
+
+
+def offer_grid(
+    interest_rates: Sequence[float],
+    binding_years: Sequence[int],
+    initial_amortizations: Sequence[float],
+) -> pd.DataFrame:
+    """All combinations of offer terms.
+
+    Args:
+        interest_rates: Interest rates in percent
+        binding_years: New interest binding periods in years
+        initial_amortizations: Initial amortization rates in percent
+
+    Returns:
+        DataFrame with one row per combination and the columns
+        interest_rate, binding_years and initial_amortization
+    """
+    rates, years, amortizations = np.meshgrid(
+        np.asarray(interest_rates, dtype=np.float64),
+        np.asarray(binding_years, dtype=np.int64),
+        np.asarray(initial_amortizations, dtype=np.float64),
+        indexing="ij",
+    )
+    return pd.DataFrame(
+        {
+            "interest_rate": rates.ravel(),
+            "binding_years": years.ravel(),
+            "initial_amortization": amortizations.ravel(),
+        }
+    )
+
+
+def _score_chunk(task: tuple) -> dict:
+    """Score one chunk of offers (runs in a worker process)"""
+    principal, payment, rates = task
+    return ratepath.evaluate_rate_matrix(principal, payment, rates)
+
+
+def evaluate_offers(
+    input_data: FinancingInput,
+    offers: pd.DataFrame,
+    follow_up_rate: float = None,
+    max_years: int = 100,
+    workers: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> pd.DataFrame:
+    """Score follow-up offers from the debt at the end of the binding period.
+
+    The binding period follows the input's schedule; the follow-up years use
+    yearly resolution, like calculate_with_rate_change.
+
+    Args:
+        input_data: Financing input
+        offers: DataFrame with the columns interest_rate (percent),
+            binding_years and initial_amortization (percent), e.g. from
+            offer_grid; further columns are kept
+        follow_up_rate: Rate after the new binding period (percent),
+            defaults to the rate of each offer
+        max_years: Horizon counted from the start of the loan (default 100)
+        workers: Worker processes; defaults to the CPU count. Grids of a
+            single chunk, or workers=1, run in the calling process.
+        chunk_size: Offers per task
+
+    Returns:
+        Copy of offers with the columns:
+        - monthly_payment: New monthly payment without special payments
+        - payment_shock: Change of the monthly payment (€)
+        - payment_shock_percent: Change in percent of the current payment
+        - payoff_years: Year of payoff counted from the start of the loan,
+          max_years if not repaid
+        - repaid: Whether the debt is repaid within max_years
+        - total_interest: Interest over the whole loan, binding period
+          included
+        - remaining_debt: Debt left after max_years
+        - remaining_debt_at_binding_end: Debt refinanced by the offer
+
+    Raises:
+        ValueError: If a column of OFFER_COLUMNS is missing, or if
+            special_payments continue after the binding period
+    """
+    missing = [column for column in OFFER_COLUMNS if column not in offers]
+    if missing:
+        raise ValueError(f"Offers lack the columns: {', '.join(missing)}")
+
+    calculator = FinancingCalculator(input_data)
+    binding_years = min(max(int(input_data.interest_binding_years), 0), max_years)
+    special_payment = input_data.annual_special_payment
+    if input_data.special_payments is not None:
+        # The follow-up years run with one constant payment per offer
+        if np.any(np.asarray(input_data.special_payments)[binding_years:]):
+            raise ValueError(
+                "special_payments after the interest binding period are not "
+                "supported; use annual_special_payment"
+            )
+        special_payment = 0.0
+
+    # The binding period is the same for every offer; its schedule follows
+    # the input's resolution, rounding and special payments
+    binding = calculator.compute_schedule(binding_years)
+    debt_at_binding_end = (
+        float(binding.debt_end[-1]) if binding_years > 0 else calculator.loan_amount
+    )
+    interest_binding_period = float(binding.interest_payment.sum())
+    binding_payoff = calculator.calculate_payoff_years(max_years)
+
+    offer_rates = offers["interest_rate"].to_numpy(dtype=np.float64) / 100
+    amortizations = offers["initial_amortization"].to_numpy(dtype=np.float64) / 100
+    new_binding = offers["binding_years"].to_numpy(dtype=np.int64)
+    annual_payment = debt_at_binding_end * (offer_rates + amortizations)
+    monthly_payment = annual_payment / 12
+
+    years = max_years - binding_years
+    if binding_payoff <= binding_years or years == 0:
+        # Nothing left to refinance within the horizon
+        payoff = int(min(binding_payoff, max_years))
+        count = len(offers)
+        payoff_years = np.full(count, payoff, dtype=np.int64)
+        total_interest = np.full(count, interest_binding_period)
+        remaining_debt = np.full(count, debt_at_binding_end)
+        repaid = np.full(count, debt_at_binding_end <= 0)
+    else:
+        later_rates = offer_rates
+        if follow_up_rate is not None:
+            later_rates = np.full_like(offer_rates, follow_up_rate / 100)
+        rates = np.where(
+            np.arange(years) < new_binding[:, None],
+            offer_rates[:, None],
+            later_rates[:, None],
+        )
+        payments = annual_payment + special_payment
+        tasks = [
+            (
+                debt_at_binding_end,
+                payments[start:start + chunk_size],
+                rates[start:start + chunk_size],
+            )
+            for start in range(0, len(offers), chunk_size)
+        ]
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(tasks) <= 1:
+            chunks = [_score_chunk(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+                chunks = list(pool.map(_score_chunk, tasks))
+
+        def combine(key):
+            if not chunks:
+                return np.zeros(0)
+            return np.concatenate([chunk[key] for chunk in chunks])
+
+        post_payoff = combine("payoff_years")
+        repaid = post_payoff > 0
+        payoff_years = np.where(
+            repaid, binding_years + post_payoff, max_years
+        ).astype(np.int64)
+        total_interest = interest_binding_period + combine("total_interest")
+        remaining_debt = combine("remaining_debt")
+
+    current_payment = calculator.monthly_payment
+    scored = offers.copy()
+    scored["monthly_payment"] = monthly_payment
+    scored["payment_shock"] = monthly_payment - current_payment
+    scored["payment_shock_percent"] = (
+        (monthly_payment / current_payment - 1) * 100
+        if current_payment > 0
+        else np.zeros(len(offers))
+    )
+    scored["payoff_years"] = payoff_years
+    scored["repaid"] = repaid
+    scored["total_interest"] = total_interest
+    scored["remaining_debt"] = remaining_debt
+    scored["remaining_debt_at_binding_end"] = debt_at_binding_end
+    return scored
+
+
+def _dominated(values: np.ndarray) -> np.ndarray:
+    """Rows of (n, 3) values that another row beats without losing on any.
+
+    Sorted lexicographically, every dominating row comes before the rows it
+    dominates, so one sweep suffices: a row is dominated if an earlier,
+    different row is no worse on the second and third criterion.  A Fenwick
+    tree over the ranks of the second criterion keeps the lowest third
+    criterion seen so far, which makes the sweep O(n log n).
+    """
+    order = np.lexsort(values.T[::-1])
+    rows = values[order].tolist()
+    levels = np.unique(values[:, 1])
+    ranks = (np.searchsorted(levels, values[order, 1]) + 1).tolist()
+    best = [np.inf] * (len(levels) + 1)
+    flags = np.zeros(len(rows), dtype=bool)
+    previous = None
+    for position, (row, rank) in enumerate(zip(rows, ranks)):
+        if row == previous:
+            # Equal offers do not dominate each other
+            flags[position] = flags[position - 1]
+            continue
+        index, lowest = rank, np.inf
+        while index > 0:
+            lowest = min(lowest, best[index])
+            index -= index & -index
+        flags[position] = lowest <= row[2]
+        index = rank
+        while index < len(best):
+            best[index] = min(best[index], row[2])
+            index += index & -index
+        previous = row
+
+    dominated = np.empty(len(rows), dtype=bool)
+    dominated[order] = flags
+    return dominated
+
+
+def rank_offers(
+    scored: pd.DataFrame,
+    top: int = 10,
+    max_payment_shock: float = None,
+    ranking: Sequence[str] = RANKING,
+) -> pd.DataFrame:
+    """Ranked shortlist of scored offers.
+
+    Offers that do not repay the debt within the horizon are dropped, since
+    their total interest stops at the horizon and would look cheap.
+
+    Args:
+        scored: Result of evaluate_offers
+        top: Length of the shortlist, None for all offers
+        max_payment_shock: Largest acceptable payment shock (€ per month)
+        ranking: Columns compared in order, lower is better
+
+    Returns:
+        The best offers, best first, with a rank column (1 = best) and a
+        pareto column marking offers that no other candidate beats on total
+        interest, payoff year and payment shock at once
+    """
+    candidates = scored[scored["repaid"]]
+    if max_payment_shock is not None:
+        candidates = candidates[candidates["payment_shock"] <= max_payment_shock]
+
+    # Dominated: another offer is no worse on every criterion and better on
+    # one
+    dominated = _dominated(candidates[list(RANKING)].to_numpy(dtype=np.float64))
+    shortlist = candidates.assign(pareto=~dominated).sort_values(
+        list(ranking), kind="stable"
+    )
+    if top is not None:
+        shortlist = shortlist.head(top)
+    shortlist = shortlist.reset_index(drop=True)
+    shortlist.insert(0, "rank", np.arange(1, len(shortlist) + 1))
+    return shortlist
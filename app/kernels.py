@@ -0,0 +1,230 @@
+"""
+Recursive Amortization Kernels
+Per-period loops with an optional JIT-compiled backend
+
+Most schedules are evaluated in closed form (annuity.py, monthly.py,
+ratepath.py).  Rules that change the recursion from period to period, such
+as payment holidays, limits on special payments or a new rate every year,
+have no closed form and need a loop over periods.  This module keeps those
+loops in one place and runs them on a selectable backend:
+
+- ``python``: The loops as plain Python, or NumPy vectorized over paths
+  where that is faster than a Python loop
+- ``numba``: The same loop sources compiled with ``numba.njit`` on first
+  use; only available when numba is installed
+
+The default backend is ``auto``, which picks numba when it is importable and
+pure Python otherwise.  All backends return identical results up to
+floating-point rounding.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Optional accelerator, see available_backends
+    numba = None
+
+PYTHON_BACKEND = "python"
+NUMBA_BACKEND = "numba"
+AUTO_BACKEND = "auto"
+BACKENDS = (PYTHON_BACKEND, NUMBA_BACKEND)
+
+_backend = AUTO_BACKEND
+
+# Loop functions compiled by numba, keyed by function name
+_compiled = {}
+
+
+def available_backends() -> tuple:
+    """Backends that can run in this environment"""
+    if numba is None:
+        return (PYTHON_BACKEND,)
+    return BACKENDS
+
+
+def resolve_backend(name: str = None) -> str:
+    """Concrete backend for a backend name.
+
+    Args:
+        name: ``"python"``, ``"numba"``, ``"auto"`` or None for the backend
+            selected with set_backend
+
+    Raises:
+        ValueError: For unknown names, or ``"numba"`` without numba installed
+    """
+    name = _backend if name is None else name
+    if name == AUTO_BACKEND:
+        return available_backends()[-1]
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown kernel backend: {name}")
+    if name not in available_backends():
+        raise ValueError(f"Kernel backend is not available: {name}")
+    return name
+
+
+def set_backend(name: str):
+    """Select the default backend (``"python"``, ``"numba"`` or ``"auto"``)"""
+    global _backend
+    resolve_backend(name)
+    _backend = name
+
+
+def get_backend() -> str:
+    """Concrete backend used when no backend is passed explicitly"""
+    return resolve_backend()
+
+
+def _amortization_loop(principal, rates, payments, special_payments, holidays):
+    """Amortization recursion with payment holidays, one period at a time.
+
+    In a holiday period no payment is made and the interest is added to the
+    debt.  Special payments are capped at the debt left after the regular
+    payment.
+    """
+    periods = rates.shape[0]
+    debt_start = np.zeros(periods)
+    interest = np.zeros(periods)
+    amortization = np.zeros(periods)
+    special_paid = np.zeros(periods)
+    debt = principal
+    for period in range(periods):
+        if debt <= 0.0:
+            break
+        debt_start[period] = debt
+        interest[period] = debt * rates[period]
+        if holidays[period]:
+            amortization[period] = -interest[period]
+        else:
+            regular = min(payments[period] - interest[period], debt)
+            special = min(special_payments[period], debt - regular)
+            special_paid[period] = max(special, 0.0)
+            amortization[period] = regular + special_paid[period]
+        debt -= amortization[period]
+    return debt_start, interest, amortization, special_paid
+
+
+def _rate_matrix_loop(principal, payment, rates):
+    """Yearly recursion for every path, stopping each path at payoff"""
+    count, years = rates.shape
+    payoff_years = np.zeros(count, dtype=np.int64)
+    total_interest = np.zeros(count)
+    remaining_debt = np.zeros(count)
+    for path in range(count):
+        debt = principal[path]
+        for year in range(years):
+            interest = debt * rates[path, year]
+            debt -= min(payment[path] - interest, debt)
+            total_interest[path] += interest
+            if debt <= 0.0:
+                payoff_years[path] = year + 1
+                break
+        remaining_debt[path] = debt
+    return payoff_years, total_interest, remaining_debt
+
+
+def _rate_matrix_numpy(principal, payment, rates):
+    """Yearly recursion vectorized over paths (faster than a Python loop)"""
+    count, years = rates.shape
+    debt = principal.copy()
+    total_interest = np.zeros(count)
+    payoff_years = np.zeros(count, dtype=np.int64)
+    for year in range(years):
+        interest = debt * rates[:, year]
+        # Repaid paths have no debt left, so interest and amortization are 0
+        debt -= np.minimum(payment - interest, debt)
+        total_interest += interest
+        payoff_years[(debt <= 0) & (payoff_years == 0)] = year + 1
+    return payoff_years, total_interest, debt
+
+
+def _jit(func):
+    """numba-compiled version of a loop function (compiled once)"""
+    if func.__name__ not in _compiled:
+        _compiled[func.__name__] = numba.njit(cache=True)(func)
+    return _compiled[func.__name__]
+
+
+def amortization_schedule(
+    principal: float,
+    rates,
+    payments,
+    special_payments=0.0,
+    holidays=False,
+    backend: str = None,
+) -> dict:
+    """Amortization schedule with period-dependent rules.
+
+    Args:
+        principal: Loan amount at the start (€)
+        rates: Interest rate of every period as a fraction (per period, e.g.
+            annual rate / 12 for months); its length is the number of periods
+        payments: Regular payment of every period (€), scalar or per period
+        special_payments: Special payment of every period (€), scalar or per
+            period; capped at the outstanding debt
+        holidays: Payment holidays, scalar or boolean per period
+        backend: Backend name, defaults to the one selected with set_backend
+
+    Returns:
+        Dictionary of float64 arrays: ``debt_start``, ``interest``,
+        ``amortization`` (negative in holidays), ``special_payment`` (paid
+        special payment) and ``debt_end``, plus ``period`` (int64, 1-based).
+        Balances stay at zero once the loan is repaid.
+    """
+    rates = np.ascontiguousarray(rates, dtype=np.float64)
+    periods = rates.shape[0]
+    payments = np.ascontiguousarray(
+        np.broadcast_to(np.asarray(payments, dtype=np.float64), (periods,))
+    )
+    special_payments = np.ascontiguousarray(
+        np.broadcast_to(np.asarray(special_payments, dtype=np.float64), (periods,))
+    )
+    holidays = np.ascontiguousarray(
+        np.broadcast_to(np.asarray(holidays, dtype=np.bool_), (periods,))
+    )
+
+    loop = _amortization_loop
+    if resolve_backend(backend) == NUMBA_BACKEND:
+        loop = _jit(loop)
+    debt_start, interest, amortization, special_paid = loop(
+        float(principal), rates, payments, special_payments, holidays
+    )
+    return {
+        "period": np.arange(1, periods + 1, dtype=np.int64),
+        "debt_start": debt_start,
+        "interest": interest,
+        "amortization": amortization,
+        "special_payment": special_paid,
+        "debt_end": debt_start - amortization,
+    }
+
+
+def rate_matrix(principal, payment, rates, backend: str = None) -> dict:
+    """Payoff figures for paths given as a matrix of yearly rates.
+
+    Args:
+        principal: Loan amount at the start (€), scalar or one per path
+        payment: Total annual payment including special payments (€),
+            scalar or one per path
+        rates: (paths × years) array of annual rates as fractions
+        backend: Backend name, defaults to the one selected with set_backend
+
+    Returns:
+        Dictionary of per-path arrays ``payoff_years`` (0 if not repaid),
+        ``total_interest`` and ``remaining_debt``
+    """
+    rates = np.ascontiguousarray(np.atleast_2d(rates), dtype=np.float64)
+    count = rates.shape[0]
+    principal = np.array(np.broadcast_to(principal, (count,)), dtype=np.float64)
+    payment = np.array(np.broadcast_to(payment, (count,)), dtype=np.float64)
+
+    if resolve_backend(backend) == NUMBA_BACKEND:
+        loop = _jit(_rate_matrix_loop)
+    else:
+        loop = _rate_matrix_numpy
+    payoff_years, total_interest, remaining_debt = loop(principal, payment, rates)
+    return {
+        "payoff_years": payoff_years,
+        "total_interest": total_interest,
+        "remaining_debt": remaining_debt,
+    }
@@ -0,0 +1,469 @@
+"""
+KPI Registry
+Declared KPI dependencies and a planner that evaluates only what is needed
+
+Every KPI of the financing summary is registered here together with the
+intermediate results it needs (the payoff schedule with its prefix sums,
+the totals for the summary horizon, the cumulative equity, the scenario
+without special payments, ...).  Intermediates are registered the same way,
+so a new KPI declares its inputs instead of re-simulating the loan:
+
+    @kpi("interest_share", requires=("horizon_totals",))
+    def _interest_share(context):
+        total_interest, total_amortization, _ = context["horizon_totals"]
+        return {"interest_share": total_interest / (...)}
+
+The planner (plan) orders the requested KPIs and everything they depend on
+so that each node runs once; a KpiContext executes the plan and shares the
+intermediate values between all KPIs evaluated through it.  Values that do
+not depend on the summary horizon are kept on the calculator until its loan
+terms change, so summaries for further horizons reuse them.
+
+The registration order of the KPIs is the key order of get_summary.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+
+import annuity
+from summary import ReadOnlyDict
+
+
+@dataclass(frozen=True)
+class Node:
+    """A registered KPI or intermediate result"""
+
+    name: str
+    compute: Callable  # compute(context) -> value
+    requires: tuple = ()
+    keys: tuple = ()  # Summary keys provided by a KPI (empty for intermediates)
+    horizon: bool = False  # Whether it reads the summary horizon (years)
+
+
+# Equity milestones in percent of the purchase price (see equity_milestone_years)
+EQUITY_MILESTONES = (25, 50, 75, 100)
+
+# Shortfall in € still counted as reaching a milestone (rounding of the sums)
+MILESTONE_TOLERANCE = 0.005
+
+# Registered nodes by name, KPIs in summary key order
+NODES = {}
+KPIS = {}
+
+
+def _register(node: Node):
+    if node.name in NODES:
+        raise ValueError(f"KPI or intermediate already registered: {node.name}")
+    NODES[node.name] = node
+    if node.keys:
+        KPIS[node.name] = node
+
+
+def intermediate(name: str, requires: Sequence[str] = (), horizon: bool = False):
+    """Register an intermediate result shared by KPIs"""
+
+    def decorator(compute):
+        _register(Node(name, compute, tuple(requires), (), horizon))
+        return compute
+
+    return decorator
+
+
+def kpi(
+    name: str,
+    requires: Sequence[str] = (),
+    keys: Sequence[str] = None,
+    horizon: bool = False,
+):
+    """Register a KPI whose compute function returns a dict of summary keys.
+
+    Args:
+        name: KPI name used in requests to the planner
+        requires: Names of the intermediates (or KPIs) it reads
+        keys: Summary keys it returns, defaults to (name,)
+        horizon: Whether it depends on the summary horizon itself
+    """
+
+    def decorator(compute):
+        summary_keys = tuple(keys or (name,))
+        _register(Node(name, compute, tuple(requires), summary_keys, horizon))
+        return compute
+
+    return decorator
+
+
+def plan(names: Sequence[str]) -> list:
+    """Nodes needed for the given KPIs, each after its requirements.
+
+    Raises:
+        ValueError: For unknown names or circular requirements
+    """
+    order = []
+    visiting = set()
+
+    def visit(name):
+        if name in order:
+            return
+        if name not in NODES:
+            raise ValueError(f"Unknown KPI: {name}")
+        if name in visiting:
+            raise ValueError(f"Circular KPI requirement: {name}")
+        visiting.add(name)
+        for required in NODES[name].requires:
+            visit(required)
+        visiting.discard(name)
+        order.append(name)
+
+    for name in names:
+        visit(name)
+    return order
+
+
+def depends_on_horizon(name: str) -> bool:
+    """Whether a node reads the horizon directly or through a requirement"""
+    node = NODES[name]
+    return node.horizon or any(depends_on_horizon(item) for item in node.requires)
+
+
+def kpi_for_key(key: str) -> str:
+    """Name of the KPI providing a summary key"""
+    for name, node in KPIS.items():
+        if key in node.keys:
+            return name
+    raise ValueError(f"Unknown summary key: {key}")
+
+
+def equity_milestone_years(cumulative_equity, amortization, targets):
+    """Fractional years until the equity reaches each target amount.
+
+    One binary search on the running maximum of the year-end equity finds
+    the year in which each target is first reached; the point within that
+    year is interpolated from the year's amortization.  A target the
+    initial equity already meets therefore gives 0 or less, as for
+    time_to_50_equity.
+
+    Args:
+        cumulative_equity: Equity at the end of every year (€)
+        amortization: Amortization of every year (€)
+        targets: Target equity amounts (€), scalar or array
+
+    Returns:
+        float64 array shaped like targets, NaN for targets not reached
+        within the given years
+    """
+    cumulative_equity = np.asarray(cumulative_equity, dtype=np.float64)
+    amortization = np.asarray(amortization, dtype=np.float64)
+    targets = np.asarray(targets, dtype=np.float64)
+    reached_by = np.maximum.accumulate(cumulative_equity)
+    index = np.searchsorted(reached_by, targets - MILESTONE_TOLERANCE, side="left")
+
+    years = np.full(targets.shape, np.nan)
+    within = index < len(cumulative_equity)
+    position = index[within]
+    gained = amortization[position]
+    previous_equity = cumulative_equity[position] - gained
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = (targets[within] - previous_equity) / gained
+    years[within] = np.where(
+        gained > 0, position + np.minimum(fraction, 1.0), position + 1.0
+    )
+    return years
+
+
+class KpiContext:
+    """Executes plans for one calculator and horizon, sharing all values.
+
+    Args:
+        calculator: FinancingCalculator providing the loan and its schedules
+        years: Summary horizon, needed by horizon-dependent KPIs
+    """
+
+    def __init__(self, calculator, years: int = None):
+        self.calculator = calculator
+        self.years = years
+        self._values = {}
+        # Horizon-independent values, shared with other contexts
+        self._shared = calculator._kpi_values()
+
+    def __getitem__(self, name: str):
+        """Value of an evaluated node (see evaluate)"""
+        if name in self._values:
+            return self._values[name]
+        return self._shared[name]
+
+    def _is_evaluated(self, name: str) -> bool:
+        return name in self._values or name in self._shared
+
+    def evaluate(self, names: Sequence[str]) -> dict:
+        """Evaluate KPIs and their requirements.
+
+        Returns:
+            Dictionary of all summary keys of the requested KPIs
+        """
+        for name in plan(names):
+            if self._is_evaluated(name):
+                continue
+            node = NODES[name]
+            if node.horizon and self.years is None:
+                raise ValueError(f"KPI {name} requires a horizon (years)")
+            value = node.compute(self)
+            if depends_on_horizon(name):
+                self._values[name] = value
+            else:
+                self._shared[name] = value
+
+        result = {}
+        for name in names:
+            if NODES[name].keys:
+                result.update(self[name])
+        return result
+
+
+# Intermediates
+
+
+@intermediate("payoff_index")
+def _payoff_index(context):
+    return context.calculator._get_payoff_index()
+
+
+@intermediate("horizon_totals", requires=("payoff_index",), horizon=True)
+def _horizon_totals(context):
+    """(total interest, total amortization, remaining debt) after years"""
+    return context.calculator._horizon_totals(context.years)
+
+
+@intermediate("cumulative_equity", requires=("payoff_index",))
+def _cumulative_equity(context):
+    """Equity at the end of every year until payoff"""
+    index = context["payoff_index"]
+    return context.calculator.input.equity + index["cumulative_amortization"][1:]
+
+
+@intermediate("equity_milestones", requires=("payoff_index", "cumulative_equity"))
+def _equity_milestones(context):
+    """Years until each of EQUITY_MILESTONES, NaN if not reached"""
+    purchase_price = context.calculator.input.purchase_price
+    return equity_milestone_years(
+        context["cumulative_equity"],
+        context["payoff_index"]["arrays"]["amortization"],
+        purchase_price * np.asarray(EQUITY_MILESTONES) / 100,
+    )
+
+
+@intermediate("counterfactual", requires=("payoff_index",))
+def _counterfactual(context):
+    """(payoff year, total interest) without special payments"""
+    calculator = context.calculator
+    if not calculator._has_special_payments():
+        index = context["payoff_index"]
+        return index["payoff_years"], float(index["cumulative_interest"][-1])
+    if not calculator._has_closed_form():
+        payoff_years = calculator._kernel_payoff_year(0.0)
+        interest = calculator._schedule_kernel(payoff_years, 0.0)["interest"].sum()
+        return payoff_years, float(interest)
+    rate = calculator.input.interest_rate / 100
+    payment = calculator.annual_payment
+    payoff_year = annuity.payoff_year(calculator.loan_amount, rate, payment)
+    payoff_years = int(min(payoff_year, 100))
+    return payoff_years, annuity.cumulative_interest(
+        calculator.loan_amount, rate, payment, payoff_years
+    )
+
+
+# KPIs, in summary key order
+
+
+@kpi(
+    "inputs",
+    keys=(
+        "purchase_price",
+        "equity",
+        "loan_amount",
+        "annual_payment",
+        "monthly_payment",
+        "interest_rate",
+        "initial_amortization",
+    ),
+)
+def _inputs(context):
+    calculator = context.calculator
+    return {
+        "purchase_price": calculator.input.purchase_price,
+        "equity": calculator.input.equity,
+        "loan_amount": calculator.loan_amount,
+        "annual_payment": calculator.annual_payment,
+        "monthly_payment": calculator.monthly_payment,
+        "interest_rate": calculator.input.interest_rate,
+        "initial_amortization": calculator.input.initial_amortization,
+    }
+
+
+@kpi(
+    "totals",
+    requires=("horizon_totals",),
+    keys=("total_interest", "total_amortization", "remaining_debt"),
+)
+def _totals(context):
+    total_interest, total_amortization, remaining_debt = context["horizon_totals"]
+    return {
+        "total_interest": total_interest,
+        "total_amortization": total_amortization,
+        "remaining_debt": remaining_debt,
+    }
+
+
+@kpi("years", horizon=True)
+def _years(context):
+    return {"years": context.years}
+
+
+# High-Priority KPIs
+
+
+@kpi("total_cost_of_ownership", requires=("horizon_totals",))
+def _total_cost_of_ownership(context):
+    """Purchase price + total interest paid"""
+    total_interest = context["horizon_totals"][0]
+    purchase_price = context.calculator.input.purchase_price
+    return {"total_cost_of_ownership": purchase_price + total_interest}
+
+
+@kpi("interest_to_principal_ratio", requires=("horizon_totals",))
+def _interest_to_principal_ratio(context):
+    """Total interest / total amortization"""
+    total_interest, total_amortization, _ = context["horizon_totals"]
+    return {
+        "interest_to_principal_ratio": (
+            (total_interest / total_amortization) if total_amortization > 0 else 0
+        )
+    }
+
+
+@kpi("ltv_ratio")
+def _ltv_ratio(context):
+    """Loan-to-value: (loan amount / purchase price) × 100"""
+    calculator = context.calculator
+    purchase_price = calculator.input.purchase_price
+    return {
+        "ltv_ratio": (
+            (calculator.loan_amount / purchase_price * 100) if purchase_price > 0 else 0
+        )
+    }
+
+
+@kpi(
+    "interest_savings",
+    requires=("payoff_index", "counterfactual"),
+    keys=(
+        "interest_savings",
+        "interest_without_special",
+        "interest_with_special",
+        "time_saved_years",
+    ),
+)
+def _interest_savings(context):
+    """Interest savings against the scenario without special payments"""
+    if not context.calculator._has_special_payments():
+        return {
+            "interest_savings": 0,
+            "interest_without_special": 0,
+            "interest_with_special": 0,
+            "time_saved_years": 0,
+        }
+    index = context["payoff_index"]
+    payoff_years_without, interest_without_special = context["counterfactual"]
+    interest_with_special = float(index["cumulative_interest"][-1])
+    return {
+        "interest_savings": interest_without_special - interest_with_special,
+        "interest_without_special": interest_without_special,
+        "interest_with_special": interest_with_special,
+        "time_saved_years": payoff_years_without - index["payoff_years"],
+    }
+
+
+# Medium-priority KPIs
+
+
+@kpi(
+    "breakeven",
+    requires=("payoff_index",),
+    keys=(
+        "breakeven_year",
+        "cumulative_amortization_at_breakeven",
+        "cumulative_interest_at_breakeven",
+    ),
+)
+def _breakeven(context):
+    """First year with more principal than interest repaid"""
+    index = context["payoff_index"]
+    cumulative_amortization = index["cumulative_amortization"][1:]
+    cumulative_interest = index["cumulative_interest"][1:]
+    ahead = cumulative_amortization > cumulative_interest
+    position = int(ahead.argmax()) if ahead.any() else len(ahead) - 1
+    return {
+        "breakeven_year": position + 1 if ahead[position] else None,
+        "cumulative_amortization_at_breakeven": float(
+            cumulative_amortization[position]
+        ),
+        "cumulative_interest_at_breakeven": float(cumulative_interest[position]),
+    }
+
+
+@kpi("equity_buildup_rate", requires=("payoff_index", "cumulative_equity"))
+def _equity_buildup_rate(context):
+    """Year-by-year equity progression"""
+    arrays = context["payoff_index"]["arrays"]
+    cumulative_equity = context["cumulative_equity"]
+    purchase_price = context.calculator.input.purchase_price
+    if purchase_price > 0:
+        equity_percentage = cumulative_equity / purchase_price * 100
+    else:
+        equity_percentage = np.zeros_like(cumulative_equity)
+    # Shared by every summary of the calculator, hence read-only
+    return {
+        "equity_buildup_rate": tuple(
+            ReadOnlyDict(
+                year=year,
+                equity_gained=equity_gained,
+                equity_percentage=percentage,
+                cumulative_equity=equity,
+            )
+            for year, equity_gained, percentage, equity in zip(
+                arrays["year"].tolist(),
+                arrays["amortization"].tolist(),
+                equity_percentage.tolist(),
+                cumulative_equity.tolist(),
+            )
+        )
+    }
+
+
+# Low-priority KPIs
+
+
+@kpi("buffer_ratio")
+def _buffer_ratio(context):
+    """Months of emergency fund: (monthly payment × 6) / current equity"""
+    calculator = context.calculator
+    equity = calculator.input.equity
+    return {
+        "buffer_ratio": ((calculator.monthly_payment * 6) / equity) if equity > 0 else 0
+    }
+
+
+@kpi("time_to_50_equity", requires=("payoff_index", "equity_milestones"))
+def _time_to_50_equity(context):
+    """Years until 50% equity, interpolated within the year it is reached"""
+    years = context["equity_milestones"][EQUITY_MILESTONES.index(50)]
+    if np.isnan(years):
+        return {"time_to_50_equity": float(context["payoff_index"]["payoff_years"])}
+    return {"time_to_50_equity": float(years)}
+
+
+@kpi("rate_sensitivity_score")
+def _rate_sensitivity_score(context):
+    """Monthly payment increase if rates rise by 1%"""
+    return {"rate_sensitivity_score": context.calculator._calculate_rate_sensitivity()}
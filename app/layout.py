@@ -18,6 +18,11 @@ from config import (
     DEFAULT_INTEREST_BINDING_YEARS,
     DEFAULT_ANNUAL_SPECIAL_PAYMENT,
     DEFAULT_HOUSEHOLD_INCOME,
+    DEFAULT_SPECIAL_PAYMENT_MONTH,
+    CALCULATION_RESOLUTION,
+    CALCULATION_ROUNDING,
+    INCOME_PERCENTAGE_MIN,
+    INCOME_PERCENTAGE_MAX,
 )
 
 # helper to compute initial years-to-show using the same calculator logic
@@ -33,6 +38,9 @@ def calculate_default_years() -> int:
         initial_amortization=DEFAULT_INITIAL_AMORTIZATION,
         annual_special_payment=DEFAULT_ANNUAL_SPECIAL_PAYMENT,
         interest_binding_years=DEFAULT_INTEREST_BINDING_YEARS,
+        special_payment_month=DEFAULT_SPECIAL_PAYMENT_MONTH,
+        resolution=CALCULATION_RESOLUTION,
+        rounding=CALCULATION_ROUNDING,
     )
     calc = FinancingCalculator(default_input)
     return calc.calculate_payoff_years()
@@ -351,12 +359,17 @@ def create_layout(lang="en"):
                                             ),
                                             dcc.Slider(
                                                 id="income_percentage_slider",
-                                                min=5,
-                                                max=40,
+                                                min=INCOME_PERCENTAGE_MIN,
+                                                max=INCOME_PERCENTAGE_MAX,
                                                 step=1,
                                                 value=30,
                                                 marks={
-                                                    i: f"{i}%" for i in range(5, 41, 5)
+                                                    i: f"{i}%"
+                                                    for i in range(
+                                                        INCOME_PERCENTAGE_MIN,
+                                                        INCOME_PERCENTAGE_MAX + 1,
+                                                        5,
+                                                    )
                                                 },
                                                 tooltip={
                                                     "placement": "bottom",
@@ -633,6 +646,18 @@ def create_layout(lang="en"):
                                                 dcc.Graph(
                                                     id="equity_buildup_chart"
                                                 ),
+                                                style={
+                                                    "backgroundColor": "white",
+                                                    "padding": "1.5rem",
+                                                    "borderRadius": "8px",
+                                                    "boxShadow": "0 2px 8px rgba(0, 0, 0, 0.1)",
+                                                    "marginBottom": "2rem",
+                                                },
+                                            ),
+                                            html.Div(
+                                                dcc.Graph(
+                                                    id="sensitivity_heatmap_chart"
+                                                ),
                                                 style={
                                                     "backgroundColor": "white",
                                                     "padding": "1.5rem",
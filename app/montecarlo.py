@@ -0,0 +1,250 @@
+"""
+Monte Carlo Refinancing Simulation
+Distributions of payoff time and interest cost under random follow-up rates
+
+The interest rate is fixed during the interest binding period; afterwards
+the follow-up rate is unknown.  This module draws many post-binding rate
+paths from a seeded stochastic process, runs them through the vectorized
+rate-matrix kernel (ratepath.evaluate_rate_matrix) and reports the
+resulting distributions of payoff years, total interest and remaining debt.
+
+Paths are simulated in fixed-size chunks.  Each chunk draws from its own
+child of the seed's SeedSequence, so results are reproducible for a given
+seed and chunk size regardless of how many worker processes run them.
+Large simulations are spread across a ProcessPoolExecutor.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import numpy as np
+
+import annuity
+import ratepath
+from calculator import FinancingCalculator, FinancingInput
+
+RATE_MODELS = ("random_walk", "mean_reverting")
+
+# Paths simulated per task; also the threshold below which no pool is used
+DEFAULT_CHUNK_SIZE = 2500
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def simulate_rate_paths(
+    rng: np.random.Generator,
+    paths: int,
+    years: int,
+    start_rate: float,
+    model: str = "random_walk",
+    volatility: float = 0.5,
+    mean_reversion: float = 0.2,
+    long_run_rate: float = None,
+    min_rate: float = 0.0,
+    burn_in_years: int = 0,
+) -> np.ndarray:
+    """Draw yearly interest rate paths.
+
+    Args:
+        rng: NumPy random generator
+        paths: Number of paths
+        years: Number of years per path
+        start_rate: Rate in the first simulated year (percent)
+        model: "random_walk" (r_t = r_{t-1} + σε), "mean_reverting"
+            (r_t = r_{t-1} + κ(θ - r_{t-1}) + σε), or a model object with a
+            ``yearly_rates(rng, initial_rate, years, paths)`` method such as
+            shortrate.ShortRateModel (which carries its own parameters)
+        volatility: Standard deviation σ of the yearly change (percentage
+            points)
+        mean_reversion: Speed κ of the mean-reverting model (per year)
+        long_run_rate: Level θ of the mean-reverting model (percent),
+            defaults to start_rate
+        min_rate: Lower bound applied to every simulated rate (percent)
+        burn_in_years: Years simulated from start_rate before the first
+            returned year (e.g. the interest binding period)
+
+    Returns:
+        (paths × years) array of rates in percent
+    """
+    if isinstance(model, str) and model not in RATE_MODELS:
+        raise ValueError(f"Unknown rate model: {model}")
+    if years <= 0:
+        return np.zeros((paths, 0))
+
+    if burn_in_years > 0:
+        rates = simulate_rate_paths(
+            rng,
+            paths,
+            burn_in_years + years,
+            start_rate,
+            model,
+            volatility,
+            mean_reversion,
+            long_run_rate,
+            min_rate,
+        )
+        return rates[:, burn_in_years:]
+
+    if not isinstance(model, str):
+        rates = model.yearly_rates(rng, start_rate, years, paths)
+        return np.maximum(rates, min_rate)
+
+    shocks = rng.standard_normal((paths, years - 1)) * volatility
+    if model == "random_walk":
+        rates = start_rate + np.concatenate(
+            (np.zeros((paths, 1)), np.cumsum(shocks, axis=1)), axis=1
+        )
+    else:
+        level = start_rate if long_run_rate is None else long_run_rate
+        rates = np.empty((paths, years))
+        rates[:, 0] = start_rate
+        for year in range(1, years):
+            previous = rates[:, year - 1]
+            rates[:, year] = (
+                previous + mean_reversion * (level - previous) + shocks[:, year - 1]
+            )
+    return np.maximum(rates, min_rate)
+
+
+def _simulate_chunk(task: tuple) -> dict:
+    """Simulate one chunk of paths (runs in a worker process)"""
+    seed_sequence, paths, years, principal, payment, rate_kwargs = task
+    rng = np.random.default_rng(seed_sequence)
+    rates = simulate_rate_paths(rng, paths, years, **rate_kwargs)
+    return ratepath.evaluate_rate_matrix(principal, payment, rates / 100)
+
+
+def run_monte_carlo(
+    input_data: FinancingInput,
+    paths: int = 10000,
+    model: str = "random_walk",
+    volatility: float = 0.5,
+    mean_reversion: float = 0.2,
+    long_run_rate: float = None,
+    start_rate: float = None,
+    min_rate: float = 0.0,
+    max_years: int = 100,
+    seed: int = None,
+    workers: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    simulate_binding_period: bool = False,
+) -> dict:
+    """Simulate follow-up rates after the interest binding period.
+
+    The binding period uses the contractual rate; from the following year
+    on every path draws its own rates (see simulate_rate_paths).  Annual
+    payment and special payment stay fixed, as in calculate_with_rate_change.
+
+    Args:
+        input_data: Financing input
+        paths: Number of simulated rate paths
+        model, volatility, mean_reversion, long_run_rate, min_rate: Rate
+            process parameters, see simulate_rate_paths
+        start_rate: Rate in the first year after binding (percent),
+            defaults to the current interest rate. With
+            simulate_binding_period it is the rate today instead.
+        max_years: Horizon of the simulation (default 100)
+        seed: Seed for reproducible results
+        workers: Worker processes; defaults to the CPU count. Simulations
+            of a single chunk, or workers=1, run in the calling process.
+        chunk_size: Paths per task
+        simulate_binding_period: Start the rate paths today and let them
+            evolve over the binding period (whose contractual rate still
+            applies), so the follow-up rate reflects that uncertainty
+
+    Returns:
+        Dictionary with:
+        - payoff_years, total_interest, remaining_debt: Arrays with one value
+          per path (payoff_years is max_years if not repaid, remaining_debt
+          is the debt after max_years)
+        - remaining_debt_at_binding_end: Debt when the binding period ends
+        - percentiles: Percentiles of the three distributions
+
+    Raises:
+        ValueError: If input_data.special_payments is set
+    """
+    calculator = FinancingCalculator(input_data)
+    calculator._require_annual_special_payment()
+    rate = input_data.interest_rate / 100
+    payment = calculator.annual_payment + input_data.annual_special_payment
+    binding_years = min(max(int(input_data.interest_binding_years), 0), max_years)
+
+    # The binding period is the same for every path
+    debt_at_binding_end = annuity.remaining_debt(
+        calculator.loan_amount, rate, payment, binding_years
+    )
+    interest_binding_period = annuity.cumulative_interest(
+        calculator.loan_amount, rate, payment, binding_years
+    )
+    binding_payoff = annuity.payoff_year(calculator.loan_amount, rate, payment)
+
+    if binding_payoff <= binding_years or binding_years == max_years:
+        payoff = int(min(binding_payoff, max_years))
+        payoff_years = np.full(paths, payoff, dtype=np.int64)
+        total_interest = np.full(paths, interest_binding_period)
+        remaining_debt = np.full(paths, debt_at_binding_end)
+    else:
+        if start_rate is None:
+            start_rate = input_data.interest_rate
+        rate_kwargs = {
+            "start_rate": start_rate,
+            "model": model,
+            "volatility": volatility,
+            "mean_reversion": mean_reversion,
+            "long_run_rate": long_run_rate,
+            "min_rate": min_rate,
+            "burn_in_years": binding_years if simulate_binding_period else 0,
+        }
+        sizes = [
+            min(chunk_size, paths - start) for start in range(0, paths, chunk_size)
+        ]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        tasks = [
+            (
+                seed_sequence,
+                size,
+                max_years - binding_years,
+                debt_at_binding_end,
+                payment,
+                rate_kwargs,
+            )
+            for seed_sequence, size in zip(seeds, sizes)
+        ]
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(tasks) <= 1:
+            chunks = [_simulate_chunk(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+                chunks = list(pool.map(_simulate_chunk, tasks))
+
+        post_payoff = np.concatenate([chunk["payoff_years"] for chunk in chunks])
+        payoff_years = np.where(
+            post_payoff > 0, binding_years + post_payoff, max_years
+        ).astype(np.int64)
+        total_interest = interest_binding_period + np.concatenate(
+            [chunk["total_interest"] for chunk in chunks]
+        )
+        remaining_debt = np.concatenate([chunk["remaining_debt"] for chunk in chunks])
+
+    return {
+        "payoff_years": payoff_years,
+        "total_interest": total_interest,
+        "remaining_debt": remaining_debt,
+        "remaining_debt_at_binding_end": debt_at_binding_end,
+        "percentiles": {
+            name: distribution_percentiles(values)
+            for name, values in (
+                ("payoff_years", payoff_years),
+                ("total_interest", total_interest),
+                ("remaining_debt", remaining_debt),
+            )
+        },
+    }
+
+
+def distribution_percentiles(values, percentiles=DEFAULT_PERCENTILES) -> dict:
+    """Percentiles of a simulated distribution, keyed by percentile"""
+    if len(values) == 0:
+        return {}
+    return dict(zip(percentiles, np.percentile(values, percentiles).tolist()))
@@ -0,0 +1,161 @@
+"""
+Monthly Amortization Engine
+Month-by-month annuity schedules with efficient yearly roll-up
+
+German banks compute annuity loans monthly: each month one twelfth of the
+annual rate is paid and interest accrues at one twelfth of the nominal
+annual interest rate.  An annual special payment is made together with the
+regular payment in a configurable month of each year.
+
+The whole schedule is evaluated in closed form.  Opening balances of each
+year follow a linear recursion B_{y+1} = a * B_y + b, and balances within a
+year follow from B_y, so a (years × 12) grid of balances is produced with
+NumPy broadcasting.  The yearly view is obtained with segmented reductions
+(``np.add.reduceat``) rather than Python loops.
+"""
+
+import numpy as np
+
+MONTHS_PER_YEAR = 12
+
+
+def monthly_schedule_arrays(
+    principal: float,
+    rate: float,
+    monthly_payment: float,
+    special_payment: float,
+    special_month: int,
+    months: int,
+) -> dict:
+    """Vectorized monthly amortization schedule.
+
+    Args:
+        principal: Loan amount at the start (€)
+        rate: Nominal annual interest rate as a fraction
+        monthly_payment: Regular monthly payment (€)
+        special_payment: Special payment made once per year (€)
+        special_month: Month of the year (1-12) in which it is paid
+        months: Number of months to generate
+
+    Returns:
+        Dictionary of contiguous arrays of length ``months``: ``month``
+        (int64, 1-based) and ``debt_start``, ``interest``, ``amortization``,
+        ``debt_end`` (float64). The final amortization is capped at the
+        outstanding debt and balances stay at zero afterwards.
+    """
+    months = max(int(months), 0)
+    years = -(-months // MONTHS_PER_YEAR)
+    monthly_rate = rate / MONTHS_PER_YEAR
+    growth = 1.0 + monthly_rate
+
+    # Opening balance of each month k (0-11) relative to the year's opening
+    # balance B_y:  g^k * B_y - p * annuity(k) - S * g^(k - m) for k >= m
+    offset = np.arange(MONTHS_PER_YEAR, dtype=np.float64)
+    if monthly_rate == 0:
+        annuity_factor = offset
+    else:
+        annuity_factor = np.expm1(offset * np.log1p(monthly_rate)) / monthly_rate
+    month_growth = np.power(growth, offset)
+    special_index = special_month - 1
+    special_share = np.where(
+        offset > special_index, np.power(growth, offset - special_month), 0.0
+    )
+
+    # Opening balance of each year: B_{y+1} = a * B_y + b
+    year_growth = growth**MONTHS_PER_YEAR
+    year_factor = (
+        MONTHS_PER_YEAR
+        if monthly_rate == 0
+        else np.expm1(MONTHS_PER_YEAR * np.log1p(monthly_rate)) / monthly_rate
+    )
+    year_step = -(
+        monthly_payment * year_factor
+        + special_payment * growth ** (MONTHS_PER_YEAR - special_month)
+    )
+    elapsed_years = np.arange(years, dtype=np.float64)
+    if year_growth == 1:
+        year_start = principal + year_step * elapsed_years
+    else:
+        year_start = principal * np.power(year_growth, elapsed_years) + year_step * (
+            np.expm1(elapsed_years * np.log(year_growth)) / (year_growth - 1.0)
+        )
+
+    debt_start = (
+        year_start[:, None] * month_growth[None, :]
+        - monthly_payment * annuity_factor[None, :]
+        - special_payment * special_share[None, :]
+    ).ravel()[:months]
+
+    # Balances never drop below zero after the first month
+    np.maximum(debt_start[1:], 0.0, out=debt_start[1:])
+
+    special = np.zeros(months)
+    special[special_index::MONTHS_PER_YEAR] = special_payment
+
+    interest = debt_start * monthly_rate
+    amortization = np.minimum(monthly_payment - interest + special, debt_start)
+    debt_end = debt_start - amortization
+
+    return {
+        "month": np.arange(1, months + 1, dtype=np.int64),
+        "debt_start": debt_start,
+        "interest": interest,
+        "amortization": amortization,
+        "debt_end": debt_end,
+    }
+
+
+def yearly_rollup(monthly: dict) -> dict:
+    """Aggregate a monthly schedule into yearly schedule arrays.
+
+    Interest and amortization are summed per year with segmented
+    reductions; opening and closing balances are taken from the first and
+    last month of each year.
+
+    Returns:
+        Dictionary with the same keys as annuity.schedule_arrays.
+    """
+    months = len(monthly["month"])
+    if months == 0:
+        return {
+            "year": np.zeros(0, dtype=np.int64),
+            "debt_start": np.zeros(0),
+            "interest": np.zeros(0),
+            "amortization": np.zeros(0),
+            "debt_end": np.zeros(0),
+        }
+
+    starts = np.arange(0, months, MONTHS_PER_YEAR)
+    ends = np.minimum(starts + MONTHS_PER_YEAR, months) - 1
+    return {
+        "year": np.arange(1, len(starts) + 1, dtype=np.int64),
+        "debt_start": monthly["debt_start"][starts],
+        "interest": np.add.reduceat(monthly["interest"], starts),
+        "amortization": np.add.reduceat(monthly["amortization"], starts),
+        "debt_end": monthly["debt_end"][ends],
+    }
+
+
+def payoff_months_precise(
+    monthly: dict, monthly_payment: float, special_payment: float, special_month: int
+) -> float:
+    """Fractional number of months until a monthly schedule is repaid.
+
+    The fraction of the final month is the share of that month's full
+    amortization needed to clear the remaining debt.
+
+    Returns:
+        Months as a float, or ``inf`` if the debt is not repaid within the
+        schedule.
+    """
+    paid = monthly["debt_end"] <= 0
+    if not paid.any():
+        return np.inf
+    index = int(paid.argmax())
+    debt_before = monthly["debt_start"][index]
+    full_amortization = monthly_payment - monthly["interest"][index]
+    if index % MONTHS_PER_YEAR == special_month - 1:
+        full_amortization += special_payment
+    if full_amortization <= 0:
+        return float(index + 1)
+    return index + float(debt_before / full_amortization)
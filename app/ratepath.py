@@ -0,0 +1,191 @@
+"""
+Interest Rate Path Engine
+Amortization under piecewise-constant interest rate paths
+
+A rate path is a sequence of segments ``(years, interest_rate)`` with the
+rate in percent, e.g. ``[(10, 3.5), (5, 4.2), (None, 5.0)]`` for ten years
+at 3.5%, five years at 4.2% and 5.0% afterwards.  The last segment always
+continues until the end of the horizon, so its length may be ``None``.
+
+Within a segment the rate is constant and the debt follows the closed-form
+annuity formula (annuity.debt_after_array); each segment starts from the
+debt left by the previous one.  Many candidate paths are evaluated together:
+segments are aligned by position and every segment is one broadcast
+evaluation over all paths and years.
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+import annuity
+import kernels
+
+# Same horizon as FinancingCalculator.calculate_payoff_years
+MAX_YEARS = 100
+
+Segment = Tuple[int, float]
+
+
+def _segment_table(paths: Sequence[Sequence[Segment]], years: int) -> tuple:
+    """Start years, lengths and rates (as fractions) of every path segment.
+
+    Returns:
+        Three (paths × segments) arrays. Paths with fewer segments are padded
+        with empty segments that start at the horizon.
+    """
+    if len(paths) == 0:
+        raise ValueError("At least one rate path is required")
+    segments = max(len(path) for path in paths)
+    starts = np.full((len(paths), segments), years, dtype=np.int64)
+    lengths = np.zeros((len(paths), segments), dtype=np.int64)
+    rates = np.zeros((len(paths), segments))
+
+    for row, path in enumerate(paths):
+        if len(path) == 0:
+            raise ValueError(f"Rate path {row} has no segments")
+        start = 0
+        for column, (length, rate) in enumerate(path):
+            last = column == len(path) - 1
+            if length is None:
+                if not last:
+                    raise ValueError(
+                        f"Only the last segment of rate path {row} may be open-ended"
+                    )
+            elif length <= 0:
+                raise ValueError(f"Segment lengths must be positive (path {row})")
+            # The last segment continues until the end of the horizon
+            end = years if last else min(start + int(length), years)
+            starts[row, column] = min(start, years)
+            lengths[row, column] = max(end - start, 0)
+            rates[row, column] = rate / 100
+            start = end
+    return starts, lengths, rates
+
+
+def rate_path_arrays(
+    principal, payment, paths: Sequence[Sequence[Segment]], years: int
+) -> dict:
+    """Yearly schedules for several rate paths at once.
+
+    Args:
+        principal: Loan amount at the start (€), scalar or one per path
+        payment: Total annual payment including special payments (€),
+            scalar or one per path
+        paths: Rate paths as sequences of (years, interest rate in percent)
+        years: Number of years to generate
+
+    Returns:
+        Dictionary with ``year`` (int64, length ``years``) and
+        (paths × years) float64 arrays ``rate`` (fraction), ``debt_start``,
+        ``interest``, ``amortization`` and ``debt_end``. Balances stay at
+        zero once a path has repaid the loan.
+    """
+    years = max(int(years), 0)
+    starts, lengths, rates = _segment_table(paths, years)
+    count = len(paths)
+    principal = np.broadcast_to(np.asarray(principal, dtype=np.float64), (count,))
+    payment = np.broadcast_to(np.asarray(payment, dtype=np.float64), (count,))
+
+    year_index = np.arange(years)
+    rate = np.zeros((count, years))
+    debt_end = np.zeros((count, years))
+    segment_debt = principal.copy()
+
+    for column in range(starts.shape[1]):
+        start = starts[:, column, None]
+        length = lengths[:, column, None]
+        segment_rate = rates[:, column, None]
+        elapsed = year_index[None, :] - start + 1
+        in_segment = (elapsed >= 1) & (elapsed <= length)
+
+        # Closed form within the segment, evaluated for every year at once
+        debt = annuity.debt_after_array(
+            segment_debt[:, None], segment_rate, payment[:, None], elapsed
+        )
+        debt_end = np.where(in_segment, debt, debt_end)
+        rate = np.where(in_segment, segment_rate, rate)
+
+        segment_debt = np.maximum(
+            annuity.debt_after_array(
+                segment_debt, rates[:, column], payment, lengths[:, column]
+            ),
+            0.0,
+        )
+
+    np.maximum(debt_end, 0.0, out=debt_end)
+    debt_start = np.concatenate((principal[:, None], debt_end[:, :-1]), axis=1)[
+        :, :years
+    ]
+    interest = debt_start * rate
+    amortization = np.minimum(payment[:, None] - interest, debt_start)
+
+    return {
+        "year": np.arange(1, years + 1, dtype=np.int64),
+        "rate": rate,
+        "debt_start": debt_start,
+        "interest": interest,
+        "amortization": amortization,
+        "debt_end": debt_start - amortization,
+    }
+
+
+def evaluate_rate_paths(
+    principal, payment, paths: Sequence[Sequence[Segment]], max_years: int = MAX_YEARS
+) -> pd.DataFrame:
+    """Payoff figures for many rate paths in one vectorized call.
+
+    Args:
+        principal: Loan amount at the start (€), scalar or one per path
+        payment: Total annual payment including special payments (€),
+            scalar or one per path
+        paths: Rate paths as sequences of (years, interest rate in percent)
+        max_years: Horizon of the evaluation (default 100)
+
+    Returns:
+        DataFrame with one row per path:
+        - payoff_years: Year in which the debt is repaid, or max_years
+        - total_interest: Interest paid until payoff (or max_years)
+        - remaining_debt: Debt left after max_years
+    """
+    arrays = rate_path_arrays(principal, payment, paths, max_years)
+    paid = arrays["debt_end"] <= 0
+    repaid = paid.any(axis=1)
+    payoff_years = np.where(repaid, paid.argmax(axis=1) + 1, max_years)
+    remaining_debt = (
+        arrays["debt_end"][:, -1]
+        if max_years > 0
+        else np.broadcast_to(np.asarray(principal, dtype=np.float64), (len(paths),))
+    )
+    return pd.DataFrame(
+        {
+            # Interest after payoff is zero, so the full sum is the total
+            "payoff_years": payoff_years.astype(np.int64),
+            "total_interest": arrays["interest"].sum(axis=1),
+            "remaining_debt": remaining_debt,
+        }
+    )
+
+
+def evaluate_rate_matrix(principal, payment, rates) -> dict:
+    """Payoff figures for paths given as a matrix of yearly rates.
+
+    Used when the rate changes every year (e.g. simulated rate paths), where
+    there are no constant segments to evaluate in closed form.  The yearly
+    recursion runs on the selected kernel backend (kernels.rate_matrix) and
+    only the running totals are kept.
+
+    Args:
+        principal: Loan amount at the start (€), scalar or one per path
+        payment: Total annual payment including special payments (€),
+            scalar or one per path
+        rates: (paths × years) array of annual rates as fractions
+
+    Returns:
+        Dictionary of per-path arrays:
+        - payoff_years: Year in which the debt is repaid (0 if not repaid)
+        - total_interest: Interest paid over the years of the matrix
+        - remaining_debt: Debt left after the last year
+    """
+    return kernels.rate_matrix(principal, payment, rates)
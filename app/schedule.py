@@ -0,0 +1,196 @@
+"""
+Schedule Table
+Columnar (struct-of-arrays) storage for yearly amortization schedules
+
+A ScheduleTable holds one NumPy array per YearlySchedule field instead of
+one object per year.  Rows are exposed as lightweight views with
+``__slots__`` so code written against YearlySchedule entries (``entry.year``,
+``entry.debt_end``, ...) keeps working, while slicing shares the underlying
+arrays and conversions to DataFrame, CSV and JSON read whole columns at once.
+"""
+
+from typing import Dict, Iterator, List
+
+import numpy as np
+import pandas as pd
+
+# Column names, in the same order as the YearlySchedule fields
+COLUMNS = (
+    "year",
+    "debt_start",
+    "annual_payment",
+    "interest_payment",
+    "amortization",
+    "debt_end",
+)
+
+
+def _row_field(name: str) -> property:
+    """Row attribute reading a single value from the table column"""
+
+    def getter(row):
+        return row._table._columns[name][row._index].item()
+
+    return property(getter, doc=f"Value of the {name} column in this row")
+
+
+def _table_column(name: str) -> property:
+    """Table attribute returning the whole column array"""
+
+    def getter(table):
+        return table._columns[name]
+
+    return property(getter, doc=f"The {name} column as a NumPy array")
+
+
+class ScheduleRow:
+    """Read-only view of one row of a ScheduleTable.
+
+    Attribute access mirrors YearlySchedule and returns Python scalars.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "ScheduleTable", index: int):
+        self._table = table
+        self._index = index
+
+    year = _row_field("year")
+    debt_start = _row_field("debt_start")
+    annual_payment = _row_field("annual_payment")
+    interest_payment = _row_field("interest_payment")
+    amortization = _row_field("amortization")
+    debt_end = _row_field("debt_end")
+
+    def to_dict(self) -> dict:
+        """Return the row as a plain dictionary"""
+        return {name: getattr(self, name) for name in COLUMNS}
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in COLUMNS)
+        return f"ScheduleRow({values})"
+
+
+class ScheduleTable:
+    """Yearly amortization schedule stored as one array per column.
+
+    Integer indexing returns a ScheduleRow view, slicing returns a
+    ScheduleTable whose columns are views of the same arrays (no copies).
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self._columns = {name: columns[name] for name in COLUMNS}
+
+    @classmethod
+    def from_arrays(cls, arrays: dict, annual_payment: float) -> "ScheduleTable":
+        """Build a table from kernel output (see annuity.schedule_arrays).
+
+        Args:
+            arrays: Dictionary with year, debt_start, interest, amortization
+                and debt_end arrays
+            annual_payment: Regular annual payment shown for every year (€)
+        """
+        return cls(
+            {
+                "year": arrays["year"],
+                "debt_start": arrays["debt_start"],
+                "annual_payment": np.full(len(arrays["year"]), annual_payment),
+                "interest_payment": arrays["interest"],
+                "amortization": arrays["amortization"],
+                "debt_end": arrays["debt_end"],
+            }
+        )
+
+    @classmethod
+    def empty(cls) -> "ScheduleTable":
+        """Table without any rows"""
+        return cls(
+            {
+                name: np.zeros(0, dtype=np.int64 if name == "year" else np.float64)
+                for name in COLUMNS
+            }
+        )
+
+    year = _table_column("year")
+    debt_start = _table_column("debt_start")
+    annual_payment = _table_column("annual_payment")
+    interest_payment = _table_column("interest_payment")
+    amortization = _table_column("amortization")
+    debt_end = _table_column("debt_end")
+
+    def __len__(self) -> int:
+        return len(self._columns["year"])
+
+    def __iter__(self) -> Iterator[ScheduleRow]:
+        for index in range(len(self)):
+            yield ScheduleRow(self, index)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return ScheduleTable(
+                {name: column[key] for name, column in self._columns.items()}
+            )
+        index = int(key)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("schedule index out of range")
+        return ScheduleRow(self, index)
+
+    def __repr__(self) -> str:
+        return f"ScheduleTable(years={len(self)})"
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column arrays in bytes"""
+        return sum(column.nbytes for column in self._columns.values())
+
+    def read_only(self) -> "ScheduleTable":
+        """Table whose columns are read-only views of the same arrays.
+
+        Such a table can be shared between threads and cached: writes to
+        its columns raise ValueError.
+        """
+        columns = {}
+        for name, column in self._columns.items():
+            view = column.view()
+            view.flags.writeable = False
+            columns[name] = view
+        return ScheduleTable(columns)
+
+    def to_dict(self) -> Dict[str, list]:
+        """Return the columns as lists of Python scalars"""
+        return {name: column.tolist() for name, column in self._columns.items()}
+
+    def to_records(self) -> List[dict]:
+        """Return one dictionary per year, e.g. for JSON export"""
+        columns = self.to_dict()
+        return [dict(zip(COLUMNS, values)) for values in zip(*columns.values())]
+
+    def to_dataframe(
+        self, column_names: Dict[str, str] = None, copy: bool = True
+    ) -> pd.DataFrame:
+        """Build a DataFrame directly from the column arrays.
+
+        Args:
+            column_names: Optional mapping from column to DataFrame label,
+                applied when the frame is built (no rename afterwards)
+            copy: With False the DataFrame wraps the column arrays without
+                copying them; writes to the frame then reach the table, or
+                raise ValueError for a read-only table
+        """
+        column_names = column_names or {}
+        return pd.DataFrame(
+            {
+                column_names.get(name, name): column
+                for name, column in self._columns.items()
+            },
+            copy=copy,
+        )
+
+    def to_csv(self, path_or_buf=None, column_names: Dict[str, str] = None, **kwargs):
+        """Write the table as CSV (see pandas.DataFrame.to_csv)"""
+        kwargs.setdefault("index", False)
+        return self.to_dataframe(column_names).to_csv(path_or_buf, **kwargs)
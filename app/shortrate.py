@@ -0,0 +1,295 @@
+"""
+Short-Rate Models
+Vasicek / Hull-White one-factor models for refinancing risk
+
+The short rate follows the mean-reverting process
+
+    dr = a * (θ(t) - r) dt + σ dW
+
+with mean reversion ``a``, volatility ``σ`` and long-run level ``θ``
+(constant for Vasicek, time-dependent for Hull-White).  Rates and
+volatility are in percent, like FinancingInput.interest_rate.
+
+Paths are generated with the exact discretization
+
+    r_n = b * r_{n-1} + (1 - b) * θ_n + s * ε_n,   b = exp(-a Δt)
+
+which is a linear recursion and is evaluated for all paths and time steps
+at once with blocked cumulative sums instead of a loop over steps.
+Simulations take a seed (or NumPy generator) and replay exactly.
+"""
+
+from dataclasses import dataclass
+import math
+from statistics import NormalDist
+from typing import Sequence, Union
+
+import numpy as np
+
+from calculator import FinancingInput
+import montecarlo
+
+# Largest exponent used when rescaling a block of the recursion
+_MAX_BLOCK_EXPONENT = 50.0
+
+
+def _linear_recursion(initial, factor: float, increments: np.ndarray) -> np.ndarray:
+    """Evaluate x_n = factor * x_{n-1} + c_n for all paths and steps.
+
+    Within a block x_{s+j} = factor^j * (x_s + Σ_k factor^-k c_k), so every
+    block is one cumulative sum.  Blocks keep factor^-k within exp(50).
+
+    Args:
+        initial: x_0, scalar or one value per path
+        factor: Recursion factor b (0 < b <= 1)
+        increments: (paths × steps) array of c_n
+
+    Returns:
+        (paths × steps) array of x_1 ... x_steps
+    """
+    paths, steps = increments.shape
+    state = np.array(np.broadcast_to(initial, (paths,)), dtype=np.float64)
+    if factor == 1:
+        return state[:, None] + np.cumsum(increments, axis=1)
+
+    block = max(1, int(_MAX_BLOCK_EXPONENT / -math.log(factor)))
+    result = np.empty((paths, steps))
+    for start in range(0, steps, block):
+        chunk = increments[:, start:start + block]
+        powers = factor ** np.arange(1, chunk.shape[1] + 1)
+        result[:, start:start + chunk.shape[1]] = powers * (
+            state[:, None] + np.cumsum(chunk / powers, axis=1)
+        )
+        state = result[:, start + chunk.shape[1] - 1]
+    return result
+
+
+@dataclass(frozen=True)
+class ShortRateModel:
+    """One-factor Vasicek / Hull-White short-rate model (rates in percent).
+
+    ``long_run_rate`` is a scalar for Vasicek, or one level per time step
+    for Hull-White (see ShortRateModel.hull_white).
+    """
+
+    mean_reversion: float  # a, per year
+    volatility: float  # σ, percentage points per sqrt(year)
+    long_run_rate: Union[float, Sequence[float]]  # θ, percent
+    steps_per_year: int = 1
+
+    def __post_init__(self):
+        if self.mean_reversion < 0:
+            raise ValueError("mean_reversion must not be negative")
+        if self.volatility < 0:
+            raise ValueError("volatility must not be negative")
+        if self.steps_per_year < 1:
+            raise ValueError("steps_per_year must be at least 1")
+
+    @property
+    def _step(self) -> tuple:
+        """(b, s): decay factor and shock size of one time step"""
+        dt = 1.0 / self.steps_per_year
+        factor = math.exp(-self.mean_reversion * dt)
+        if self.mean_reversion == 0:
+            return factor, self.volatility * math.sqrt(dt)
+        variance = (1 - factor**2) / (2 * self.mean_reversion)
+        return factor, self.volatility * math.sqrt(variance)
+
+    def _levels(self, steps: int) -> np.ndarray:
+        """Long-run level of each of the first ``steps`` time steps"""
+        levels = np.atleast_1d(np.asarray(self.long_run_rate, dtype=np.float64))
+        if levels.size == 1:
+            return np.full(steps, levels[0])
+        if levels.size < steps:
+            # Hull-White levels beyond the fitted curve keep the last value
+            levels = np.concatenate((levels, np.full(steps - levels.size, levels[-1])))
+        return levels[:steps]
+
+    def simulate(self, initial_rate: float, years: int, paths: int, seed=None):
+        """Simulate short-rate paths.
+
+        Args:
+            initial_rate: Short rate today (percent)
+            years: Number of years to simulate
+            paths: Number of paths
+            seed: Seed or numpy.random.Generator for exact replay
+
+        Returns:
+            (paths × years * steps_per_year + 1) array of rates in percent,
+            starting with initial_rate at t = 0
+        """
+        rng = np.random.default_rng(seed)
+        steps = int(years) * self.steps_per_year
+        factor, shock = self._step
+        increments = (1 - factor) * self._levels(steps)[None, :] + shock * (
+            rng.standard_normal((paths, steps))
+        )
+        rates = np.empty((paths, steps + 1))
+        rates[:, 0] = initial_rate
+        rates[:, 1:] = _linear_recursion(initial_rate, factor, increments)
+        return rates
+
+    def yearly_rates(self, rng, initial_rate: float, years: int, paths: int):
+        """Rate at the start of each year, as used by the amortization kernel.
+
+        Returns:
+            (paths × years) array of rates in percent
+        """
+        grid = self.simulate(initial_rate, years, paths, seed=rng)
+        return grid[:, :years * self.steps_per_year:self.steps_per_year]
+
+    def mean(self, initial_rate: float, years: int) -> np.ndarray:
+        """Expected short rate at every time step (length steps + 1)"""
+        steps = int(years) * self.steps_per_year
+        factor, _ = self._step
+        increments = (1 - factor) * self._levels(steps)[None, :]
+        return np.concatenate(
+            ([initial_rate], _linear_recursion(initial_rate, factor, increments)[0])
+        )
+
+    def std(self, years: int) -> np.ndarray:
+        """Standard deviation of the short rate at every time step"""
+        steps = np.arange(int(years) * self.steps_per_year + 1)
+        factor, shock = self._step
+        if factor == 1:
+            return shock * np.sqrt(steps)
+        return shock * np.sqrt((1 - factor ** (2 * steps)) / (1 - factor**2))
+
+    def lattice(
+        self, initial_rate: float, years: int, quantiles=montecarlo.DEFAULT_PERCENTILES
+    ) -> np.ndarray:
+        """Rate quantiles at every time step.
+
+        Args:
+            initial_rate: Short rate today (percent)
+            years: Number of years
+            quantiles: Percentiles (0-100)
+
+        Returns:
+            (len(quantiles) × steps + 1) array of rates in percent
+        """
+        z = np.array([NormalDist().inv_cdf(q / 100) for q in quantiles])
+        return self.mean(initial_rate, years)[None, :] + z[:, None] * self.std(years)
+
+    @classmethod
+    def calibrate(cls, rates: Sequence[float], steps_per_year: int = 1):
+        """Fit a Vasicek model to an observed rate history.
+
+        Regresses r_n on r_{n-1} (ordinary least squares) and maps the
+        AR(1) coefficients to mean reversion, long-run level and volatility.
+
+        Args:
+            rates: Observed rates in percent, one per time step
+            steps_per_year: Observations per year
+
+        Returns:
+            ShortRateModel with constant long_run_rate
+        """
+        rates = np.asarray(rates, dtype=np.float64)
+        if rates.size < 3:
+            raise ValueError("At least three observations are required")
+        previous, current = rates[:-1], rates[1:]
+        slope, intercept = np.polyfit(previous, current, 1)
+        if not 0 < slope < 1:
+            raise ValueError("Rate history shows no mean reversion")
+
+        residuals = current - (slope * previous + intercept)
+        mean_reversion = -math.log(slope) * steps_per_year
+        shock = np.std(residuals, ddof=2)
+        volatility = shock * math.sqrt(2 * mean_reversion / (1 - slope**2))
+        return cls(
+            mean_reversion=mean_reversion,
+            volatility=float(volatility),
+            long_run_rate=float(intercept / (1 - slope)),
+            steps_per_year=steps_per_year,
+        )
+
+    @classmethod
+    def hull_white(
+        cls,
+        mean_reversion: float,
+        volatility: float,
+        forward_rates: Sequence[float],
+        steps_per_year: int = 1,
+    ):
+        """Hull-White model fitted to an initial forward curve.
+
+        The time-dependent level θ is chosen so that the expected short rate
+        at every step equals the forward rate plus the Hull-White convexity
+        term σ²/(2a²) * (1 - exp(-a t))².
+
+        Args:
+            mean_reversion: a (per year), must be positive
+            volatility: σ (percentage points per sqrt(year))
+            forward_rates: Instantaneous forward rates f(0, t) in percent for
+                t = 0, Δt, 2Δt, ...
+            steps_per_year: Time steps per year
+
+        Returns:
+            ShortRateModel with one long_run_rate per time step
+        """
+        if mean_reversion <= 0:
+            raise ValueError("Hull-White fitting requires positive mean_reversion")
+        forward_rates = np.asarray(forward_rates, dtype=np.float64)
+        times = np.arange(forward_rates.size) / steps_per_year
+        sigma = volatility / 100
+        convexity = (
+            sigma**2
+            / (2 * mean_reversion**2)
+            * (1 - np.exp(-mean_reversion * times)) ** 2
+            * 100
+        )
+        target = forward_rates + convexity
+
+        factor = math.exp(-mean_reversion / steps_per_year)
+        levels = (target[1:] - factor * target[:-1]) / (1 - factor)
+        return cls(
+            mean_reversion=mean_reversion,
+            volatility=volatility,
+            long_run_rate=tuple(levels.tolist()),
+            steps_per_year=steps_per_year,
+        )
+
+
+def refinancing_risk(
+    input_data: FinancingInput,
+    model: ShortRateModel,
+    paths: int = 10000,
+    initial_rate: float = None,
+    min_rate: float = 0.0,
+    max_years: int = 100,
+    seed: int = None,
+    workers: int = None,
+) -> dict:
+    """Refinancing risk at the end of the interest binding period.
+
+    The model rate is simulated from today, so its uncertainty builds up
+    over interest_binding_years; the contractual rate applies until then and
+    the simulated rate afterwards.  The model describes the follow-up loan
+    rate directly, e.g. when calibrated on a mortgage rate history.
+
+    Args:
+        input_data: Financing input
+        model: Short-rate model
+        paths: Number of simulated paths
+        initial_rate: Model rate today (percent), defaults to the current
+            interest rate
+        min_rate: Lower bound for the follow-up rate (percent)
+        max_years: Horizon of the simulation (default 100)
+        seed: Seed for exact replay
+        workers: Worker processes, see montecarlo.run_monte_carlo
+
+    Returns:
+        Dictionary as returned by montecarlo.run_monte_carlo
+    """
+    return montecarlo.run_monte_carlo(
+        input_data,
+        paths=paths,
+        model=model,
+        start_rate=input_data.interest_rate if initial_rate is None else initial_rate,
+        min_rate=min_rate,
+        max_years=max_years,
+        seed=seed,
+        workers=workers,
+        simulate_binding_period=True,
+    )
@@ -0,0 +1,286 @@
+"""
+Goal-Seek Solver
+Finds the value of one FinancingInput field that reaches a target KPI
+
+Answers questions such as "which initial amortization pays the loan off in
+exactly 25 years?" or "which equity keeps the monthly payment at €1,500?".
+Supported targets:
+
+- ``monthly_payment``: Monthly payment (€)
+- ``payoff_years``: Payoff time in years (fractional, see
+  FinancingCalculator.calculate_payoff_years_precise)
+- ``remaining_debt``: Debt left after ``years`` years (€)
+- ``total_interest``: Interest paid until payoff, or during ``years`` years
+
+Where the target can be inverted analytically (the monthly payment, and the
+debt after a whole number of years for payment-based fields where the
+closed-form annuity engine describes the schedule) the closed form is used.
+Everything else is solved with a bracketed secant/bisection iteration that
+evaluates FinancingCalculator and stops after at most ``max_evaluations``
+evaluations.
+"""
+
+from dataclasses import replace
+import math
+
+from calculator import FinancingCalculator, FinancingInput
+
+TARGETS = ("monthly_payment", "payoff_years", "remaining_debt", "total_interest")
+
+SOLVABLE_FIELDS = (
+    "purchase_price",
+    "equity",
+    "interest_rate",
+    "initial_amortization",
+    "annual_special_payment",
+)
+
+DEFAULT_TOLERANCE = 1e-6
+DEFAULT_MAX_EVALUATIONS = 100
+
+
+def _default_bounds(input_data: FinancingInput, field: str) -> tuple:
+    """Search interval used when no bounds are given"""
+    loan_amount = input_data.purchase_price - input_data.equity
+    if field == "purchase_price":
+        return input_data.equity, input_data.equity + 100 * max(loan_amount, 1.0)
+    if field == "equity":
+        return 0.0, input_data.purchase_price
+    if field == "interest_rate":
+        return 0.0, 30.0
+    if field == "initial_amortization":
+        return 0.0, 100.0
+    return 0.0, max(loan_amount, 0.0)
+
+
+def evaluate_target(
+    input_data: FinancingInput, target: str, years: int = None
+) -> float:
+    """Value of a target KPI for the given input.
+
+    Args:
+        input_data: Financing input
+        target: One of TARGETS
+        years: Horizon for remaining_debt (required) and total_interest
+            (defaults to the payoff years)
+
+    Returns:
+        The KPI as a float
+    """
+    if target not in TARGETS:
+        raise ValueError(f"Unknown target: {target}")
+    calculator = FinancingCalculator(input_data)
+    if target == "monthly_payment":
+        return calculator.monthly_payment
+    if target == "payoff_years":
+        return calculator.calculate_payoff_years_precise()
+    if target == "remaining_debt":
+        if years is None:
+            raise ValueError("remaining_debt requires years")
+        return calculator.get_summary(years)["remaining_debt"]
+    if years is None:
+        years = calculator.calculate_payoff_years()
+    return calculator.get_summary(years)["total_interest"]
+
+
+def _monthly_payment_solution(input_data: FinancingInput, field: str, value, years):
+    """Field value giving a monthly payment of ``value``"""
+    loan_amount = input_data.purchase_price - input_data.equity
+    rate = input_data.interest_rate / 100
+    amortization = input_data.initial_amortization / 100
+    annual_payment = 12 * value
+    if field in ("initial_amortization", "interest_rate") and loan_amount <= 0:
+        # Without a loan the payment is zero whatever the rate
+        return None
+    if field == "initial_amortization":
+        return (annual_payment / loan_amount - rate) * 100
+    if field == "interest_rate":
+        return (annual_payment / loan_amount - amortization) * 100
+    if field not in ("equity", "purchase_price") or rate + amortization <= 0:
+        return None
+    required_loan = annual_payment / (rate + amortization)
+    if field == "equity":
+        return input_data.purchase_price - required_loan
+    return input_data.equity + required_loan
+
+
+def _debt_solution(input_data: FinancingInput, field: str, horizon: int, debt):
+    """Payment-based field value leaving ``debt`` after ``horizon`` years"""
+    if not FinancingCalculator(input_data)._has_closed_form():
+        return None
+    if field not in ("initial_amortization", "annual_special_payment"):
+        return None
+    loan_amount = input_data.purchase_price - input_data.equity
+    if loan_amount <= 0:
+        return None
+    rate = input_data.interest_rate / 100
+    amortization = input_data.initial_amortization / 100
+
+    # debt_n = D0 + (D0 * r - payment) * F  with  F = ((1 + r)^n - 1) / r
+    factor = horizon if rate == 0 else math.expm1(horizon * math.log1p(rate)) / rate
+    payment = loan_amount * rate + (loan_amount - debt) / factor
+    if field == "annual_special_payment":
+        return payment - loan_amount * (rate + amortization)
+    return ((payment - input_data.annual_special_payment) / loan_amount - rate) * 100
+
+
+def _payoff_years_solution(input_data: FinancingInput, field: str, value, years):
+    """Smallest payment that clears the debt by the end of year ``value``"""
+    if not float(value).is_integer() or value < 1:
+        return None
+    return _debt_solution(input_data, field, int(value), 0.0)
+
+
+def _remaining_debt_solution(input_data: FinancingInput, field: str, value, years):
+    """Payment leaving a debt of ``value`` after whole ``years``"""
+    if years is None or years < 1:
+        return None
+    return _debt_solution(input_data, field, int(years), value)
+
+
+# Targets with an analytic inverse for some fields
+_CLOSED_FORMS = {
+    "monthly_payment": _monthly_payment_solution,
+    "payoff_years": _payoff_years_solution,
+    "remaining_debt": _remaining_debt_solution,
+}
+
+
+def _closed_form(input_data: FinancingInput, field: str, target: str, value, years):
+    """Analytic solution, or None if the target has no closed form here"""
+    if input_data.rounding is not None:
+        # Cent rounding moves the result off the float formulas; the
+        # bracketed search evaluates the cents kernel instead
+        return None
+    solution = _CLOSED_FORMS.get(target)
+    return None if solution is None else solution(input_data, field, value, years)
+
+
+def _next_candidate(low, high, f_low, f_high, width):
+    """Secant step through the bracket ends, or the midpoint"""
+    midpoint = (low + high) / 2
+    if high - low > width / 2 or f_high == f_low:
+        # The previous step did not halve the bracket
+        return midpoint
+    secant = high - f_high * (high - low) / (f_high - f_low)
+    return secant if low < secant < high else midpoint
+
+
+def _bracketed_root(func, low, high, tolerance, max_evaluations, exact_boundary):
+    """Root of a monotone function on [low, high].
+
+    Takes secant steps through the bracket ends and falls back to bisection
+    whenever a step leaves the bracket or fails to halve it, so the bracket
+    shrinks at least geometrically.  With ``exact_boundary`` the iteration
+    converges to the edge of a region where the function is exactly zero
+    (e.g. the smallest payment that clears the debt).
+
+    Returns:
+        (x, f(x), evaluations)
+    """
+    f_low, f_high = func(low), func(high)
+    evaluations = 2
+    if (f_low > 0) == (f_high > 0):
+        raise ValueError("Target is not reachable within the bounds")
+    if not exact_boundary and min(abs(f_low), abs(f_high)) <= tolerance:
+        return (low, f_low, 2) if abs(f_low) <= tolerance else (high, f_high, 2)
+
+    x_tolerance = 1e-12 * max(1.0, abs(low), abs(high))
+    x, f_x = (low, f_low) if abs(f_low) < abs(f_high) else (high, f_high)
+    width = 2 * (high - low)
+    while evaluations < max_evaluations and high - low > x_tolerance:
+        candidate = _next_candidate(low, high, f_low, f_high, width)
+        width = high - low
+
+        x, f_x = candidate, func(candidate)
+        evaluations += 1
+        if not exact_boundary and abs(f_x) <= tolerance:
+            break
+        if (f_x > 0) == (f_low > 0):
+            low, f_low = x, f_x
+        else:
+            high, f_high = x, f_x
+
+    if exact_boundary:
+        # Report the end of the bracket inside the zero region
+        x, f_x = (low, f_low) if f_low <= 0 else (high, f_high)
+    return x, f_x, evaluations
+
+
+def solve(
+    input_data: FinancingInput,
+    field: str,
+    target: str,
+    value: float,
+    years: int = None,
+    bounds: tuple = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_evaluations: int = DEFAULT_MAX_EVALUATIONS,
+) -> dict:
+    """Find the value of ``field`` for which ``target`` equals ``value``.
+
+    Args:
+        input_data: Financing input providing all other fields
+        field: Input field to solve for, one of SOLVABLE_FIELDS
+        target: KPI to match, one of TARGETS
+        value: Desired KPI value
+        years: Horizon for remaining_debt and total_interest
+        bounds: (low, high) search interval for the field; defaults to a
+            range that covers all sensible inputs
+        tolerance: Accepted absolute deviation of the KPI
+        max_evaluations: Upper bound on KPI evaluations of the iteration
+
+    Returns:
+        Dictionary with:
+        - value: Solved field value
+        - input: FinancingInput with the solved value
+        - achieved: KPI at the solution
+        - method: "closed_form" or "bracketed"
+        - evaluations: Number of KPI evaluations
+
+    Raises:
+        ValueError: For unknown fields or targets, for annual_special_payment
+            when special_payments are set, or if the target cannot be reached
+            within the bounds
+    """
+    if field not in SOLVABLE_FIELDS:
+        raise ValueError(f"Cannot solve for field: {field}")
+    if target not in TARGETS:
+        raise ValueError(f"Unknown target: {target}")
+    if target == "remaining_debt" and years is None:
+        raise ValueError("remaining_debt requires years")
+    if field == "annual_special_payment" and input_data.special_payments is not None:
+        # special_payments replace annual_special_payment in the schedule
+        raise ValueError(
+            "Cannot solve for annual_special_payment with special_payments"
+        )
+    low, high = _default_bounds(input_data, field) if bounds is None else bounds
+
+    def kpi(x):
+        return evaluate_target(replace(input_data, **{field: x}), target, years)
+
+    solution = _closed_form(input_data, field, target, value, years)
+    if solution is not None:
+        if not low <= solution <= high:
+            raise ValueError("Target is not reachable within the bounds")
+        method, evaluations = "closed_form", 0
+    else:
+        exact_boundary = target == "remaining_debt" and value <= 0
+        solution, _, evaluations = _bracketed_root(
+            lambda x: kpi(x) - value,
+            low,
+            high,
+            tolerance,
+            max_evaluations,
+            exact_boundary,
+        )
+        method = "bracketed"
+
+    solved_input = replace(input_data, **{field: solution})
+    return {
+        "value": solution,
+        "input": solved_input,
+        "achieved": evaluate_target(solved_input, target, years),
+        "method": method,
+        "evaluations": evaluations,
+    }
@@ -0,0 +1,115 @@
+"""
+Special Payment Optimizer
+Allocation of special payments (Sondertilgungen) under annual caps
+
+German loan contracts usually allow special payments of at most a fixed
+share of the original loan per year (typically 5%).  Given the money that
+becomes available over time, this module finds the special payment of every
+year that minimizes the total interest and the payoff time.
+
+Both objectives have the same optimum, found greedily: pay as much as the
+cap and the money available so far allow, as early as possible.  Proof: let
+S_t be the cumulative special payments after year t.  Every feasible plan
+has S_t <= S_{t-1} + cap_t and S_t <= B_t (money available up to year t),
+so by induction no plan pays more by any year than the greedy plan with
+S_t = min(S_{t-1} + cap_t, B_t).  With g = 1 + rate, the debt after year t
+is
+
+    debt_t = g^t * debt_0 - sum_{i<=t} g^(t-i) * (payment + s_i)
+
+and summation by parts turns the special payment term into
+S_t + sum_{i<t} S_i * (g^(t-i) - g^(t-i-1)), which grows with every S_i
+because g >= 1.  The greedy plan therefore has the lowest debt in every year,
+hence the lowest interest of every year and the earliest payoff.
+
+The greedy recursion has a closed form (a running minimum), so the
+allocation costs a few array operations; the result is evaluated once with
+FinancingInput.special_payments, including the interest savings against the
+loan without special payments.
+"""
+
+from dataclasses import replace
+
+import numpy as np
+
+from calculator import FinancingCalculator, FinancingInput
+
+# Contractual cap on special payments per year, in percent of the loan
+DEFAULT_CAP_PERCENTAGE = 5.0
+
+
+def greedy_allocation(liquidity, caps) -> np.ndarray:
+    """Largest special payments the liquidity and caps allow, paid early.
+
+    Args:
+        liquidity: Money becoming available in every year (€); money not
+            spent carries over to later years
+        caps: Largest special payment of every year (€), scalar or per year
+
+    Returns:
+        Special payment of every year (€)
+    """
+    liquidity = np.asarray(liquidity, dtype=np.float64)
+    caps = np.broadcast_to(np.asarray(caps, dtype=np.float64), liquidity.shape)
+    available = np.cumsum(liquidity)
+    cap_total = np.cumsum(caps)
+    # S_t = min(S_{t-1} + cap_t, B_t), solved for all years at once
+    paid = cap_total + np.minimum(np.minimum.accumulate(available - cap_total), 0.0)
+    return np.diff(paid, prepend=0.0)
+
+
+def optimize_special_payments(
+    input_data: FinancingInput,
+    liquidity,
+    cap_percentage=DEFAULT_CAP_PERCENTAGE,
+) -> dict:
+    """Special payments that minimize total interest and payoff time.
+
+    The special payments of input_data (annual_special_payment and
+    special_payments) are replaced by the optimized allocation.
+
+    Args:
+        input_data: Financing input
+        liquidity: Money available for special payments in every year (€),
+            year 1 first; money not spent carries over. Its length is the
+            planning horizon.
+        cap_percentage: Largest special payment per year in percent of the
+            loan amount, scalar or one per year
+
+    Returns:
+        Dictionary with:
+        - special_payments: Special payment of every year (€), zero after
+          payoff; the kernels cap the payoff year's amount at the debt
+        - unused_liquidity: Money not spent by the end of every year (€)
+        - input: FinancingInput with the special payments
+        - payoff_years, payoff_years_precise, total_interest
+        - interest_savings, interest_without_special, interest_with_special,
+          time_saved_years: As in get_summary
+
+    Raises:
+        ValueError: For negative liquidity or caps
+    """
+    liquidity = np.atleast_1d(np.asarray(liquidity, dtype=np.float64))
+    loan_amount = input_data.purchase_price - input_data.equity
+    caps = np.asarray(cap_percentage, dtype=np.float64) / 100 * loan_amount
+    if (liquidity < 0).any() or (caps < 0).any():
+        raise ValueError("Liquidity and caps must not be negative")
+
+    allocation = greedy_allocation(liquidity, caps)
+    optimized = replace(
+        input_data, annual_special_payment=0.0, special_payments=allocation
+    )
+    payoff_years = FinancingCalculator(optimized).calculate_payoff_years()
+    allocation[payoff_years:] = 0.0
+    optimized = replace(optimized, special_payments=allocation)
+
+    calculator = FinancingCalculator(optimized)
+    return {
+        "special_payments": allocation,
+        "unused_liquidity": np.cumsum(liquidity) - np.cumsum(allocation),
+        "input": optimized,
+        "payoff_years": payoff_years,
+        "payoff_years_precise": calculator.calculate_payoff_years_precise(),
+        "total_interest": calculator.get_summary(payoff_years)["total_interest"],
+        **calculator.evaluate_kpis(["interest_savings"]),
+    }
@@ -0,0 +1,204 @@
+"""
+Lazy Summary Mapping
+Financing summary whose KPI groups are computed on first access
+
+FinancingCalculator.get_summary returns about thirty KPIs, but most callers
+read only a few of them (the affordability tab needs the monthly payment,
+exports need the totals).  A Summary declares its keys up front together
+with the function computing each group of keys.  A group is evaluated the
+first time one of its keys is read and kept afterwards, so callers only pay
+for the KPIs they use.
+
+Summary is a dict subclass and behaves like the plain dict get_summary used
+to return: iteration follows the declared key order, ``in`` and ``len`` do
+not compute anything, and ``items()``, ``values()``, ``==``, ``json.dumps``
+and ``dict(summary)`` evaluate all remaining groups.
+
+KPI values are shared by all summaries of a calculator (and through the
+result cache), so nested values are read-only: series are tuples of
+ReadOnlyDict rows.
+"""
+
+from collections.abc import ItemsView, KeysView, ValuesView
+from typing import Callable, Sequence, Tuple
+import threading
+
+Group = Tuple[Sequence[str], Callable[[], dict]]
+
+
+class ReadOnlyDict(dict):
+    """Dictionary that rejects changes (TypeError).
+
+    A dict subclass, so it still compares equal to plain dicts and
+    serializes with json.dumps; copy() and dict(...) return writable copies.
+    """
+
+    def _reject(self, *args, **kwargs):
+        raise TypeError("ReadOnlyDict is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _reject
+    pop = popitem = setdefault = update = clear = _reject
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ReadOnlyDict({dict.__repr__(self)})"
+
+    def __reduce__(self):
+        return ReadOnlyDict, (dict(self),)
+
+    def copy(self) -> dict:
+        return dict(self)
+
+
+class Summary(dict):
+    """Dictionary of KPIs that computes each group of keys on first access.
+
+    Args:
+        groups: Sequence of (keys, compute) pairs in key order; compute takes
+            no arguments and returns a dict with (at least) those keys. It may
+            read other keys of the summary.
+        read_only: Reject changes by callers (TypeError), e.g. for summaries
+            that are cached and shared between threads
+    """
+
+    def __init__(self, groups: Sequence[Group], read_only: bool = False):
+        super().__init__()
+        self.read_only = read_only
+        self._order = []
+        self._group_of = {}
+        self._computes = []
+        for keys, compute in groups:
+            for key in keys:
+                self._group_of[key] = len(self._computes)
+                self._order.append(key)
+            self._computes.append(compute)
+        self._pending = set(self._order)
+        self._lock = threading.RLock()
+
+    def _evaluate(self, group: int):
+        """Compute a group and store the keys that are still pending"""
+        with self._lock:
+            compute = self._computes[group]
+            if compute is None:
+                return
+            for key, value in compute().items():
+                # Keys set or deleted by the caller in the meantime stay so
+                if key in self._pending:
+                    dict.__setitem__(self, key, value)
+                    self._pending.discard(key)
+            self._computes[group] = None
+
+    def __missing__(self, key):
+        if key not in self._pending:
+            raise KeyError(key)
+        self._evaluate(self._group_of[key])
+        return dict.__getitem__(self, key)
+
+    def _check_writable(self):
+        if self.read_only:
+            raise TypeError("Summary is read-only")
+
+    def is_evaluated(self, key: str) -> bool:
+        """Whether the value of a key is available without computing it"""
+        return dict.__contains__(self, key)
+
+    def to_dict(self) -> dict:
+        """Plain dictionary with every KPI computed"""
+        return {key: self[key] for key in self}
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or key in self._pending
+
+    def __iter__(self):
+        for key in self._order:
+            if key in self:
+                yield key
+        # Keys added by the caller come last, in insertion order
+        for key in dict.keys(self):
+            if key not in self._group_of:
+                yield key
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._pending)
+
+    def __setitem__(self, key, value):
+        self._check_writable()
+        self._pending.discard(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._check_writable()
+        if key in self._pending:
+            self._pending.discard(key)
+        else:
+            dict.__delitem__(self, key)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, dict):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Summary({dict.__repr__(self)}, pending={sorted(self._pending)})"
+
+    def __reduce__(self):
+        return dict, (self.to_dict(),)
+
+    def keys(self):
+        return KeysView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key, *default):
+        self._check_writable()
+        if key in self:
+            value = self[key]
+            dict.__delitem__(self, key)
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._check_writable()
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        self._check_writable()
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def popitem(self):
+        self._check_writable()
+        keys = list(self)
+        if not keys:
+            raise KeyError("popitem(): summary is empty")
+        return keys[-1], self.pop(keys[-1])
+
+    def clear(self):
+        self._check_writable()
+        self._pending.clear()
+        dict.clear(self)
+
+    def copy(self) -> dict:
+        return self.to_dict()
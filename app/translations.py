@@ -101,6 +101,8 @@ TRANSLATIONS = {
         "breakeven_milestone": "Breakeven Milestone (Principal > Interest)",
         "equity_buildup": "Equity Buildup Rate",
         "equity_buildup_progression": "Equity Growth Over Time",
+        "sensitivity_heatmap": "Sensitivity: Interest Rate × Amortization",
+        "affordability_curve": "Years to Payoff by Income Share",
         "year_breakeven": "Year",
         "not_reached": "Not Reached",
         "housing_expense_ratio": "Housing Expense Ratio",
@@ -111,6 +113,7 @@ TRANSLATIONS = {
         "equity_gained_per_year": "Equity Gained per Year",
         "cumulative_equity": "Cumulative Equity",
         "equity_percentage": "Equity Percentage",
+        "equity_milestones": "Equity Milestones",
         # Tooltips for KPIs
         "tooltip_loan_amount": """**Loan Amount**
 The total amount you need to borrow from the bank to purchase the property.
@@ -379,6 +382,8 @@ How many years needed to fully pay off the loan with your affordable payment.
         "breakeven_milestone": "Break-Even-Meilenstein (Tilgung > Zinsen)",
         "equity_buildup": "Eigenkapitalaufbau-Rate",
         "equity_buildup_progression": "Eigenkapitalwachstum über die Zeit",
+        "sensitivity_heatmap": "Sensitivität: Sollzins × Tilgung",
+        "affordability_curve": "Laufzeit nach Einkommensanteil",
         "year_breakeven": "Jahr",
         "not_reached": "Nicht erreicht",
         "housing_expense_ratio": "Wohnkosten-Einkommens-Verhältnis",
@@ -389,6 +394,7 @@ How many years needed to fully pay off the loan with your affordable payment.
         "equity_gained_per_year": "Eigenkapitalzuwachs pro Jahr",
         "cumulative_equity": "Kumuliertes Eigenkapital",
         "equity_percentage": "Eigenkapitalquote",
+        "equity_milestones": "Eigenkapital-Meilensteine",
         # Tooltips für KPIs (German)
         "tooltip_loan_amount": """**Darlehensbetrag**
 Der Gesamtbetrag, den Sie von der Bank leihen müssen, um die Immobilie zu kaufen.
@@ -563,6 +569,17 @@ Wie viele Jahre benötigt werden, um das Darlehen mit Ihrer leistbaren Rate voll
 }
 
 
+# Translation keys of the schedule table columns (see schedule.COLUMNS)
+SCHEDULE_COLUMN_KEYS = {
+    "year": "table_year",
+    "debt_start": "table_beginning_debt",
+    "annual_payment": "table_annual_rate",
+    "interest_payment": "table_interest",
+    "amortization": "table_amortization",
+    "debt_end": "table_ending_debt",
+}
+
+
 def get_text(lang, key):
     """Get translated text for a given language and key"""
     if lang not in TRANSLATIONS:
@@ -575,3 +592,10 @@ def get_all_texts(lang):
     if lang not in TRANSLATIONS:
         lang = "en"
     return TRANSLATIONS.get(lang, {})
+
+
+def get_schedule_columns(lang):
+    """Get the translated schedule table labels, keyed by schedule column"""
+    return {
+        column: get_text(lang, key) for column, key in SCHEDULE_COLUMN_KEYS.items()
+    }
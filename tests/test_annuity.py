@@ -0,0 +1,333 @@
+"""
+Unit tests for the closed-form annuity engine
+Checks the analytic results against the year-by-year reference loops
+"""
+
+import math
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import annuity
+from calculator import FinancingCalculator, FinancingInput
+
+
+SCENARIOS = [
+    # purchase_price, equity, interest_rate, initial_amortization, special
+    (300000, 60000, 4.5, 3.0, 0),
+    (500000, 50000, 4.0, 2.0, 0),
+    (400000, 50000, 3.5, 2.0, 2000),
+    (200000, 0, 4.0, 10.0, 0),
+    (250000, 50000, 0.0, 2.0, 0),
+    (250000, 50000, 0.0, 2.5, 1500),
+    (1000000, 50000, 7.5, 1.0, 0),
+    (50000, 45000, 4.5, 3.0, 0),
+    (300000, 60000, 2.0, 0.5, 0),
+    (300000, 60000, 3.0, 2.0, 50000),
+    (100000, 100000, 4.5, 3.0, 0),
+    (300000, 60000, 5.0, 0.0, 0),
+]
+
+
+def _calculator(scenario):
+    price, equity, rate, amort, special = scenario
+    return FinancingCalculator(
+        FinancingInput(
+            purchase_price=price,
+            equity=equity,
+            interest_rate=rate,
+            initial_amortization=amort,
+            annual_special_payment=special,
+        )
+    )
+
+
+class TestAnnuityFormulas:
+    """Tests for the module-level closed-form helpers"""
+
+    def test_debt_after_matches_recursion(self):
+        """Test the closed-form balance against an explicit recursion"""
+        debt = 240000.0
+        for year in range(1, 21):
+            debt = debt * 1.045 - 18000
+            assert annuity.debt_after(240000, 0.045, 18000, year) == pytest.approx(
+                debt
+            )
+
+    def test_zero_rate_is_linear(self):
+        """Test that a zero interest rate repays linearly"""
+        assert annuity.debt_after(100000, 0.0, 10000, 3) == 70000
+        assert annuity.payoff_year(100000, 0.0, 10000) == 10
+        assert annuity.payoff_years_precise(100000, 0.0, 8000) == pytest.approx(12.5)
+
+    def test_infeasible_payment_detected(self):
+        """Test that payments not exceeding interest are flagged up front"""
+        assert not annuity.is_feasible(240000, 0.05, 12000)
+        assert not annuity.is_feasible(240000, 0.05, 11000)
+        assert annuity.is_feasible(240000, 0.05, 12001)
+        assert annuity.payoff_year(240000, 0.05, 12000) == math.inf
+        assert annuity.payoff_years_precise(240000, 0.05, 11000) == math.inf
+
+    def test_no_debt_is_feasible(self):
+        """Test that a loan without debt is repaid in the first year"""
+        assert annuity.is_feasible(0, 0.05, 0)
+        assert annuity.payoff_year(0, 0.05, 0) == 1
+        assert annuity.remaining_debt(0, 0.05, 0, 5) == 0
+
+    def test_cumulative_interest_stops_after_payoff(self):
+        """Test that no interest accrues once the loan is repaid"""
+        payoff = annuity.payoff_year(240000, 0.045, 30000)
+        at_payoff = annuity.cumulative_interest(240000, 0.045, 30000, payoff)
+        later = annuity.cumulative_interest(240000, 0.045, 30000, payoff + 10)
+        assert later == pytest.approx(at_payoff)
+
+    def test_cumulative_amortization_plus_remaining_is_principal(self):
+        """Test that repaid and outstanding principal add up to the loan"""
+        for years in (1, 5, 10, 40):
+            repaid = annuity.cumulative_amortization(240000, 0.045, 18000, years)
+            remaining = annuity.remaining_debt(240000, 0.045, 18000, years)
+            assert repaid + remaining == pytest.approx(240000)
+
+
+class TestAnalyticMatchesIterative:
+    """Parity tests between the analytic engine and the reference loops"""
+
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    def test_payoff_years(self, scenario):
+        calc = _calculator(scenario)
+        assert calc.calculate_payoff_years() == calc.calculate_payoff_years_iterative()
+
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    def test_payoff_years_precise(self, scenario):
+        calc = _calculator(scenario)
+        assert calc.calculate_payoff_years_precise() == pytest.approx(
+            calc.calculate_payoff_years_precise_iterative()
+        )
+
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    @pytest.mark.parametrize("target", [25, 50, 75, 100])
+    def test_time_to_equity_percentage(self, scenario, target):
+        calc = _calculator(scenario)
+        assert calc._calculate_time_to_equity_percentage(target) == pytest.approx(
+            calc._calculate_time_to_equity_percentage_iterative(target)
+        )
+
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    @pytest.mark.parametrize("monthly_payment", [0, 500, 900, 1500, 4000])
+    def test_years_to_payoff(self, scenario, monthly_payment):
+        analytic = _calculator(scenario).calculate_years_to_payoff(monthly_payment)
+        iterative = _calculator(scenario).calculate_years_to_payoff_iterative(
+            monthly_payment
+        )
+        assert analytic.keys() == iterative.keys()
+        for key, value in iterative.items():
+            if isinstance(value, float):
+                assert analytic[key] == pytest.approx(value, abs=1e-6)
+            else:
+                assert analytic[key] == value
+
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    @pytest.mark.parametrize("household_income", [0, 2000, 6000])
+    def test_affordability_curve(self, scenario, household_income):
+        """Test every curve row against calculate_years_to_payoff"""
+        percentages = np.arange(5, 41)
+        curve = _calculator(scenario).calculate_affordability_curve(
+            household_income, percentages
+        )
+        assert list(curve.index) == list(percentages)
+        for percentage in percentages:
+            expected = _calculator(scenario).calculate_years_to_payoff(
+                (household_income * percentage) / 100
+            )
+            row = curve.loc[percentage]
+            assert row["feasible"] == expected["feasible"]
+            assert row["error_key"] == expected.get("error_key")
+            assert row["remaining_debt"] == pytest.approx(
+                expected["remaining_debt"], abs=1e-6
+            )
+            if expected["years_to_payoff"] is None:
+                assert pd.isna(row["years_to_payoff"])
+                assert np.isnan(row["total_interest"])
+            else:
+                assert row["years_to_payoff"] == expected["years_to_payoff"]
+                assert row["total_interest"] == pytest.approx(
+                    expected["total_interest"], abs=1e-6
+                )
+
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    @pytest.mark.parametrize("years", [0, 1, 10, 25, 60, 100])
+    def test_schedule_kernel(self, scenario, years):
+        calc = _calculator(scenario)
+        vectorized = calc.calculate_schedule(years)
+        reference = calc.calculate_schedule_iterative(years)
+        assert len(vectorized) == len(reference)
+        for fast, slow in zip(vectorized, reference):
+            assert fast.year == slow.year
+            assert fast.annual_payment == slow.annual_payment
+            assert fast.debt_start == pytest.approx(slow.debt_start, abs=1e-6)
+            assert fast.interest_payment == pytest.approx(
+                slow.interest_payment, abs=1e-6
+            )
+            assert fast.amortization == pytest.approx(slow.amortization, abs=1e-6)
+            assert fast.debt_end == pytest.approx(slow.debt_end, abs=1e-6)
+
+    def test_schedule_arrays_are_contiguous_float64(self):
+        calc = _calculator(SCENARIOS[0])
+        calc.calculate_schedule(30)
+        for key in ("debt_start", "interest", "amortization", "debt_end"):
+            column = calc.schedule_arrays[key]
+            assert column.dtype == np.float64
+            assert column.flags["C_CONTIGUOUS"]
+            assert len(column) == 30
+
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    @pytest.mark.parametrize("years", [1, 10, 25, 60])
+    def test_summary_totals_match_schedule(self, scenario, years):
+        calc = _calculator(scenario)
+        schedule = calc.calculate_schedule(years)
+        summary = calc.get_summary(years)
+        assert summary["total_interest"] == pytest.approx(
+            sum(entry.interest_payment for entry in schedule), abs=1e-6
+        )
+        assert summary["total_amortization"] == pytest.approx(
+            sum(entry.amortization for entry in schedule), abs=1e-6
+        )
+        assert summary["remaining_debt"] == pytest.approx(
+            schedule[-1].debt_end, abs=1e-6
+        )
+
+
+class TestFusedSummary:
+    """Tests for the single-pass KPI evaluation in get_summary"""
+
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    def test_matches_individual_kpi_helpers(self, scenario):
+        """Test that fused KPIs equal the year-by-year references"""
+        calc = _calculator(scenario)
+        summary = calc.get_summary(calc.calculate_payoff_years())
+
+        breakeven = _calculator(scenario)._calculate_breakeven_point()
+        time_to_50 = _calculator(scenario)._calculate_time_to_equity_percentage(50)
+        for key, value in breakeven.items():
+            if value is None:
+                assert summary[key] is None
+            else:
+                assert summary[key] == pytest.approx(value, abs=1e-6)
+        assert summary["time_to_50_equity"] == pytest.approx(time_to_50, abs=1e-6)
+
+        # Interest savings against the same loan without special payments
+        reference = _calculator(scenario)
+        with_special = reference.calculate_schedule_iterative(
+            reference.calculate_payoff_years_iterative()
+        )
+        without = _calculator((*scenario[:4], 0))
+        without_special = without.calculate_schedule_iterative(
+            without.calculate_payoff_years_iterative()
+        )
+        interest_with = sum(entry.interest_payment for entry in with_special)
+        interest_without = sum(entry.interest_payment for entry in without_special)
+        if scenario[4] == 0:
+            assert summary["interest_savings"] == 0
+            assert summary["time_saved_years"] == 0
+        else:
+            assert summary["interest_with_special"] == pytest.approx(
+                interest_with, abs=1e-6
+            )
+            assert summary["interest_without_special"] == pytest.approx(
+                interest_without, abs=1e-6
+            )
+            assert summary["time_saved_years"] == len(without_special) - len(
+                with_special
+            )
+
+        # Equity buildup: cumulative amortization on top of the equity
+        buildup = summary["equity_buildup_rate"]
+        assert len(buildup) == len(with_special)
+        equity = reference.input.equity
+        for fused, entry in zip(buildup, with_special):
+            equity += entry.amortization
+            assert fused["year"] == entry.year
+            assert fused["equity_gained"] == pytest.approx(entry.amortization)
+            assert fused["cumulative_equity"] == pytest.approx(equity)
+            assert fused["equity_percentage"] == pytest.approx(
+                equity / reference.input.purchase_price * 100
+            )
+
+    def test_single_schedule_pass(self, monkeypatch):
+        """Test that get_summary simulates the payoff schedule only once"""
+        calc = _calculator(SCENARIOS[2])
+        calc.calculate_schedule(10)
+
+        calls = []
+        original = annuity.schedule_arrays
+
+        def counting_schedule_arrays(*args):
+            calls.append(args)
+            return original(*args)
+
+        monkeypatch.setattr(annuity, "schedule_arrays", counting_schedule_arrays)
+        calc.get_summary(10)
+        assert len(calls) == 1
+
+    def test_summary_keeps_requested_schedule(self):
+        """Test that get_summary does not replace the caller's schedule"""
+        calc = _calculator(SCENARIOS[0])
+        calc.calculate_schedule(5)
+        calc.get_summary(5)
+        assert len(calc.schedule) == 5
+        assert len(calc.schedule_to_dataframe()) == 5
+
+
+class TestPayoffIndex:
+    """Tests for horizon totals served from the payoff prefix sums"""
+
+    def test_slider_moves_reuse_payoff_schedule(self, monkeypatch):
+        """Test that summaries for many horizons simulate only once"""
+        calc = _calculator(SCENARIOS[2])
+        calls = []
+        original = annuity.schedule_arrays
+
+        def counting_schedule_arrays(*args):
+            calls.append(args)
+            return original(*args)
+
+        monkeypatch.setattr(annuity, "schedule_arrays", counting_schedule_arrays)
+        for years in range(1, calc.calculate_payoff_years() + 5):
+            calc.get_summary(years)
+        assert len(calls) == 1
+        assert len(calc.schedule) == 0
+
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    @pytest.mark.parametrize("years", [0, 1, 17, 99, 100, 120])
+    def test_totals_match_closed_form(self, scenario, years):
+        calc = _calculator(scenario)
+        rate, payment = calc._annuity_terms()
+        summary = calc.get_summary(years)
+        assert summary["total_interest"] == pytest.approx(
+            annuity.cumulative_interest(calc.loan_amount, rate, payment, years),
+            abs=1e-6,
+        )
+        assert summary["total_amortization"] == pytest.approx(
+            annuity.cumulative_amortization(calc.loan_amount, rate, payment, years),
+            abs=1e-6,
+        )
+        assert summary["remaining_debt"] == pytest.approx(
+            annuity.remaining_debt(calc.loan_amount, rate, payment, years), abs=1e-6
+        )
+
+    def test_index_follows_changed_payment(self):
+        """Test that the index is rebuilt when the payment is replaced"""
+        calc = _calculator(SCENARIOS[0])
+        before = calc.get_summary(10)["total_interest"]
+        calc.calculate_years_to_payoff(3000)
+        after = calc.get_summary(10)
+        rate, payment = calc._annuity_terms()
+        assert after["total_interest"] != before
+        assert after["total_interest"] == pytest.approx(
+            annuity.cumulative_interest(calc.loan_amount, rate, payment, 10)
+        )
@@ -0,0 +1,174 @@
+"""
+Unit tests for batch scenario evaluation
+Checks evaluate_batch against the scalar FinancingCalculator
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from batch import (
+    ABSOLUTE_TOLERANCE,
+    RELATIVE_TOLERANCE,
+    evaluate_batch,
+    evaluate_sensitivity_grid,
+)
+from calculator import FinancingCalculator, FinancingInput
+from charts import create_sensitivity_heatmap
+
+
+@pytest.fixture
+def scenarios():
+    """A mix of regular, zero-rate, interest-only and no-loan scenarios"""
+    return pd.DataFrame(
+        {
+            "purchase_price": [300000, 500000, 400000, 250000, 300000, 100000, 1000000],
+            "equity": [60000, 50000, 50000, 50000, 60000, 100000, 50000],
+            "interest_rate": [4.5, 4.0, 3.5, 0.0, 5.0, 4.5, 7.5],
+            "initial_amortization": [3.0, 2.0, 2.0, 2.5, 0.0, 3.0, 1.0],
+            "annual_special_payment": [0, 0, 2000, 1500, 0, 0, 5000],
+            "interest_binding_years": [10, 10, 15, 10, 10, 10, 20],
+        },
+        index=[f"client-{i}" for i in range(7)],
+    )
+
+
+def _scalar_summary(row, years=None):
+    calculator = FinancingCalculator(FinancingInput(**row))
+    if years is None:
+        years = calculator.calculate_payoff_years()
+    return calculator.get_summary(years)
+
+
+def _assert_matches(batch_row, summary):
+    for key, expected in summary.items():
+        if key == "equity_buildup_rate":
+            continue
+        actual = batch_row[key]
+        if expected is None:
+            assert pd.isna(actual), key
+        else:
+            assert actual == pytest.approx(
+                expected, rel=RELATIVE_TOLERANCE, abs=ABSOLUTE_TOLERANCE
+            ), key
+
+
+class TestEvaluateBatch:
+    """Tests for evaluate_batch"""
+
+    def test_matches_scalar_calculator(self, scenarios):
+        """Test every KPI against get_summary at the payoff horizon"""
+        result = evaluate_batch(scenarios)
+        for label, row in scenarios.iterrows():
+            _assert_matches(result.loc[label], _scalar_summary(row.to_dict()))
+
+    @pytest.mark.parametrize("years", [1, 10, 35])
+    def test_matches_scalar_calculator_at_horizon(self, scenarios, years):
+        """Test every KPI against get_summary for a fixed horizon"""
+        result = evaluate_batch(scenarios, years=years)
+        for label, row in scenarios.iterrows():
+            _assert_matches(result.loc[label], _scalar_summary(row.to_dict(), years))
+
+    def test_columns_follow_summary_keys(self, scenarios):
+        """Test that every scalar get_summary key becomes a column"""
+        result = evaluate_batch(scenarios)
+        summary = _scalar_summary(scenarios.iloc[0].to_dict())
+        expected = [key for key in summary if key != "equity_buildup_rate"]
+        assert list(result.columns) == expected
+
+    def test_preserves_dataframe_index(self, scenarios):
+        """Test that the result is aligned with the input rows"""
+        result = evaluate_batch(scenarios)
+        assert list(result.index) == list(scenarios.index)
+
+    def test_accepts_mapping_with_broadcast_scalars(self):
+        """Test plain arrays with scalar inputs broadcast across rows"""
+        result = evaluate_batch(
+            {
+                "purchase_price": 400000,
+                "equity": 80000,
+                "interest_rate": np.array([2.0, 3.0, 4.0]),
+                "initial_amortization": 2.0,
+            }
+        )
+        assert len(result) == 3
+        assert (result["loan_amount"] == 320000).all()
+        assert result["annual_payment"].is_monotonic_increasing
+        assert (result["interest_savings"] == 0).all()
+
+    def test_missing_required_column_raises(self):
+        """Test that required FinancingInput fields must be present"""
+        with pytest.raises(ValueError, match="interest_rate"):
+            evaluate_batch(
+                {"purchase_price": [1], "equity": [0], "initial_amortization": [2]}
+            )
+
+    def test_breakeven_not_reached_is_missing(self):
+        """Test that an interest-only loan reports no breakeven year"""
+        result = evaluate_batch(
+            {
+                "purchase_price": [300000],
+                "equity": [60000],
+                "interest_rate": [5.0],
+                "initial_amortization": [0.0],
+            }
+        )
+        assert pd.isna(result["breakeven_year"].iloc[0])
+        assert result["years"].iloc[0] == 100
+
+
+class TestSensitivityGrid:
+    """Tests for evaluate_sensitivity_grid"""
+
+    @pytest.fixture
+    def input_data(self):
+        return FinancingInput(
+            purchase_price=400000,
+            equity=80000,
+            interest_rate=4.0,
+            initial_amortization=2.0,
+            annual_special_payment=2000,
+        )
+
+    @pytest.mark.parametrize("years", [None, 15])
+    def test_matches_scalar_calculator(self, input_data, years):
+        """Test every grid cell against get_summary"""
+        rates = [0.0, 1.5, 4.0, 7.5]
+        amortizations = [0.0, 1.0, 3.0]
+        grid = evaluate_sensitivity_grid(input_data, rates, amortizations, years)
+        assert grid["total_interest"].shape == (4, 3)
+
+        for i, rate in enumerate(rates):
+            for j, amortization in enumerate(amortizations):
+                calculator = FinancingCalculator(
+                    replace(
+                        input_data,
+                        interest_rate=rate,
+                        initial_amortization=amortization,
+                    )
+                )
+                payoff = calculator.calculate_payoff_years()
+                summary = calculator.get_summary(payoff if years is None else years)
+                assert grid["payoff_years"][i, j] == payoff
+                for key in ("total_interest", "remaining_debt", "monthly_payment"):
+                    assert grid[key][i, j] == pytest.approx(
+                        summary[key], rel=RELATIVE_TOLERANCE, abs=ABSOLUTE_TOLERANCE
+                    ), key
+
+    def test_heatmap(self, input_data):
+        """Test that the heatmap shows the grid with rates on the y-axis"""
+        grid = evaluate_sensitivity_grid(
+            input_data, np.linspace(1, 6, 6), np.linspace(1, 4, 4)
+        )
+        fig = create_sensitivity_heatmap(grid, lambda key: key, "payoff_years")
+        heatmap = fig.data[0]
+        np.testing.assert_array_equal(heatmap.z, grid["payoff_years"])
+        np.testing.assert_array_equal(heatmap.y, grid["interest_rate"])
+        assert fig.layout.title.text == "sensitivity_heatmap"
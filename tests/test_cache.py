@@ -0,0 +1,284 @@
+"""
+Unit tests for the result cache
+Tests canonical keys, LRU eviction, byte budget and the cached helpers
+"""
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import annuity
+from cache import (
+    CanonicalInput,
+    ResultCache,
+    _estimate_size,
+    cached_affordability,
+    cached_affordability_curve,
+    cached_payoff_years,
+    cached_schedule,
+    cached_schedule_dataframe,
+    cached_sensitivity_grid,
+    cached_summary,
+    cached_years_to_payoff,
+    result_cache,
+)
+from calculator import SCHEDULE_DATAFRAME_COLUMNS, FinancingCalculator, FinancingInput
+from translations import get_schedule_columns, get_text
+
+
+def _input(**overrides):
+    values = dict(
+        purchase_price=300000,
+        equity=60000,
+        interest_rate=4.5,
+        initial_amortization=3.0,
+        annual_special_payment=0,
+        interest_binding_years=10,
+    )
+    values.update(overrides)
+    return FinancingInput(**values)
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_cache():
+    result_cache.invalidate()
+    yield
+    result_cache.invalidate()
+
+
+class TestCanonicalInput:
+    """Tests for the frozen cache key"""
+
+    def test_equal_values_hash_equal(self):
+        """Test that int/float and signed zero variants share one key"""
+        a = CanonicalInput.from_input(
+            _input(purchase_price=300000, annual_special_payment=-0.0)
+        )
+        b = CanonicalInput.from_input(
+            _input(purchase_price=300000.0, annual_special_payment=0)
+        )
+        assert a == b
+        assert hash(a) == hash(b)
+
+    def test_different_values_differ(self):
+        """Test that any changed field produces a different key"""
+        assert CanonicalInput.from_input(_input()) != CanonicalInput.from_input(
+            _input(interest_rate=4.6)
+        )
+
+    def test_key_is_frozen(self):
+        """Test that keys cannot be mutated after creation"""
+        key = CanonicalInput.from_input(_input())
+        with pytest.raises(AttributeError):
+            key.equity = 0
+
+    def test_round_trip(self):
+        """Test that a key converts back into an equivalent input"""
+        assert CanonicalInput.from_input(_input()).to_input() == _input(
+            purchase_price=300000.0, equity=60000.0, annual_special_payment=0.0
+        )
+
+
+class TestResultCache:
+    """Tests for the LRU cache itself"""
+
+    def test_hit_and_miss_counters(self):
+        """Test that repeated lookups are served from the cache"""
+        cache = ResultCache(max_entries=10, max_bytes=10**6)
+        calls = []
+        compute = lambda: calls.append(1) or "value"
+
+        assert cache.get_or_compute(_input(), "kind", (), compute) == "value"
+        assert cache.get_or_compute(_input(), "kind", (), compute) == "value"
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction_by_entries(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = ResultCache(max_entries=2, max_bytes=10**6)
+        cache.get_or_compute(_input(equity=1), "kind", (), lambda: 1)
+        cache.get_or_compute(_input(equity=2), "kind", (), lambda: 2)
+        # Touch the first entry so the second becomes least recently used
+        cache.get_or_compute(_input(equity=1), "kind", (), lambda: 1)
+        cache.get_or_compute(_input(equity=3), "kind", (), lambda: 3)
+
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        cache.get_or_compute(_input(equity=1), "kind", (), lambda: 1)
+        assert cache.stats()["hits"] == 2
+
+    def test_byte_budget_is_enforced(self):
+        """Test that entries are evicted when the byte budget is exceeded"""
+        cache = ResultCache(max_entries=100, max_bytes=2000)
+        for equity in range(20):
+            cache.get_or_compute(_input(equity=equity), "kind", (), lambda: "x" * 500)
+        stats = cache.stats()
+        assert stats["bytes"] <= 2000
+        assert stats["evictions"] > 0
+
+    def test_oversized_values_are_not_cached(self):
+        """Test that a single value larger than the budget is only returned"""
+        cache = ResultCache(max_entries=100, max_bytes=100)
+        value = cache.get_or_compute(_input(), "kind", (), lambda: "x" * 500)
+        assert value == "x" * 500
+        assert cache.stats()["entries"] == 0
+
+    def test_lazily_computed_values_are_counted(self):
+        """Test that KPIs computed after caching count against the budget"""
+        cache = ResultCache(max_entries=10, max_bytes=10**6)
+        summary = cache.get_or_compute(
+            _input(),
+            "summary",
+            (20,),
+            lambda: FinancingCalculator(_input()).get_summary(20),
+        )
+        before = cache.stats()["bytes"]
+        summary.to_dict()
+        cache.get_or_compute(_input(), "summary", (20,), lambda: None)
+        after = cache.stats()["bytes"]
+        assert after > before
+
+        # Other entries are not measured again when a new value is inserted
+        cache.get_or_compute(_input(), "other", (), lambda: 1)
+        assert cache.stats()["bytes"] == after + _estimate_size(1)
+
+    def test_growing_entries_are_evicted(self):
+        """Test that the byte limit holds after cached summaries grow"""
+        size = _estimate_size(FinancingCalculator(_input()).get_summary(20).to_dict())
+        cache = ResultCache(max_entries=100, max_bytes=3 * size)
+        for equity in range(10):
+            data = _input(equity=equity)
+            cache.get_or_compute(
+                data, "summary", (), lambda: FinancingCalculator(data).get_summary(20)
+            ).to_dict()
+            # The next read counts the KPIs computed meanwhile
+            cache.get_or_compute(data, "summary", (), lambda: None)
+        assert cache.stats()["bytes"] <= 3 * size
+        assert cache.stats()["entries"] <= 3
+
+    def test_invalidate_single_input(self):
+        """Test that invalidation only drops entries of the given input"""
+        cache = ResultCache(max_entries=10, max_bytes=10**6)
+        cache.get_or_compute(_input(), "a", (), lambda: 1)
+        cache.get_or_compute(_input(), "b", (), lambda: 2)
+        cache.get_or_compute(_input(equity=1), "a", (), lambda: 3)
+        cache.invalidate(_input())
+        assert cache.stats()["entries"] == 1
+
+    def test_configure_shrinks_cache(self):
+        """Test that lowering the limits evicts entries immediately"""
+        cache = ResultCache(max_entries=10, max_bytes=10**6)
+        for equity in range(5):
+            cache.get_or_compute(_input(equity=equity), "kind", (), lambda: equity)
+        cache.configure(max_entries=2)
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["evictions"] == 3
+
+
+class TestCachedHelpers:
+    """Tests for the cached FinancingCalculator helpers"""
+
+    def test_payoff_years_matches_calculator(self):
+        assert cached_payoff_years(_input()) == FinancingCalculator(
+            _input()
+        ).calculate_payoff_years()
+
+    def test_summary_served_from_cache(self):
+        first = cached_summary(_input(), 20)
+        second = cached_summary(_input(), 20)
+        assert first is second
+        assert first == FinancingCalculator(_input()).get_summary(20)
+
+    def test_summaries_share_payoff_index(self, monkeypatch):
+        """Test that new horizons reuse the cached payoff schedule"""
+        calls = []
+        original = annuity.schedule_arrays
+
+        def counting_schedule_arrays(*args):
+            calls.append(args)
+            return original(*args)
+
+        monkeypatch.setattr(annuity, "schedule_arrays", counting_schedule_arrays)
+        for years in (5, 10, 20, 30):
+            cached_summary(_input(), years)
+        assert len(calls) == 1
+
+    def test_schedule_and_dataframe_share_entry(self):
+        schedule = cached_schedule(_input(), 15)
+        misses = result_cache.stats()["misses"]
+        df = cached_schedule_dataframe(_input(), 15)
+        assert result_cache.stats()["misses"] == misses
+        assert len(schedule) == len(df) == 15
+
+    def test_dataframe_is_fresh_per_call(self):
+        """Test that mutating a returned frame does not affect the cache"""
+        df = cached_schedule_dataframe(_input(), 5)
+        df["extra"] = 1
+        assert "extra" not in cached_schedule_dataframe(_input(), 5).columns
+
+    def test_dataframe_wraps_cached_arrays(self):
+        """Test that the frame shares the cached buffers instead of copying"""
+        schedule = cached_schedule(_input(), 10)
+        df = cached_schedule_dataframe(_input(), 10)
+        assert list(df.columns) == list(SCHEDULE_DATAFRAME_COLUMNS.values())
+        assert np.shares_memory(df.iloc[:, 5].to_numpy(), schedule.debt_end)
+        with pytest.raises(ValueError):
+            df.iloc[0, 5] = 0.0
+        assert schedule.debt_end[0] > 0
+
+    def test_dataframe_localized_labels(self):
+        df = cached_schedule_dataframe(_input(), 10, get_schedule_columns("en"))
+        assert list(df.columns) == [
+            get_text("en", "table_year"),
+            get_text("en", "table_beginning_debt"),
+            get_text("en", "table_annual_rate"),
+            get_text("en", "table_interest"),
+            get_text("en", "table_amortization"),
+            get_text("en", "table_ending_debt"),
+        ]
+        assert list(get_schedule_columns("de").values()) == list(
+            SCHEDULE_DATAFRAME_COLUMNS.values()
+        )
+
+    def test_years_to_payoff_does_not_leak_payment(self):
+        """Test that affordability results don't change cached summaries"""
+        summary = cached_summary(_input(), 10)
+        cached_years_to_payoff(_input(), 5000)
+        assert cached_summary(_input(), 10) is summary
+        assert summary["monthly_payment"] == pytest.approx(
+            FinancingCalculator(_input()).monthly_payment
+        )
+
+    def test_affordability_reads_cached_curve(self):
+        """Test that slider positions are lookups in one cached curve"""
+        for percentage in range(5, 41):
+            expected = cached_years_to_payoff(_input(), 6000 * percentage / 100)
+            misses = result_cache.stats()["misses"]
+            result = cached_affordability(_input(), 6000, percentage)
+            if percentage > 5:
+                assert result_cache.stats()["misses"] == misses
+            for key in ("feasible", "years_to_payoff", "error_key"):
+                assert result.get(key) == expected.get(key), key
+            if expected["feasible"]:
+                assert result["total_interest"] == pytest.approx(
+                    expected["total_interest"]
+                )
+        assert len(cached_affordability_curve(_input(), 6000)) == 36
+
+    def test_sensitivity_grid_around_input_rate(self):
+        grid = cached_sensitivity_grid(_input(interest_rate=1.5))
+        np.testing.assert_allclose(grid["interest_rate"], np.arange(0, 3.75, 0.25))
+        assert grid["total_interest"].shape == (15, 8)
+        misses = result_cache.stats()["misses"]
+        assert cached_sensitivity_grid(_input(interest_rate=1.5)) is grid
+        assert result_cache.stats()["misses"] == misses
+
+    def test_affordability_off_slider_falls_back(self):
+        result = cached_affordability(_input(), 6000, 22.5)
+        assert result == cached_years_to_payoff(_input(), 1350)
@@ -1034,3 +1034,79 @@ class TestCalculateWithRateChange:
         # Years difference should be reasonable
         max_possible_years = result["original_payoff_years"] * 2
         assert abs(result["years_difference"]) < max_possible_years
+
+
+class TestIterSchedule:
+    """Tests for the lazy iter_schedule generator"""
+
+    @pytest.fixture
+    def low_amortization(self):
+        """Fixture: Breakeven early, payoff after several decades"""
+        return FinancingCalculator(
+            FinancingInput(
+                purchase_price=500000,
+                equity=50000,
+                interest_rate=2.0,
+                initial_amortization=1.0,
+            )
+        )
+
+    @pytest.mark.parametrize("resolution", ["yearly", "monthly"])
+    def test_matches_calculate_schedule(self, resolution):
+        """Test that the generator yields the payoff schedule"""
+        calc = FinancingCalculator(
+            FinancingInput(
+                purchase_price=400000,
+                equity=50000,
+                interest_rate=3.5,
+                initial_amortization=2.0,
+                annual_special_payment=2000,
+                resolution=resolution,
+            )
+        )
+        entries = list(calc.iter_schedule())
+        schedule = calc.calculate_schedule(calc.calculate_payoff_years())
+        assert len(entries) == len(schedule)
+        for entry, row in zip(entries, schedule):
+            assert entry.year == row.year
+            assert entry.interest_payment == pytest.approx(row.interest_payment)
+            assert entry.debt_end == pytest.approx(row.debt_end, abs=1e-6)
+        assert entries[-1].debt_end <= 0
+
+    def test_respects_max_years(self, low_amortization):
+        entries = list(low_amortization.iter_schedule(max_years=5))
+        assert [entry.year for entry in entries] == [1, 2, 3, 4, 5]
+
+    def test_breakeven_stops_at_first_qualifying_year(
+        self, low_amortization, monkeypatch
+    ):
+        """Test that the breakeven search does not walk to payoff"""
+        yielded = []
+        original = low_amortization.iter_schedule
+
+        def counting_iter_schedule(*args, **kwargs):
+            for entry in original(*args, **kwargs):
+                yielded.append(entry.year)
+                yield entry
+
+        monkeypatch.setattr(low_amortization, "iter_schedule", counting_iter_schedule)
+        breakeven = low_amortization._calculate_breakeven_point()
+        payoff_years = low_amortization.calculate_payoff_years()
+
+        assert breakeven["breakeven_year"] is not None
+        assert payoff_years > 40
+        assert yielded[-1] == breakeven["breakeven_year"] < payoff_years
+        assert low_amortization.schedule_arrays == {}
+
+    def test_equity_milestone_stops_early(self, low_amortization, monkeypatch):
+        yielded = []
+        original = low_amortization.iter_schedule
+
+        def counting_iter_schedule(*args, **kwargs):
+            for entry in original(*args, **kwargs):
+                yielded.append(entry.year)
+                yield entry
+
+        monkeypatch.setattr(low_amortization, "iter_schedule", counting_iter_schedule)
+        years = low_amortization._calculate_time_to_equity_percentage_iterative(20)
+        assert len(yielded) == int(years) + 1
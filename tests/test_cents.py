@@ -0,0 +1,196 @@
+"""
+Unit tests for the integer-cents amortization engine
+Checks the vectorized int64 kernel against a period-by-period integer loop
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import cents
+from calculator import MONTHLY_RESOLUTION, FinancingCalculator, FinancingInput
+
+
+def _reference_schedule(principal, rate, payments, rounding):
+    """Period-by-period loop with Python integers"""
+    numerator, denominator = rate
+    rows = []
+    debt = principal
+    for payment in payments:
+        quotient, remainder = divmod(debt * numerator, denominator)
+        if rounding == cents.ROUND_HALF_UP:
+            interest = quotient + (2 * remainder >= denominator)
+        else:
+            interest = quotient + (
+                2 * remainder > denominator
+                or (2 * remainder == denominator and quotient % 2 == 1)
+            )
+        amortization = min(payment - interest, debt)
+        rows.append((debt, interest, amortization, debt - amortization))
+        debt -= amortization
+    return rows
+
+
+class TestConversions:
+    """Tests for cents conversion and rounding"""
+
+    @pytest.mark.parametrize(
+        "amount, rounding, expected",
+        [
+            (1234.565, cents.ROUND_HALF_UP, 123457),
+            (1234.565, cents.ROUND_HALF_EVEN, 123456),
+            (2.335, cents.ROUND_HALF_EVEN, 234),
+            (0.1 + 0.2, cents.ROUND_HALF_UP, 30),
+            (1566.6666666666667, cents.ROUND_HALF_UP, 156667),
+        ],
+    )
+    def test_to_cents(self, amount, rounding, expected):
+        assert cents.to_cents(amount, rounding) == expected
+
+    def test_period_rate_is_exact(self):
+        assert cents.period_rate(3.875) == (31, 800)
+        assert cents.period_rate(3.875, 12) == (31, 9600)
+        assert cents.period_rate(0.0) == (0, 1)
+
+    @pytest.mark.parametrize(
+        "rounding, expected",
+        [
+            (cents.ROUND_HALF_UP, [0, 1, 1, 2, 3, 3]),
+            (cents.ROUND_HALF_EVEN, [0, 0, 1, 2, 2, 3]),
+        ],
+    )
+    def test_divide_rounded(self, rounding, expected):
+        """Test rounding of exact halves and nearby values"""
+        dividend = np.array([2, 5, 6, 15, 25, 26])
+        assert cents.divide_rounded(dividend, 10, rounding).tolist() == expected
+
+    def test_unknown_rounding_raises(self):
+        with pytest.raises(ValueError, match="rounding"):
+            cents.to_cents(1.0, "truncate")
+
+
+class TestScheduleCents:
+    """Tests for the vectorized kernel"""
+
+    @pytest.mark.parametrize("rounding", cents.ROUNDING_MODES)
+    @pytest.mark.parametrize(
+        "principal, interest_rate, per_year, payment, special",
+        [
+            (32000000, 3.875, 1, 1880000, 0),
+            (32000000, 3.875, 12, 156667, 200000),
+            (45000000, 4.123456, 12, 150000, 0),
+            (20000000, 0.0, 12, 41667, 150000),
+            (24000000, 5.0, 1, 1000000, 0),  # Interest-only payment
+            (24000000, 7.5, 12, 100000, 0),  # Debt grows
+            (0, 4.5, 12, 50000, 0),
+        ],
+    )
+    def test_matches_reference(
+        self, rounding, principal, interest_rate, per_year, payment, special
+    ):
+        payments = np.full(40 * per_year, payment, dtype=np.int64)
+        payments[per_year - 1::per_year] += special
+        rate = cents.period_rate(interest_rate, per_year)
+        schedule = cents.schedule_cents(principal, rate, payments, rounding)
+        expected = _reference_schedule(principal, rate, payments.tolist(), rounding)
+        actual = list(
+            zip(
+                schedule["debt_start"].tolist(),
+                schedule["interest"].tolist(),
+                schedule["amortization"].tolist(),
+                schedule["debt_end"].tolist(),
+            )
+        )
+        assert actual == expected
+        assert schedule["interest"].dtype == np.int64
+
+    def test_empty_schedule(self):
+        schedule = cents.schedule_cents(100000, (1, 100), np.zeros(0, dtype=np.int64))
+        assert len(schedule["debt_end"]) == 0
+
+
+class TestExactCalculator:
+    """Tests for FinancingCalculator with a rounding mode"""
+
+    @pytest.fixture
+    def input_data(self):
+        return FinancingInput(
+            purchase_price=400000,
+            equity=80000,
+            interest_rate=3.875,
+            initial_amortization=2.0,
+            annual_special_payment=2000,
+            rounding=cents.ROUND_HALF_UP,
+        )
+
+    @pytest.mark.parametrize("resolution", ["yearly", MONTHLY_RESOLUTION])
+    def test_schedule_is_in_whole_cents(self, input_data, resolution):
+        calc = FinancingCalculator(replace(input_data, resolution=resolution))
+        payoff_years = calc.calculate_payoff_years()
+        schedule = calc.calculate_schedule(payoff_years)
+        for column in ("debt_start", "interest_payment", "amortization", "debt_end"):
+            values = getattr(schedule, column) * 100
+            np.testing.assert_allclose(values, np.round(values), rtol=0, atol=1e-6)
+        assert schedule.debt_end[-1] == 0
+        assert schedule.debt_end[-2] > 0
+
+    def test_first_year_matches_bank_statement(self, input_data):
+        """Test one year against a hand-computed monthly statement"""
+        calc = FinancingCalculator(replace(input_data, resolution=MONTHLY_RESOLUTION))
+        assert calc.monthly_payment == pytest.approx(1566.67)
+        debt, interest_total = 32000000, 0
+        for month in range(12):
+            interest = (debt * 31 + 4800) // 9600
+            payment = 156667 + (200000 if month == 11 else 0)
+            interest_total += interest
+            debt -= payment - interest
+        first_year = calc.calculate_schedule(1)[0]
+        assert first_year.debt_end == debt / 100
+        assert first_year.interest_payment == interest_total / 100
+
+    @pytest.mark.parametrize("resolution", ["yearly", MONTHLY_RESOLUTION])
+    def test_iter_schedule_matches_kernel(self, input_data, resolution):
+        calc = FinancingCalculator(replace(input_data, resolution=resolution))
+        payoff_years = calc.calculate_payoff_years()
+        schedule = calc.calculate_schedule(payoff_years)
+        entries = list(calc.iter_schedule())
+        assert len(entries) == payoff_years
+        assert [entry.debt_end for entry in entries] == schedule.debt_end.tolist()
+        assert calc.calculate_payoff_years_iterative() == payoff_years
+
+    def test_summary_totals_are_exact(self, input_data):
+        calc = FinancingCalculator(input_data)
+        payoff_years = calc.calculate_payoff_years()
+        summary = calc.get_summary(payoff_years)
+        interest_cents = (calc.calculate_schedule(payoff_years).interest_payment * 100)
+        assert summary["total_interest"] == round(interest_cents.sum()) / 100
+        assert summary["total_amortization"] == input_data.purchase_price - (
+            input_data.equity
+        )
+
+    @pytest.mark.parametrize("resolution", ["yearly", MONTHLY_RESOLUTION])
+    def test_close_to_float_calculation(self, input_data, resolution):
+        """Test that rounding only moves results by cents per period"""
+        exact = FinancingCalculator(replace(input_data, resolution=resolution))
+        floating = FinancingCalculator(
+            replace(input_data, resolution=resolution, rounding=None)
+        )
+        years = floating.calculate_payoff_years()
+        assert exact.calculate_payoff_years() == years
+        assert exact.get_summary(years)["total_interest"] == pytest.approx(
+            floating.get_summary(years)["total_interest"], abs=years * 12 * 0.01
+        )
+
+    def test_rounding_modes_differ(self, input_data):
+        """Test that the rounding mode is applied"""
+        half_up = FinancingCalculator(input_data).calculate_schedule(30)
+        half_even = FinancingCalculator(
+            replace(input_data, rounding=cents.ROUND_HALF_EVEN)
+        ).calculate_schedule(30)
+        assert half_up.interest_payment.sum() >= half_even.interest_payment.sum()
@@ -0,0 +1,99 @@
+"""
+Unit tests for the chart builders
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from calculator import FinancingCalculator, FinancingInput
+from charts import create_affordability_curve_chart, create_equity_buildup_chart
+
+
+@pytest.fixture
+def calculator():
+    return FinancingCalculator(
+        FinancingInput(
+            purchase_price=400000,
+            equity=80000,
+            interest_rate=4.0,
+            initial_amortization=2.0,
+            annual_special_payment=0,
+        )
+    )
+
+
+def translate(key):
+    return key
+
+
+class TestAffordabilityCurveChart:
+    """Tests for years to payoff and total interest by income share"""
+
+    @pytest.fixture
+    def curve(self, calculator):
+        # Shares up to 20% of 5000 € do not cover the interest
+        return calculator.calculate_affordability_curve(5000, [10, 15, 20, 25, 30, 40])
+
+    def test_traces(self, curve):
+        fig = create_affordability_curve_chart(curve, translate)
+        assert [trace.name for trace in fig.data] == [
+            "years_to_payoff",
+            "total_interest_by_payoff",
+        ]
+        assert fig.data[1].yaxis == "y2"
+        assert fig.layout.title.text == "affordability_curve"
+        for trace in fig.data:
+            assert list(trace.x) == [10, 15, 20, 25, 30, 40]
+
+    def test_infeasible_shares_are_gaps(self, curve):
+        fig = create_affordability_curve_chart(curve, translate)
+        years, interest = fig.data
+        assert list(years.y[:3]) == [None, None, None]
+        assert list(interest.y[:3]) == [None, None, None]
+        assert list(years.y[3:]) == list(curve["years_to_payoff"].iloc[3:])
+        assert list(interest.y[3:]) == pytest.approx(
+            list(curve["total_interest"].iloc[3:])
+        )
+
+    def test_selected_percentage(self, curve):
+        fig = create_affordability_curve_chart(curve, translate, selected_percentage=25)
+        (line,) = fig.layout.shapes
+        assert line.type == "line"
+        assert line.x0 == line.x1 == 25
+        assert not create_affordability_curve_chart(curve, translate).layout.shapes
+
+
+class TestEquityBuildupChart:
+    """Tests for the equity milestones on the equity buildup chart"""
+
+    @pytest.fixture
+    def buildup(self, calculator):
+        return calculator.get_summary(10)["equity_buildup_rate"]
+
+    def test_reached_milestones_at_their_points(self, buildup):
+        fig = create_equity_buildup_chart(
+            buildup, translate, {25: 0.0, 50: 9.5, 75: 17.2, 100: None}
+        )
+        markers = fig.data[-1]
+        assert markers.name == "equity_milestones"
+        assert markers.yaxis == "y2"
+        assert list(zip(markers.x, markers.y)) == [(9.5, 50), (17.2, 75)]
+        assert len(markers.text) == 2
+
+    def test_unreached_milestones_add_no_trace(self, buildup):
+        fig = create_equity_buildup_chart(buildup, translate, {25: 0.0, 100: None})
+        assert [trace.name for trace in fig.data] == [
+            "equity_gained_per_year",
+            "equity_percentage",
+        ]
+
+    def test_without_milestones_unchanged(self, buildup):
+        plain = create_equity_buildup_chart(buildup, translate)
+        marked = create_equity_buildup_chart(buildup, translate, {50: 9.5})
+        assert len(plain.data) == 2
+        assert marked.data[:2] == plain.data
+        assert marked.layout == plain.layout
@@ -0,0 +1,224 @@
+"""
+Unit tests for the follow-up financing offer ranking
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import followup
+from calculator import MONTHLY_RESOLUTION, FinancingCalculator, FinancingInput
+from cents import ROUND_HALF_UP
+
+
+@pytest.fixture
+def input_data():
+    return FinancingInput(
+        purchase_price=400000,
+        equity=50000,
+        interest_rate=4.0,
+        initial_amortization=2.0,
+        annual_special_payment=1000,
+        interest_binding_years=10,
+    )
+
+
+@pytest.fixture
+def offers():
+    return followup.offer_grid([3.0, 3.5, 4.0, 5.0], [5, 10, 15], [1.0, 2.0, 3.0])
+
+
+class TestOfferGrid:
+    """Tests for the Cartesian grid of offer terms"""
+
+    def test_all_combinations(self, offers):
+        assert len(offers) == 36
+        assert list(offers.columns) == list(followup.OFFER_COLUMNS)
+        assert not offers.duplicated().any()
+        assert offers["binding_years"].dtype == np.int64
+
+
+class TestEvaluateOffers:
+    """Tests for scoring offers from the debt at binding end"""
+
+    def test_matches_rate_path_of_refinanced_loan(self, input_data, offers):
+        scored = followup.evaluate_offers(input_data, offers, follow_up_rate=6.0)
+        binding = FinancingCalculator(input_data).get_summary(10)
+        for offer in scored.sample(8, random_state=3).itertuples():
+            assert offer.remaining_debt_at_binding_end == pytest.approx(
+                binding["remaining_debt"]
+            )
+            refinanced = FinancingCalculator(
+                FinancingInput(
+                    purchase_price=binding["remaining_debt"],
+                    equity=0,
+                    interest_rate=offer.interest_rate,
+                    initial_amortization=offer.initial_amortization,
+                    annual_special_payment=1000,
+                )
+            )
+            path = [(offer.binding_years, offer.interest_rate), (None, 6.0)]
+            expected = refinanced.compare_rate_paths([path], max_years=90).iloc[0]
+            assert offer.payoff_years == 10 + expected["payoff_years"]
+            assert offer.total_interest == pytest.approx(
+                binding["total_interest"] + expected["total_interest"]
+            )
+            assert offer.monthly_payment == pytest.approx(refinanced.monthly_payment)
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"annual_special_payment": 0, "special_payments": [10000] * 10},
+            {"resolution": MONTHLY_RESOLUTION},
+            {"rounding": ROUND_HALF_UP},
+        ],
+    )
+    def test_binding_period_follows_schedule(self, input_data, offers, changes):
+        """Test the refinanced debt against the calculator's own schedule"""
+        data = replace(input_data, **changes)
+        schedule = FinancingCalculator(data).compute_schedule(10)
+        scored = followup.evaluate_offers(data, offers)
+        assert (
+            scored["remaining_debt_at_binding_end"] == schedule.debt_end[-1]
+        ).all()
+        offer = scored.iloc[0]
+        refinanced = FinancingCalculator(
+            FinancingInput(
+                purchase_price=schedule.debt_end[-1],
+                equity=0,
+                interest_rate=offer["interest_rate"],
+                initial_amortization=offer["initial_amortization"],
+                annual_special_payment=data.annual_special_payment,
+            )
+        ).calculate_with_rate_path([(None, offer["interest_rate"])], max_years=90)
+        assert offer["payoff_years"] == 10 + refinanced["payoff_years"]
+        assert offer["total_interest"] == pytest.approx(
+            schedule.interest_payment.sum() + refinanced["total_interest"]
+        )
+
+    def test_special_payments_after_binding(self, input_data, offers):
+        data = replace(input_data, special_payments=[10000] * 12)
+        with pytest.raises(ValueError, match="special_payments"):
+            followup.evaluate_offers(data, offers)
+
+    def test_same_payment_matches_rate_change(self, input_data, offers):
+        """Test an offer keeping the payment against calculate_with_rate_change"""
+        calculator = FinancingCalculator(input_data)
+        debt = followup.evaluate_offers(input_data, offers)[
+            "remaining_debt_at_binding_end"
+        ].iloc[0]
+        offer = pd.DataFrame(
+            {
+                "interest_rate": [5.5],
+                "binding_years": [0],
+                "initial_amortization": [calculator.annual_payment / debt * 100 - 5.5],
+            }
+        )
+        scored = followup.evaluate_offers(input_data, offer).iloc[0]
+        change = calculator.calculate_with_rate_change(5.5)
+        assert scored["payment_shock"] == pytest.approx(0, abs=1e-9)
+        assert scored["payoff_years"] == change["new_payoff_years"]
+        assert scored["total_interest"] == pytest.approx(change["new_total_interest"])
+
+    def test_payment_shock(self, input_data, offers):
+        scored = followup.evaluate_offers(input_data, offers)
+        current = FinancingCalculator(input_data).monthly_payment
+        np.testing.assert_allclose(
+            scored["payment_shock"], scored["monthly_payment"] - current
+        )
+        np.testing.assert_allclose(
+            scored["payment_shock_percent"],
+            scored["payment_shock"] / current * 100,
+        )
+
+    def test_process_pool_matches_single_process(self, input_data, offers):
+        single = followup.evaluate_offers(input_data, offers, workers=1)
+        pooled = followup.evaluate_offers(input_data, offers, workers=2, chunk_size=10)
+        pd.testing.assert_frame_equal(single, pooled)
+
+    def test_repaid_during_binding(self, input_data, offers):
+        data = replace(input_data, interest_binding_years=40)
+        scored = followup.evaluate_offers(data, offers)
+        payoff = FinancingCalculator(data).calculate_payoff_years()
+        assert (scored["payoff_years"] == payoff).all()
+        assert scored["repaid"].all()
+        assert (scored["remaining_debt_at_binding_end"] == 0).all()
+
+    def test_missing_column(self, input_data, offers):
+        with pytest.raises(ValueError, match="initial_amortization"):
+            followup.evaluate_offers(
+                input_data, offers.drop(columns="initial_amortization")
+            )
+
+
+class TestRankOffers:
+    """Tests for the ranked shortlist"""
+
+    def test_ranked_by_total_interest(self, input_data, offers):
+        scored = followup.evaluate_offers(input_data, offers)
+        shortlist = followup.rank_offers(scored, top=5)
+        assert list(shortlist["rank"]) == [1, 2, 3, 4, 5]
+        assert shortlist["total_interest"].is_monotonic_increasing
+        assert shortlist["total_interest"].iloc[0] == scored["total_interest"].min()
+        # The cheapest offer cannot be beaten on every criterion
+        assert shortlist["pareto"].iloc[0]
+
+    def test_unrepaid_offers_dropped(self, input_data, offers):
+        scored = followup.evaluate_offers(input_data, offers, max_years=25)
+        assert not scored["repaid"].all()
+        shortlist = followup.rank_offers(scored, top=None)
+        assert len(shortlist) == scored["repaid"].sum()
+
+    def test_max_payment_shock(self, input_data, offers):
+        scored = followup.evaluate_offers(input_data, offers)
+        shortlist = followup.rank_offers(scored, top=None, max_payment_shock=0)
+        assert (shortlist["payment_shock"] <= 0).all()
+        assert len(shortlist) == (scored["payment_shock"] <= 0).sum()
+
+    def test_pareto_flags(self):
+        scored = pd.DataFrame(
+            {
+                "total_interest": [100.0, 100.0, 120.0, 90.0],
+                "payoff_years": [20, 22, 18, 25],
+                "payment_shock": [50.0, 50.0, 80.0, 10.0],
+                "repaid": [True] * 4,
+            }
+        )
+        shortlist = followup.rank_offers(scored, top=None)
+        assert list(shortlist["total_interest"]) == [90.0, 100.0, 100.0, 120.0]
+        assert list(shortlist["pareto"]) == [True, True, False, True]
+
+    def test_pareto_matches_pairwise_check(self):
+        """Test the sweep against comparing every pair, ties included"""
+        values = np.random.default_rng(7).integers(0, 6, (400, 3)).astype(float)
+        scored = pd.DataFrame(values, columns=list(followup.RANKING)).assign(
+            repaid=True
+        )
+        beaten = (values[:, None] >= values).all(axis=2) & (
+            values[:, None] > values
+        ).any(axis=2)
+        shortlist = followup.rank_offers(
+            scored.assign(expected=~beaten.any(axis=1)), top=None
+        )
+        assert shortlist["pareto"].any() and not shortlist["pareto"].all()
+        assert (shortlist["pareto"] == shortlist["expected"]).all()
+
+    def test_no_candidates(self, input_data, offers):
+        scored = followup.evaluate_offers(input_data, offers).assign(repaid=False)
+        shortlist = followup.rank_offers(scored)
+        assert shortlist.empty
+        assert "pareto" in shortlist
+
+    def test_custom_ranking(self, input_data, offers):
+        scored = followup.evaluate_offers(input_data, offers)
+        shortlist = followup.rank_offers(
+            scored, top=None, ranking=("payment_shock", "total_interest")
+        )
+        assert shortlist["payment_shock"].is_monotonic_increasing
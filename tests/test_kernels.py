@@ -0,0 +1,160 @@
+"""
+Unit tests for the recursive amortization kernels and their backends
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import kernels
+import ratepath
+from calculator import MONTHLY_RESOLUTION, FinancingCalculator, FinancingInput
+
+BACKENDS = kernels.available_backends()
+
+
+@pytest.fixture
+def input_data():
+    return FinancingInput(
+        purchase_price=400000,
+        equity=80000,
+        interest_rate=3.5,
+        initial_amortization=2.0,
+        annual_special_payment=5000,
+    )
+
+
+class TestBackendSelection:
+    """Tests for the backend selector"""
+
+    @pytest.fixture(autouse=True)
+    def restore_backend(self):
+        yield
+        kernels.set_backend(kernels.AUTO_BACKEND)
+
+    def test_python_is_always_available(self):
+        assert kernels.PYTHON_BACKEND in kernels.available_backends()
+
+    def test_auto_falls_back_without_numba(self, monkeypatch):
+        monkeypatch.setattr(kernels, "numba", None)
+        assert kernels.available_backends() == (kernels.PYTHON_BACKEND,)
+        assert kernels.get_backend() == kernels.PYTHON_BACKEND
+        with pytest.raises(ValueError, match="not available"):
+            kernels.set_backend(kernels.NUMBA_BACKEND)
+
+    def test_set_backend(self):
+        kernels.set_backend(kernels.PYTHON_BACKEND)
+        assert kernels.get_backend() == kernels.PYTHON_BACKEND
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="Unknown"):
+            kernels.set_backend("cuda")
+        with pytest.raises(ValueError, match="Unknown"):
+            kernels.rate_matrix(100000, 8000, np.full((1, 5), 0.03), backend="cuda")
+
+
+class TestAmortizationSchedule:
+    """Tests for kernels.amortization_schedule"""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @pytest.mark.parametrize("resolution", ["yearly", MONTHLY_RESOLUTION])
+    def test_matches_closed_form(self, input_data, backend, resolution):
+        """Test that without rules the loop reproduces calculate_schedule"""
+        calc = FinancingCalculator(replace(input_data, resolution=resolution))
+        expected = calc.calculate_schedule(40)
+        schedule = calc.calculate_schedule_with_rules(40, backend=backend)
+        for column in ("debt_start", "interest_payment", "amortization", "debt_end"):
+            np.testing.assert_allclose(
+                getattr(schedule, column), getattr(expected, column), atol=1e-6
+            )
+        np.testing.assert_allclose(schedule.annual_payment, calc.annual_payment)
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_payment_holiday_capitalizes_interest(self, input_data, backend):
+        calc = FinancingCalculator(input_data)
+        schedule = calc.calculate_schedule_with_rules(
+            5, payment_holidays=[2, 3], backend=backend
+        )
+        for year in (2, 3):
+            row = schedule[year - 1]
+            assert row.annual_payment == 0
+            assert row.debt_end == pytest.approx(row.debt_start * 1.035)
+        assert schedule[3].annual_payment == calc.annual_payment
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_special_payment_limit(self, input_data, backend):
+        """Test that special payments are capped at a share of the loan"""
+        calc = FinancingCalculator(input_data)
+        capped = calc.calculate_schedule_with_rules(
+            10, special_payments=40000, special_payment_limit=5, backend=backend
+        )
+        expected = calc.calculate_schedule_with_rules(
+            10, special_payments=16000, backend=backend
+        )
+        np.testing.assert_allclose(capped.debt_end, expected.debt_end)
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_variable_rates_match_rate_path(self, input_data, backend):
+        calc = FinancingCalculator(input_data)
+        rates = np.where(np.arange(1, 51) <= 10, 3.5, 5.0)
+        schedule = calc.calculate_schedule_with_rules(50, rates, backend=backend)
+        expected = calc.calculate_with_rate_path([(10, 3.5), (None, 5.0)], 50)
+        paid = schedule.debt_end <= 1e-6
+        assert paid.argmax() + 1 == expected["payoff_years"]
+        assert schedule.interest_payment.sum() == pytest.approx(
+            expected["total_interest"]
+        )
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_special_payment_capped_at_debt(self, backend):
+        schedule = kernels.amortization_schedule(
+            1000.0, np.full(3, 0.1), 300.0, 1000.0, backend=backend
+        )
+        assert schedule["special_payment"].tolist() == [800.0, 0.0, 0.0]
+        assert schedule["debt_end"].tolist() == [0.0, 0.0, 0.0]
+
+
+class TestRateMatrix:
+    """Tests for kernels.rate_matrix"""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_matches_segment_engine(self, backend):
+        rates = np.array([[3.0] * 30, [3.0] * 10 + [6.0] * 20, [9.0] * 30])
+        result = kernels.rate_matrix(250000, 15000, rates / 100, backend=backend)
+        expected = ratepath.evaluate_rate_paths(
+            250000, 15000, [[(None, 3.0)], [(10, 3.0), (None, 6.0)], [(None, 9.0)]], 30
+        )
+        repaid = expected["payoff_years"] < 30
+        np.testing.assert_array_equal(
+            result["payoff_years"], np.where(repaid, expected["payoff_years"], 0)
+        )
+        np.testing.assert_allclose(result["total_interest"], expected["total_interest"])
+        np.testing.assert_allclose(result["remaining_debt"], expected["remaining_debt"])
+
+    def test_loop_matches_vectorized(self):
+        """Test the loop numba compiles, run as plain Python"""
+        rates = np.random.default_rng(4).normal(4.0, 1.5, (200, 60)).clip(0) / 100
+        principal = np.linspace(100000, 500000, 200)
+        payment = np.full(200, 18000.0)
+        loop = kernels._rate_matrix_loop(principal, payment, rates)
+        vectorized = kernels._rate_matrix_numpy(principal, payment, rates)
+        assert (loop[0] > 0).any() and (loop[0] == 0).any()
+        np.testing.assert_array_equal(loop[0], vectorized[0])
+        np.testing.assert_allclose(loop[1], vectorized[1], rtol=1e-12)
+        np.testing.assert_allclose(loop[2], vectorized[2], rtol=1e-12, atol=1e-9)
+
+    @pytest.mark.skipif(
+        kernels.NUMBA_BACKEND not in BACKENDS, reason="numba is not installed"
+    )
+    def test_numba_matches_python(self):
+        rates = np.random.default_rng(4).normal(4.0, 1.5, (500, 60)).clip(0) / 100
+        python = kernels.rate_matrix(300000, 18000, rates, backend="python")
+        jitted = kernels.rate_matrix(300000, 18000, rates, backend="numba")
+        for key in python:
+            np.testing.assert_allclose(jitted[key], python[key], rtol=1e-12)
@@ -0,0 +1,212 @@
+"""
+Unit tests for the KPI registry and execution planner
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import kpis
+from charts import create_equity_buildup_chart
+from calculator import MONTHLY_RESOLUTION, FinancingCalculator, FinancingInput
+
+
+@pytest.fixture
+def input_data():
+    return FinancingInput(
+        purchase_price=400000,
+        equity=80000,
+        interest_rate=3.5,
+        initial_amortization=2.0,
+        annual_special_payment=5000,
+    )
+
+
+@pytest.fixture
+def counted_nodes(monkeypatch):
+    """Count how often every registered node is computed"""
+    calls = {}
+    for name, node in list(kpis.NODES.items()):
+
+        def counting(context, name=name, compute=node.compute):
+            calls[name] = calls.get(name, 0) + 1
+            return compute(context)
+
+        counted = replace(node, compute=counting)
+        monkeypatch.setitem(kpis.NODES, name, counted)
+        if name in kpis.KPIS:
+            monkeypatch.setitem(kpis.KPIS, name, counted)
+    return calls
+
+
+class TestPlanner:
+    """Tests for plan and dependency handling"""
+
+    def test_requirements_come_first(self):
+        order = kpis.plan(["interest_savings", "breakeven"])
+        assert order == [
+            "payoff_index",
+            "counterfactual",
+            "interest_savings",
+            "breakeven",
+        ]
+
+    def test_unknown_kpi_raises(self):
+        with pytest.raises(ValueError, match="Unknown KPI"):
+            kpis.plan(["does_not_exist"])
+
+    def test_circular_requirement_raises(self, monkeypatch):
+        monkeypatch.setitem(kpis.NODES, "a", kpis.Node("a", None, ("b",)))
+        monkeypatch.setitem(kpis.NODES, "b", kpis.Node("b", None, ("a",)))
+        with pytest.raises(ValueError, match="Circular"):
+            kpis.plan(["a"])
+
+    def test_horizon_dependency_propagates(self):
+        assert kpis.depends_on_horizon("totals")
+        assert not kpis.depends_on_horizon("breakeven")
+
+    def test_kpi_for_key(self):
+        assert kpis.kpi_for_key("breakeven_year") == "breakeven"
+        with pytest.raises(ValueError):
+            kpis.kpi_for_key("nope")
+
+
+class TestEvaluation:
+    """Tests for KpiContext and FinancingCalculator.evaluate_kpis"""
+
+    def test_registry_covers_summary_keys(self, input_data):
+        summary = FinancingCalculator(input_data).get_summary(10)
+        keys = [key for node in kpis.KPIS.values() for key in node.keys]
+        assert keys == list(summary)
+
+    @pytest.mark.parametrize("resolution", ["yearly", MONTHLY_RESOLUTION])
+    def test_evaluate_kpis_matches_summary(self, input_data, resolution):
+        input_data = replace(input_data, resolution=resolution)
+        summary = FinancingCalculator(input_data).get_summary(15).to_dict()
+        result = FinancingCalculator(input_data).evaluate_kpis(kpis.KPIS, 15)
+        assert result == summary
+
+    def test_only_required_nodes_run(self, input_data, counted_nodes):
+        calc = FinancingCalculator(input_data)
+        result = calc.evaluate_kpis(["ltv_ratio", "breakeven"])
+        assert set(result) == {
+            "ltv_ratio",
+            "breakeven_year",
+            "cumulative_amortization_at_breakeven",
+            "cumulative_interest_at_breakeven",
+        }
+        assert counted_nodes == {"ltv_ratio": 1, "payoff_index": 1, "breakeven": 1}
+
+    def test_intermediates_shared_across_horizons(self, input_data, counted_nodes):
+        """Test that horizon-independent values are computed once per calculator"""
+        calc = FinancingCalculator(input_data)
+        for years in (5, 10, 20):
+            calc.get_summary(years).to_dict()
+        assert counted_nodes["counterfactual"] == 1
+        assert counted_nodes["cumulative_equity"] == 1
+        assert counted_nodes["equity_buildup_rate"] == 1
+        assert counted_nodes["horizon_totals"] == 3
+
+    def test_shared_values_follow_changed_terms(self, input_data):
+        calc = FinancingCalculator(input_data)
+        before = calc.evaluate_kpis(["breakeven"])
+        calc.calculate_years_to_payoff(3000)
+        after = calc.evaluate_kpis(["breakeven"])
+        fresh = FinancingCalculator(input_data)
+        fresh.calculate_years_to_payoff(3000)
+        assert after == fresh.evaluate_kpis(["breakeven"]) != before
+
+    def test_horizon_kpi_without_years_raises(self, input_data):
+        with pytest.raises(ValueError, match="horizon"):
+            FinancingCalculator(input_data).evaluate_kpis(["totals"])
+
+    def test_registered_kpi_joins_summary(self, input_data, monkeypatch):
+        """Test that a new KPI only needs to declare its requirements"""
+        monkeypatch.setattr(kpis, "NODES", dict(kpis.NODES))
+        monkeypatch.setattr(kpis, "KPIS", dict(kpis.KPIS))
+
+        @kpis.kpi("interest_share", requires=("horizon_totals",))
+        def _interest_share(context):
+            total_interest, total_amortization, _ = context["horizon_totals"]
+            return {"interest_share": total_interest / total_amortization}
+
+        summary = FinancingCalculator(input_data).get_summary(10)
+        assert summary["interest_share"] == pytest.approx(
+            summary["interest_to_principal_ratio"]
+        )
+
+
+
+class TestEquityMilestones:
+    """Tests for equity_milestone_years and calculate_equity_milestones"""
+
+    def test_matches_time_to_equity_percentage(self, input_data):
+        calc = FinancingCalculator(input_data)
+        milestones = calc.calculate_equity_milestones()
+        assert list(milestones) == list(kpis.EQUITY_MILESTONES)
+        for percentage, years in milestones.items():
+            assert years == pytest.approx(
+                calc._calculate_time_to_equity_percentage(percentage)
+            )
+
+    @pytest.mark.parametrize(
+        "changes",
+        [{"resolution": MONTHLY_RESOLUTION}, {"special_payments": [0, 20000]}],
+    )
+    def test_time_to_equity_without_closed_form(self, input_data, changes):
+        """Test that every schedule uses the one milestone search"""
+        calc = FinancingCalculator(replace(input_data, **changes))
+        milestones = calc.calculate_equity_milestones()
+        for percentage in (25, 50, 75):
+            assert calc._calculate_time_to_equity_percentage(
+                percentage
+            ) == pytest.approx(milestones[percentage])
+        assert calc._calculate_time_to_equity_percentage(50) == pytest.approx(
+            calc.get_summary(10)["time_to_50_equity"]
+        )
+        # Shares beyond full ownership report the payoff years
+        assert calc._calculate_time_to_equity_percentage(110) == pytest.approx(
+            calc.calculate_payoff_years()
+        )
+
+    @pytest.mark.parametrize("resolution", ["yearly", MONTHLY_RESOLUTION])
+    def test_matches_summary(self, input_data, resolution):
+        calc = FinancingCalculator(replace(input_data, resolution=resolution))
+        milestones = calc.calculate_equity_milestones()
+        assert milestones[50] == calc.get_summary(10)["time_to_50_equity"]
+        assert milestones[100] == pytest.approx(calc.calculate_payoff_years(), abs=1)
+
+    def test_any_targets_from_one_curve(self, input_data, counted_nodes):
+        calc = FinancingCalculator(input_data)
+        milestones = calc.calculate_equity_milestones([10, 30, 60, 90, 120])
+        assert milestones[10] == 0.0  # Initial equity is 20%
+        assert milestones[30] < milestones[60] < milestones[90]
+        assert milestones[120] is None
+        calc.calculate_equity_milestones([40])
+        assert counted_nodes["payoff_index"] == 1
+        assert counted_nodes["cumulative_equity"] == 1
+
+    def test_interpolates_within_year(self):
+        years = kpis.equity_milestone_years(
+            [150.0, 250.0, 300.0], [50.0, 100.0, 50.0], [100.0, 200.0, 300.0, 400.0]
+        )
+        np.testing.assert_allclose(years[:3], [0.0, 1.5, 3.0])
+        assert np.isnan(years[3])
+
+    def test_chart_marks_reached_milestones(self, input_data):
+        calc = FinancingCalculator(input_data)
+        fig = create_equity_buildup_chart(
+            calc.get_summary(10)["equity_buildup_rate"],
+            lambda key: key,
+            {25: 0.0, 50: 9.5, 75: 17.2, 100: None},
+        )
+        markers = fig.data[-1]
+        assert markers.name == "equity_milestones"
+        assert list(markers.x) == [9.5, 17.2]
+        assert list(markers.y) == [50, 75]
@@ -0,0 +1,121 @@
+"""
+Unit tests for the Monte Carlo refinancing simulation
+"""
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import montecarlo
+from calculator import FinancingCalculator, FinancingInput
+
+
+@pytest.fixture
+def input_data():
+    return FinancingInput(
+        purchase_price=400000,
+        equity=50000,
+        interest_rate=4.0,
+        initial_amortization=2.0,
+        annual_special_payment=1000,
+        interest_binding_years=10,
+    )
+
+
+class TestSimulateRatePaths:
+    """Tests for the rate path generator"""
+
+    def test_shape_and_start_rate(self):
+        rng = np.random.default_rng(1)
+        rates = montecarlo.simulate_rate_paths(rng, 50, 20, start_rate=3.0)
+        assert rates.shape == (50, 20)
+        assert (rates[:, 0] == 3.0).all()
+
+    def test_min_rate_floor(self):
+        rng = np.random.default_rng(1)
+        rates = montecarlo.simulate_rate_paths(
+            rng, 500, 40, start_rate=0.5, volatility=2.0, min_rate=0.0
+        )
+        assert rates.min() == 0.0
+
+    def test_mean_reversion_converges_without_noise(self):
+        rng = np.random.default_rng(1)
+        rates = montecarlo.simulate_rate_paths(
+            rng,
+            3,
+            60,
+            start_rate=8.0,
+            model="mean_reverting",
+            volatility=0.0,
+            mean_reversion=0.3,
+            long_run_rate=3.0,
+        )
+        assert rates[:, -1] == pytest.approx(3.0)
+
+    def test_unknown_model_raises(self):
+        with pytest.raises(ValueError, match="rate model"):
+            montecarlo.simulate_rate_paths(
+                np.random.default_rng(1), 1, 5, 3.0, model="jump"
+            )
+
+
+class TestRunMonteCarlo:
+    """Tests for run_monte_carlo"""
+
+    def test_zero_volatility_matches_rate_path(self, input_data):
+        """Test that a deterministic path reproduces the calculator"""
+        result = montecarlo.run_monte_carlo(
+            input_data, paths=20, volatility=0.0, start_rate=5.0, seed=1
+        )
+        expected = FinancingCalculator(input_data).calculate_with_rate_path(
+            [(10, 4.0), (None, 5.0)]
+        )
+        assert (result["payoff_years"] == expected["payoff_years"]).all()
+        assert result["total_interest"] == pytest.approx(expected["total_interest"])
+
+    def test_seed_replays_exactly(self, input_data):
+        first = montecarlo.run_monte_carlo(input_data, paths=3000, seed=42, workers=1)
+        second = montecarlo.run_monte_carlo(input_data, paths=3000, seed=42, workers=1)
+        np.testing.assert_array_equal(first["total_interest"], second["total_interest"])
+
+    def test_process_pool_matches_single_process(self, input_data):
+        """Test that results do not depend on the number of workers"""
+        single = montecarlo.run_monte_carlo(
+            input_data, paths=2000, seed=7, workers=1, chunk_size=500
+        )
+        pooled = montecarlo.run_monte_carlo(
+            input_data, paths=2000, seed=7, workers=2, chunk_size=500
+        )
+        np.testing.assert_array_equal(single["payoff_years"], pooled["payoff_years"])
+        np.testing.assert_array_equal(
+            single["total_interest"], pooled["total_interest"]
+        )
+
+    def test_distributions(self, input_data):
+        result = montecarlo.run_monte_carlo(input_data, paths=5000, seed=3)
+        assert len(result["payoff_years"]) == 5000
+        percentiles = result["percentiles"]["total_interest"]
+        assert list(percentiles) == list(montecarlo.DEFAULT_PERCENTILES)
+        assert percentiles[5] < percentiles[50] < percentiles[95]
+        assert result["remaining_debt_at_binding_end"] == pytest.approx(
+            FinancingCalculator(input_data).get_summary(10)["remaining_debt"]
+        )
+
+    def test_paid_off_during_binding(self):
+        """Test that a loan repaid within the binding period has no risk"""
+        input_data = FinancingInput(
+            purchase_price=200000,
+            equity=100000,
+            interest_rate=3.0,
+            initial_amortization=20.0,
+            interest_binding_years=15,
+        )
+        result = montecarlo.run_monte_carlo(input_data, paths=100, seed=1)
+        payoff = FinancingCalculator(input_data).calculate_payoff_years()
+        assert (result["payoff_years"] == payoff).all()
+        assert np.ptp(result["total_interest"]) == 0
+        assert result["remaining_debt_at_binding_end"] == 0
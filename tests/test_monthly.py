@@ -0,0 +1,168 @@
+"""
+Unit tests for the monthly amortization engine
+Checks the vectorized monthly schedule against a month-by-month loop
+"""
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import monthly
+from calculator import FinancingCalculator, FinancingInput
+
+
+SCENARIOS = [
+    # principal, rate, monthly_payment, special_payment, special_month
+    (240000, 0.045, 1500.0, 0, 12),
+    (450000, 0.04, 2250.0, 0, 12),
+    (350000, 0.035, 1604.17, 2000, 6),
+    (200000, 0.0, 416.67, 1500, 1),
+    (240000, 0.03, 1000.0, 50000, 3),
+    (240000, 0.05, 1000.0, 0, 12),
+    (0, 0.045, 500.0, 0, 12),
+]
+
+
+def _reference_schedule(principal, rate, monthly_payment, special, month, months):
+    """Month-by-month reference loop"""
+    rows = []
+    debt = principal
+    for index in range(months):
+        interest = debt * rate / 12
+        payment = monthly_payment + (special if index % 12 == month - 1 else 0)
+        amortization = min(payment - interest, debt)
+        rows.append((debt, interest, amortization, debt - amortization))
+        debt = max(debt - amortization, 0)
+    return np.array(rows).reshape(-1, 4)
+
+
+class TestMonthlySchedule:
+    """Tests for monthly_schedule_arrays and its roll-up"""
+
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    @pytest.mark.parametrize("months", [1, 11, 12, 13, 360, 1200])
+    def test_matches_reference_loop(self, scenario, months):
+        """Test every column against the month-by-month loop"""
+        result = monthly.monthly_schedule_arrays(*scenario, months)
+        expected = _reference_schedule(*scenario, months)
+        assert result["month"].tolist() == list(range(1, months + 1))
+        for column, key in enumerate(
+            ["debt_start", "interest", "amortization", "debt_end"]
+        ):
+            np.testing.assert_allclose(
+                result[key], expected[:, column], rtol=1e-9, atol=1e-6
+            )
+
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    def test_yearly_rollup_is_consistent(self, scenario):
+        """Test that yearly sums and balances follow from the monthly rows"""
+        months = 12 * 30 + 5
+        schedule = monthly.monthly_schedule_arrays(*scenario, months)
+        yearly = monthly.yearly_rollup(schedule)
+
+        assert yearly["year"].tolist() == list(range(1, 32))
+        np.testing.assert_allclose(
+            yearly["interest"][:-1],
+            schedule["interest"][:360].reshape(30, 12).sum(axis=1),
+        )
+        np.testing.assert_allclose(
+            yearly["debt_start"] - yearly["amortization"], yearly["debt_end"], atol=1e-6
+        )
+        assert yearly["debt_end"][-1] == schedule["debt_end"][-1]
+
+    def test_empty_schedule(self):
+        """Test that zero months produce empty arrays"""
+        yearly = monthly.yearly_rollup(
+            monthly.monthly_schedule_arrays(100000, 0.04, 500, 0, 12, 0)
+        )
+        assert all(len(values) == 0 for values in yearly.values())
+
+    def test_payoff_months_precise(self):
+        """Test the fractional payoff month against the reference loop"""
+        schedule = monthly.monthly_schedule_arrays(10000, 0.0, 1000.0, 500, 3, 24)
+        # Two months of 1000, a third with 1500, then 1000 per month
+        assert monthly.payoff_months_precise(schedule, 1000.0, 500, 3) == 9.5
+
+    def test_payoff_not_reached(self):
+        """Test that an interest-only schedule is never repaid"""
+        schedule = monthly.monthly_schedule_arrays(240000, 0.05, 1000.0, 0, 12, 120)
+        assert monthly.payoff_months_precise(schedule, 1000.0, 0, 12) == np.inf
+
+
+class TestCalculatorMonthlyResolution:
+    """Tests for FinancingCalculator with resolution='monthly'"""
+
+    @pytest.fixture
+    def monthly_input(self):
+        return FinancingInput(
+            purchase_price=400000,
+            equity=50000,
+            interest_rate=3.5,
+            initial_amortization=2.0,
+            annual_special_payment=2000,
+            special_payment_month=6,
+            resolution="monthly",
+        )
+
+    def test_schedule_is_rolled_up_monthly_schedule(self, monthly_input):
+        """Test that the yearly schedule aggregates the monthly loop"""
+        calc = FinancingCalculator(monthly_input)
+        schedule = calc.calculate_schedule(10)
+        expected = _reference_schedule(
+            calc.loan_amount, 0.035, calc.monthly_payment, 2000, 6, 120
+        )
+        assert len(schedule) == 10
+        for entry, rows in zip(schedule, expected.reshape(10, 12, 4)):
+            assert entry.interest_payment == pytest.approx(rows[:, 1].sum())
+            assert entry.amortization == pytest.approx(rows[:, 2].sum())
+            assert entry.debt_end == pytest.approx(rows[-1, 3])
+
+    def test_monthly_interest_is_lower_than_yearly(self, monthly_input):
+        """Test that paying monthly reduces the interest of the first year"""
+        yearly_input = FinancingInput(
+            **{**vars(monthly_input), "resolution": "yearly"}
+        )
+        monthly_schedule = FinancingCalculator(monthly_input).calculate_schedule(1)
+        yearly_schedule = FinancingCalculator(yearly_input).calculate_schedule(1)
+        assert monthly_schedule[0].interest_payment < yearly_schedule[0].interest_payment
+
+    def test_payoff_years(self, monthly_input):
+        """Test payoff years against the reference loop"""
+        calc = FinancingCalculator(monthly_input)
+        rows = _reference_schedule(
+            calc.loan_amount, 0.035, calc.monthly_payment, 2000, 6, 1200
+        )
+        payoff_month = int(np.argmax(rows[:, 3] <= 0)) + 1
+        assert calc.calculate_payoff_years() == -(-payoff_month // 12)
+        precise = calc.calculate_payoff_years_precise()
+        assert payoff_month - 1 < precise * 12 <= payoff_month
+
+    def test_summary_totals_match_schedule(self, monthly_input):
+        """Test get_summary totals against the rolled-up schedule"""
+        calc = FinancingCalculator(monthly_input)
+        summary = calc.get_summary(15)
+        schedule = calc.calculate_schedule(15)
+        assert summary["total_interest"] == pytest.approx(
+            sum(entry.interest_payment for entry in schedule)
+        )
+        assert summary["remaining_debt"] == pytest.approx(schedule[-1].debt_end)
+        assert summary["interest_savings"] > 0
+        assert 0 < summary["time_to_50_equity"] < calc.calculate_payoff_years()
+
+    def test_interest_only_loan_caps_payoff(self):
+        """Test that a loan that is never repaid reports max_years"""
+        calc = FinancingCalculator(
+            FinancingInput(
+                purchase_price=300000,
+                equity=60000,
+                interest_rate=5.0,
+                initial_amortization=0.0,
+                resolution="monthly",
+            )
+        )
+        assert calc.calculate_payoff_years() == 100
+        assert calc.calculate_payoff_years_precise() == 100.0
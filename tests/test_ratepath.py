@@ -0,0 +1,133 @@
+"""
+Unit tests for the interest rate path engine
+Checks vectorized multi-segment schedules against a year-by-year loop
+"""
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import ratepath
+from calculator import FinancingCalculator, FinancingInput
+
+
+PATHS = [
+    [(None, 4.0)],
+    [(10, 4.0), (None, 5.0)],
+    [(10, 3.5), (5, 4.2), (None, 6.0)],
+    [(5, 0.0), (None, 2.0)],
+    [(3, 4.0)],
+    [(10, 3.0), (None, 9.0)],
+    [(1, 2.0), (1, 3.0), (1, 4.0), (1, 5.0), (None, 1.0)],
+]
+
+
+def _reference(principal, payment, segments, years):
+    """Year-by-year loop over the expanded rate path"""
+    rates = []
+    for length, rate in segments:
+        rates += [rate / 100] * (length or years)
+    rates = (rates + rates[-1:] * years)[:years]
+
+    rows = []
+    debt = principal
+    for rate in rates:
+        interest = debt * rate
+        amortization = min(payment - interest, debt)
+        rows.append((debt, interest, amortization, debt - amortization))
+        debt = max(debt - amortization, 0)
+    return np.array(rows).reshape(-1, 4)
+
+
+@pytest.fixture
+def calculator():
+    return FinancingCalculator(
+        FinancingInput(
+            purchase_price=400000,
+            equity=50000,
+            interest_rate=4.0,
+            initial_amortization=2.0,
+            annual_special_payment=1000,
+        )
+    )
+
+
+class TestRatePathArrays:
+    """Tests for rate_path_arrays and evaluate_rate_paths"""
+
+    @pytest.mark.parametrize("years", [0, 1, 12, 40, 100])
+    def test_matches_reference_loop(self, years):
+        result = ratepath.rate_path_arrays(350000, 16000, PATHS, years)
+        assert result["debt_end"].shape == (len(PATHS), years)
+        for row, segments in enumerate(PATHS):
+            expected = _reference(350000, 16000, segments, years)
+            for column, key in enumerate(
+                ["debt_start", "interest", "amortization", "debt_end"]
+            ):
+                np.testing.assert_allclose(
+                    result[key][row], expected[:, column], rtol=1e-9, atol=1e-6
+                )
+
+    def test_per_path_principal_and_payment(self):
+        """Test that principal and payment broadcast per path"""
+        result = ratepath.evaluate_rate_paths(
+            [100000, 200000], [10000, 10000], [[(None, 3.0)], [(None, 3.0)]]
+        )
+        assert result["payoff_years"][0] < result["payoff_years"][1]
+
+    def test_payoff_and_totals(self):
+        result = ratepath.evaluate_rate_paths(350000, 16000, PATHS)
+        for row, segments in enumerate(PATHS):
+            expected = _reference(350000, 16000, segments, 100)
+            paid = expected[:, 3] <= 0
+            payoff = int(paid.argmax()) + 1 if paid.any() else 100
+            assert result["payoff_years"][row] == payoff
+            assert result["total_interest"][row] == pytest.approx(
+                expected[:payoff, 1].sum()
+            )
+            assert result["remaining_debt"][row] == pytest.approx(
+                expected[-1, 3], abs=1e-6
+            )
+
+    def test_infeasible_path_reports_horizon(self):
+        """Test that a rate the payment cannot cover never pays off"""
+        result = ratepath.evaluate_rate_paths(350000, 16000, [[(10, 3.0), (None, 9.0)]])
+        assert result["payoff_years"][0] == 100
+        assert result["remaining_debt"][0] > 0
+
+    @pytest.mark.parametrize(
+        "paths",
+        [[], [[]], [[(None, 3.0), (None, 4.0)]], [[(0, 3.0), (None, 4.0)]]],
+    )
+    def test_invalid_paths_raise(self, paths):
+        with pytest.raises(ValueError):
+            ratepath.rate_path_arrays(100000, 10000, paths, 10)
+
+
+class TestCalculatorRatePaths:
+    """Tests for the FinancingCalculator rate path methods"""
+
+    def test_single_rate_path_matches_payoff(self, calculator):
+        result = calculator.calculate_with_rate_path([(None, 4.0)])
+        assert result["payoff_years"] == calculator.calculate_payoff_years()
+        assert result["total_interest"] == pytest.approx(
+            calculator.get_summary(result["payoff_years"])["total_interest"]
+        )
+
+    def test_rate_change_is_two_segment_path(self, calculator):
+        change = calculator.calculate_with_rate_change(5.5)
+        path = calculator.calculate_with_rate_path([(10, 4.0), (None, 5.5)])
+        assert change["new_payoff_years"] == path["payoff_years"]
+        assert change["new_total_interest"] == pytest.approx(path["total_interest"])
+
+    def test_compare_rate_paths(self, calculator):
+        """Test that dozens of follow-up paths are evaluated together"""
+        paths = [[(10, 4.0), (None, rate)] for rate in np.linspace(1.0, 7.0, 25)]
+        result = calculator.compare_rate_paths(paths)
+        assert len(result) == 25
+        assert result["total_interest"].is_monotonic_increasing
+        assert result["payoff_years"].is_monotonic_increasing
@@ -0,0 +1,157 @@
+"""
+Unit tests for the side-effect-free calculator API and immutable results
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import dataclasses
+import json
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from cache import cached_schedule, cached_summary
+from calculator import MONTHLY_RESOLUTION, FinancingCalculator, FinancingInput
+
+
+@pytest.fixture
+def input_data():
+    return FinancingInput(
+        purchase_price=450000,
+        equity=90000,
+        interest_rate=3.8,
+        initial_amortization=2.0,
+        annual_special_payment=3000,
+    )
+
+
+class TestImmutableResults:
+    """Tests for evaluate and compute_schedule"""
+
+    def test_evaluate_matches_mutating_api(self, input_data):
+        result = FinancingCalculator(input_data).evaluate()
+        calc = FinancingCalculator(input_data)
+        payoff_years = calc.calculate_payoff_years()
+        schedule = calc.calculate_schedule(payoff_years)
+        assert result.payoff_years == result.years == payoff_years
+        np.testing.assert_array_equal(result.schedule.debt_end, schedule.debt_end)
+        assert result.summary == calc.get_summary(payoff_years)
+
+    def test_result_is_frozen(self, input_data):
+        result = FinancingCalculator(input_data).evaluate(10)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.years = 5
+        with pytest.raises(ValueError):
+            result.schedule.debt_end[0] = 0
+        with pytest.raises(TypeError):
+            result.summary["total_interest"] = 0
+        with pytest.raises(TypeError):
+            result.summary.pop("total_interest")
+        assert len(result.schedule) == 10
+
+    def test_nested_values_are_read_only(self, input_data):
+        result = FinancingCalculator(input_data).evaluate(10)
+        buildup = result.summary["equity_buildup_rate"]
+        assert isinstance(buildup, tuple)
+        with pytest.raises(TypeError):
+            buildup[0]["equity_gained"] = 0
+        with pytest.raises(TypeError):
+            buildup[0].update(year=0)
+        assert json.loads(json.dumps(buildup[0])) == dict(buildup[0])
+
+    def test_input_is_a_copy(self, input_data):
+        result = FinancingCalculator(input_data).evaluate(10)
+        input_data.equity = 0
+        assert result.input is not input_data
+        assert result.input.equity == 90000
+
+    def test_input_copy_is_not_shared(self, input_data):
+        """Test that neither the calculator nor the result see the other's input"""
+        data = dataclasses.replace(input_data, special_payments=[5000] * 5)
+        calc = FinancingCalculator(data)
+        result = calc.evaluate(10)
+        result.input.equity = 0
+        assert calc.input.equity == 90000
+        assert calc.evaluate(10).input.equity == 90000
+        assert result.summary["equity"] == 90000
+        with pytest.raises(TypeError):
+            result.input.special_payments[0] = 0
+
+    def test_compute_schedule_leaves_calculator_unchanged(self, input_data):
+        calc = FinancingCalculator(input_data)
+        schedule = calc.compute_schedule(12)
+        assert len(schedule) == 12
+        assert len(calc.schedule) == 0
+        assert calc.schedule_arrays == {}
+
+    def test_read_only_table_shares_arrays(self, input_data):
+        calc = FinancingCalculator(input_data)
+        table = calc.calculate_schedule(5)
+        frozen = table.read_only()
+        assert np.shares_memory(frozen.debt_end, table.debt_end)
+        table.debt_end[0] = 1.0  # The original stays writable
+        assert frozen.debt_end[0] == 1.0
+
+
+class TestPaymentOverride:
+    """Tests for payoff_for_payment and with_monthly_payment"""
+
+    def test_payoff_for_payment_is_pure(self, input_data):
+        calc = FinancingCalculator(input_data)
+        monthly_payment = calc.monthly_payment
+        result = calc.payoff_for_payment(2500)
+        assert calc.monthly_payment == monthly_payment
+        assert result == FinancingCalculator(input_data).calculate_years_to_payoff(
+            2500
+        )
+
+    def test_mutating_wrapper_keeps_payment(self, input_data):
+        calc = FinancingCalculator(input_data)
+        calc.calculate_years_to_payoff(2500)
+        assert calc.monthly_payment == 2500
+        expected = FinancingCalculator(input_data).with_monthly_payment(2500)
+        assert calc.get_summary(10) == expected.get_summary(10)
+
+    def test_infeasible_payment_keeps_payment(self, input_data):
+        calc = FinancingCalculator(input_data)
+        monthly_payment = calc.monthly_payment
+        assert not calc.calculate_years_to_payoff(100)["feasible"]
+        assert calc.monthly_payment == monthly_payment
+
+    def test_with_monthly_payment_returns_new_calculator(self, input_data):
+        calc = FinancingCalculator(input_data)
+        changed = calc.with_monthly_payment(3000)
+        assert changed is not calc
+        assert changed.annual_payment == 36000
+        assert calc.monthly_payment != 3000
+
+
+class TestSharing:
+    """Tests for sharing calculators and results between threads"""
+
+    @pytest.mark.parametrize("resolution", ["yearly", MONTHLY_RESOLUTION])
+    def test_concurrent_summaries_of_shared_calculator(self, input_data, resolution):
+        input_data = dataclasses.replace(input_data, resolution=resolution)
+        shared = FinancingCalculator(input_data)
+        horizons = [5, 10, 15, 20, 25, 30] * 10
+
+        def evaluate(years):
+            return shared.evaluate(years).summary.to_dict()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(evaluate, horizons))
+
+        for years, summary in zip(horizons, results):
+            assert summary == FinancingCalculator(input_data).get_summary(years)
+
+    def test_cached_values_are_read_only(self, input_data):
+        with pytest.raises(TypeError):
+            cached_summary(input_data, 10)["total_interest"] = 0
+        with pytest.raises(TypeError):
+            cached_summary(input_data, 10)["equity_buildup_rate"][0]["year"] = 0
+        with pytest.raises(ValueError):
+            cached_schedule(input_data, 10).interest_payment[0] = 0
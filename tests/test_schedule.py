@@ -0,0 +1,130 @@
+"""
+Unit tests for the columnar schedule table
+"""
+
+import io
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from calculator import FinancingCalculator, FinancingInput
+from schedule import COLUMNS, ScheduleRow, ScheduleTable
+
+
+@pytest.fixture
+def calculator():
+    return FinancingCalculator(
+        FinancingInput(
+            purchase_price=400000,
+            equity=50000,
+            interest_rate=3.5,
+            initial_amortization=2.0,
+            annual_special_payment=2000,
+        )
+    )
+
+
+class TestScheduleTable:
+    """Tests for ScheduleTable and its row views"""
+
+    def test_rows_match_reference_schedule(self, calculator):
+        """Test that row views expose the YearlySchedule fields"""
+        table = calculator.calculate_schedule(30)
+        reference = calculator.calculate_schedule_iterative(30)
+        assert isinstance(table, ScheduleTable)
+        assert len(table) == len(reference)
+        for row, entry in zip(table, reference):
+            for name, value in asdict(entry).items():
+                assert getattr(row, name) == pytest.approx(value, abs=1e-6)
+
+    def test_row_values_are_python_scalars(self, calculator):
+        """Test that rows return plain ints and floats"""
+        row = calculator.calculate_schedule(3)[0]
+        assert type(row.year) is int
+        assert type(row.debt_end) is float
+
+    def test_rows_have_no_instance_dict(self, calculator):
+        """Test that row views are slotted"""
+        row = calculator.calculate_schedule(3)[-1]
+        assert isinstance(row, ScheduleRow)
+        assert not hasattr(row, "__dict__")
+        assert row.year == 3
+
+    def test_index_out_of_range(self, calculator):
+        table = calculator.calculate_schedule(3)
+        with pytest.raises(IndexError):
+            table[3]
+
+    def test_slicing_shares_memory(self, calculator):
+        """Test that slices are views of the same column arrays"""
+        table = calculator.calculate_schedule(20)
+        window = table[5:10]
+        assert isinstance(window, ScheduleTable)
+        assert len(window) == 5
+        assert window[0].year == 6
+        for name in COLUMNS:
+            assert np.shares_memory(getattr(window, name), getattr(table, name))
+
+    def test_columns_share_kernel_arrays(self, calculator):
+        """Test that the table wraps the kernel output without copying"""
+        table = calculator.calculate_schedule(10)
+        assert table.debt_end is calculator.schedule_arrays["debt_end"]
+        assert table.interest_payment is calculator.schedule_arrays["interest"]
+
+    def test_memory_is_much_smaller_than_entries(self, calculator):
+        """Test memory per 100-year schedule against dataclass entries"""
+        table = calculator.calculate_schedule(100)
+        reference = calculator.calculate_schedule_iterative(100)
+        list_bytes = sys.getsizeof(reference) + sum(
+            sys.getsizeof(entry)
+            + sys.getsizeof(vars(entry))
+            + sum(sys.getsizeof(value) for value in vars(entry).values())
+            for entry in reference
+        )
+        assert table.nbytes * 5 <= list_bytes
+
+    def test_to_records(self, calculator):
+        """Test JSON-ready records"""
+        table = calculator.calculate_schedule(2)
+        records = table.to_records()
+        assert records == [row.to_dict() for row in table]
+        assert list(records[0]) == list(COLUMNS)
+
+    def test_to_dataframe_with_labels(self, calculator):
+        table = calculator.calculate_schedule(4)
+        df = table.to_dataframe({"year": "Jahr"})
+        assert list(df.columns) == ["Jahr"] + list(COLUMNS[1:])
+        np.testing.assert_array_equal(df["debt_end"].to_numpy(), table.debt_end)
+
+    def test_to_dataframe_without_copy_shares_columns(self, calculator):
+        table = calculator.calculate_schedule(4).read_only()
+        df = table.to_dataframe({"year": "Jahr"}, copy=False)
+        for label, name in zip(df.columns, COLUMNS):
+            assert np.shares_memory(df[label].to_numpy(), getattr(table, name))
+        with pytest.raises(ValueError):
+            df.iloc[0, 1] = 0.0
+
+    def test_to_dataframe_copies_by_default(self, calculator):
+        table = calculator.calculate_schedule(4)
+        df = table.to_dataframe()
+        assert not np.shares_memory(df["debt_end"].to_numpy(), table.debt_end)
+
+    def test_to_csv_round_trip(self, calculator):
+        table = calculator.calculate_schedule(4)
+        df = pd.read_csv(io.StringIO(table.to_csv()))
+        assert list(df.columns) == list(COLUMNS)
+        np.testing.assert_allclose(df["interest_payment"], table.interest_payment)
+
+    def test_empty_table(self):
+        table = ScheduleTable.empty()
+        assert len(table) == 0
+        assert not table
+        assert table.to_records() == []
+        assert table.to_dataframe().empty
@@ -0,0 +1,141 @@
+"""
+Unit tests for the Vasicek / Hull-White short-rate models
+"""
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from calculator import FinancingCalculator, FinancingInput
+from shortrate import ShortRateModel, refinancing_risk
+
+
+def _reference_paths(model, initial_rate, years, paths, seed):
+    """Step-by-step loop with the same random numbers"""
+    rng = np.random.default_rng(seed)
+    steps = years * model.steps_per_year
+    factor, shock = model._step
+    levels = model._levels(steps)
+    noise = rng.standard_normal((paths, steps))
+    rates = np.empty((paths, steps + 1))
+    rates[:, 0] = initial_rate
+    for step in range(steps):
+        rates[:, step + 1] = (
+            factor * rates[:, step]
+            + (1 - factor) * levels[step]
+            + shock * noise[:, step]
+        )
+    return rates
+
+
+class TestShortRateModel:
+    """Tests for path generation, moments and calibration"""
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            ShortRateModel(mean_reversion=0.1, volatility=1.0, long_run_rate=3.0),
+            ShortRateModel(mean_reversion=0.0, volatility=0.8, long_run_rate=3.0),
+            ShortRateModel(
+                mean_reversion=2.0, volatility=1.0, long_run_rate=3.0, steps_per_year=12
+            ),
+            ShortRateModel.hull_white(0.2, 0.9, np.linspace(2.0, 4.0, 41)),
+        ],
+    )
+    def test_matches_step_by_step_recursion(self, model):
+        rates = model.simulate(4.0, 40, 200, seed=11)
+        expected = _reference_paths(model, 4.0, 40, 200, seed=11)
+        np.testing.assert_allclose(rates, expected, rtol=1e-9, atol=1e-9)
+
+    def test_seed_replays_exactly(self):
+        model = ShortRateModel(0.1, 1.0, 3.0)
+        np.testing.assert_array_equal(
+            model.simulate(4.0, 30, 100, seed=5), model.simulate(4.0, 30, 100, seed=5)
+        )
+
+    def test_moments_match_analytic(self):
+        model = ShortRateModel(0.15, 1.0, 3.0)
+        rates = model.simulate(5.0, 20, 40000, seed=1)
+        assert rates.mean(axis=0) == pytest.approx(model.mean(5.0, 20), abs=0.03)
+        assert rates.std(axis=0) == pytest.approx(model.std(20), abs=0.03)
+
+    def test_lattice_median_is_mean(self):
+        model = ShortRateModel(0.1, 1.0, 3.0)
+        lattice = model.lattice(4.0, 10, quantiles=(5, 50, 95))
+        assert lattice.shape == (3, 11)
+        np.testing.assert_allclose(lattice[1], model.mean(4.0, 10))
+        assert (lattice[0, 1:] < lattice[2, 1:]).all()
+
+    def test_calibration_recovers_parameters(self):
+        truth = ShortRateModel(0.2, 0.8, 3.5)
+        history = truth.simulate(3.0, 5000, 1, seed=3)[0]
+        fitted = ShortRateModel.calibrate(history)
+        assert fitted.mean_reversion == pytest.approx(0.2, rel=0.2)
+        assert fitted.volatility == pytest.approx(0.8, rel=0.1)
+        assert fitted.long_run_rate == pytest.approx(3.5, abs=0.3)
+
+    def test_hull_white_fits_forward_curve(self):
+        """Test that the expected rate is the forward rate plus convexity"""
+        forward = np.linspace(2.0, 4.0, 31)
+        model = ShortRateModel.hull_white(0.1, 0.0, forward)
+        np.testing.assert_allclose(model.mean(2.0, 30), forward)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"mean_reversion": -0.1, "volatility": 1.0, "long_run_rate": 3.0},
+            {"mean_reversion": 0.1, "volatility": -1.0, "long_run_rate": 3.0},
+            {
+                "mean_reversion": 0.1,
+                "volatility": 1.0,
+                "long_run_rate": 3.0,
+                "steps_per_year": 0,
+            },
+        ],
+    )
+    def test_invalid_parameters_raise(self, kwargs):
+        with pytest.raises(ValueError):
+            ShortRateModel(**kwargs)
+
+
+class TestRefinancingRisk:
+    """Tests for refinancing_risk"""
+
+    @pytest.fixture
+    def input_data(self):
+        return FinancingInput(
+            purchase_price=400000,
+            equity=50000,
+            interest_rate=4.0,
+            initial_amortization=2.0,
+            interest_binding_years=10,
+        )
+
+    def test_deterministic_model_matches_rate_path(self, input_data):
+        """Test that a noise-free model reduces to a fixed follow-up rate"""
+        model = ShortRateModel(0.0, 0.0, 4.0)
+        result = refinancing_risk(input_data, model, paths=10, seed=1, workers=1)
+        calc = FinancingCalculator(input_data)
+        assert (result["payoff_years"] == calc.calculate_payoff_years()).all()
+
+    def test_uncertainty_grows_with_volatility(self, input_data):
+        calm = refinancing_risk(
+            input_data, ShortRateModel(0.1, 0.2, 4.0), paths=4000, seed=2
+        )
+        volatile = refinancing_risk(
+            input_data, ShortRateModel(0.1, 1.5, 4.0), paths=4000, seed=2
+        )
+        assert np.std(volatile["total_interest"]) > np.std(calm["total_interest"])
+        assert calm["remaining_debt_at_binding_end"] == pytest.approx(
+            volatile["remaining_debt_at_binding_end"]
+        )
+
+    def test_seed_replays_exactly(self, input_data):
+        model = ShortRateModel(0.1, 1.0, 3.0)
+        first = refinancing_risk(input_data, model, paths=3000, seed=9)
+        second = refinancing_risk(input_data, model, paths=3000, seed=9)
+        np.testing.assert_array_equal(first["total_interest"], second["total_interest"])
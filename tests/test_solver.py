@@ -0,0 +1,163 @@
+"""
+Unit tests for the goal-seek solver
+"""
+
+from dataclasses import replace
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from calculator import MONTHLY_RESOLUTION, FinancingCalculator, FinancingInput
+from cents import ROUND_HALF_UP
+from solver import evaluate_target, solve
+
+
+@pytest.fixture
+def input_data():
+    return FinancingInput(
+        purchase_price=400000,
+        equity=80000,
+        interest_rate=4.0,
+        initial_amortization=2.0,
+        annual_special_payment=2000,
+        interest_binding_years=10,
+    )
+
+
+class TestClosedForm:
+    """Tests for targets solved analytically"""
+
+    @pytest.mark.parametrize(
+        "field", ["equity", "purchase_price", "interest_rate", "initial_amortization"]
+    )
+    def test_monthly_payment(self, input_data, field):
+        result = solve(input_data, field, "monthly_payment", 1500)
+        assert result["method"] == "closed_form"
+        assert FinancingCalculator(result["input"]).monthly_payment == pytest.approx(
+            1500
+        )
+
+    @pytest.mark.parametrize("field", ["initial_amortization", "annual_special_payment"])
+    def test_payoff_in_whole_years(self, input_data, field):
+        """Test the smallest payment that repays the loan in exactly 25 years"""
+        result = solve(input_data, field, "payoff_years", 25)
+        assert result["method"] == "closed_form"
+        calculator = FinancingCalculator(result["input"])
+        assert calculator.calculate_payoff_years() == 25
+        assert calculator.calculate_payoff_years_precise() == pytest.approx(25)
+
+    def test_special_payment_clears_debt_by_binding_end(self, input_data):
+        result = solve(input_data, "annual_special_payment", "remaining_debt", 0, 10)
+        assert result["method"] == "closed_form"
+        assert FinancingCalculator(result["input"]).get_summary(10)[
+            "remaining_debt"
+        ] == pytest.approx(0, abs=1e-6)
+        # Any smaller special payment leaves debt at binding end
+        smaller = replace(result["input"], annual_special_payment=result["value"] - 1)
+        assert evaluate_target(smaller, "remaining_debt", 10) > 0
+
+
+class TestBracketed:
+    """Tests for targets solved iteratively"""
+
+    @pytest.mark.parametrize(
+        "field, target, value",
+        [
+            ("initial_amortization", "payoff_years", 25.5),
+            ("equity", "payoff_years", 20),
+            ("interest_rate", "total_interest", 150000),
+            ("purchase_price", "total_interest", 200000),
+            ("annual_special_payment", "total_interest", 100000),
+        ],
+    )
+    def test_reaches_target(self, input_data, field, target, value):
+        result = solve(input_data, field, target, value)
+        assert result["method"] == "bracketed"
+        assert result["achieved"] == pytest.approx(value, abs=1e-6)
+        assert result["evaluations"] <= 40
+
+    def test_monthly_resolution(self, input_data):
+        monthly = replace(input_data, resolution=MONTHLY_RESOLUTION)
+        result = solve(monthly, "initial_amortization", "payoff_years", 25)
+        assert result["method"] == "bracketed"
+        assert FinancingCalculator(
+            result["input"]
+        ).calculate_payoff_years_precise() == pytest.approx(25, abs=1e-6)
+
+    def test_cent_rounding_uses_cents_kernel(self, input_data):
+        """Test targets that the float closed form would miss by a few cents"""
+        exact = replace(input_data, rounding=ROUND_HALF_UP)
+        result = solve(exact, "annual_special_payment", "remaining_debt", 0, 10)
+        assert result["method"] == "bracketed"
+        assert result["achieved"] == 0
+        # Whole-cent payments move the payoff in steps of about 2e-4 years
+        result = solve(exact, "initial_amortization", "payoff_years", 25)
+        assert result["method"] == "bracketed"
+        assert result["achieved"] == pytest.approx(25, abs=1e-4)
+        assert FinancingCalculator(result["input"]).calculate_payoff_years() == 25
+
+    def test_special_payments_by_year(self, input_data):
+        """Test that the closed form is skipped for special_payments"""
+        data = replace(input_data, special_payments=[5000] * 5)
+        result = solve(data, "initial_amortization", "payoff_years", 25)
+        assert result["method"] == "bracketed"
+        assert result["achieved"] == pytest.approx(25, abs=1e-6)
+
+    def test_zero_debt_finds_boundary(self, input_data):
+        """Test that the smallest equity clearing the debt is found"""
+        result = solve(input_data, "equity", "remaining_debt", 0, years=15)
+        assert result["achieved"] == 0
+        less_equity = replace(result["input"], equity=result["value"] - 1)
+        assert evaluate_target(less_equity, "remaining_debt", 15) > 0
+
+    def test_evaluations_are_bounded(self, input_data):
+        result = solve(
+            input_data, "equity", "payoff_years", 20, tolerance=0, max_evaluations=10
+        )
+        assert result["evaluations"] == 10
+
+
+class TestErrors:
+    """Tests for invalid requests"""
+
+    def test_unreachable_target(self, input_data):
+        with pytest.raises(ValueError, match="not reachable"):
+            solve(input_data, "interest_rate", "total_interest", -1)
+
+    def test_closed_form_outside_bounds(self, input_data):
+        with pytest.raises(ValueError, match="not reachable"):
+            solve(input_data, "initial_amortization", "monthly_payment", 10)
+
+    @pytest.mark.parametrize(
+        "field, target, value",
+        [
+            ("initial_amortization", "monthly_payment", 1500),
+            ("interest_rate", "monthly_payment", 1500),
+            ("initial_amortization", "payoff_years", 20),
+        ],
+    )
+    def test_without_loan(self, input_data, field, target, value):
+        data = replace(input_data, equity=input_data.purchase_price)
+        with pytest.raises(ValueError, match="not reachable"):
+            solve(data, field, target, value)
+
+    def test_unknown_field(self, input_data):
+        with pytest.raises(ValueError, match="field"):
+            solve(input_data, "interest_binding_years", "payoff_years", 20)
+
+    def test_unknown_target(self, input_data):
+        with pytest.raises(ValueError, match="target"):
+            solve(input_data, "equity", "ltv_ratio", 80)
+
+    def test_special_payment_with_special_payments(self, input_data):
+        data = replace(input_data, special_payments=[5000] * 5)
+        with pytest.raises(ValueError, match="special_payments"):
+            solve(data, "annual_special_payment", "remaining_debt", 0, 10)
+
+    def test_remaining_debt_requires_years(self, input_data):
+        with pytest.raises(ValueError, match="years"):
+            solve(input_data, "equity", "remaining_debt", 0)
@@ -0,0 +1,103 @@
+"""
+Unit tests for the special payment optimizer
+"""
+
+from dataclasses import replace
+import itertools
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from calculator import MONTHLY_RESOLUTION, FinancingCalculator, FinancingInput
+from specialpayments import greedy_allocation, optimize_special_payments
+
+
+@pytest.fixture
+def input_data():
+    return FinancingInput(
+        purchase_price=400000,
+        equity=80000,
+        interest_rate=3.5,
+        initial_amortization=2.0,
+    )
+
+
+def _total_interest(input_data, special_payments):
+    calculator = FinancingCalculator(
+        replace(input_data, special_payments=special_payments)
+    )
+    payoff_years = calculator.calculate_payoff_years()
+    return calculator.get_summary(payoff_years)["total_interest"]
+
+
+class TestGreedyAllocation:
+    """Tests for greedy_allocation"""
+
+    def test_matches_recursion(self):
+        rng = np.random.default_rng(7)
+        liquidity = rng.choice([0, 5000, 20000, 60000], size=30)
+        caps = rng.choice([8000, 16000], size=30)
+        paid = 0.0
+        expected = []
+        for year in range(30):
+            total = min(paid + caps[year], liquidity[: year + 1].sum())
+            expected.append(total - paid)
+            paid = total
+        np.testing.assert_allclose(greedy_allocation(liquidity, caps), expected)
+
+    def test_carries_over_unspent_liquidity(self):
+        np.testing.assert_allclose(
+            greedy_allocation([50000, 0, 0, 3000], 16000), [16000, 16000, 16000, 5000]
+        )
+
+
+class TestOptimizeSpecialPayments:
+    """Tests for optimize_special_payments"""
+
+    def test_respects_caps_and_liquidity(self, input_data):
+        liquidity = [5000, 30000, 0, 0, 8000] + [6000] * 40
+        result = optimize_special_payments(input_data, liquidity)
+        allocation = result["special_payments"]
+        assert (allocation <= 0.05 * 320000 + 1e-9).all()
+        assert (result["unused_liquidity"] >= -1e-9).all()
+        assert (allocation[result["payoff_years"]:] == 0).all()
+        np.testing.assert_allclose(allocation[:3], [5000, 16000, 14000])
+
+    @pytest.mark.parametrize("resolution", ["yearly", MONTHLY_RESOLUTION])
+    def test_beats_every_plan_on_a_grid(self, input_data, resolution):
+        """Test optimality against brute force over a discretized plan space"""
+        input_data = replace(input_data, resolution=resolution)
+        liquidity = [10000, 0, 20000, 0]
+        result = optimize_special_payments(input_data, liquidity, cap_percentage=5)
+        steps = np.arange(0, 16001, 4000)
+        for plan in itertools.product(steps, repeat=4):
+            paid = np.cumsum(plan)
+            if (paid > np.cumsum(liquidity)).any():
+                continue
+            assert result["total_interest"] <= _total_interest(input_data, plan) + 1e-6
+            payoff = FinancingCalculator(
+                replace(input_data, special_payments=plan)
+            ).calculate_payoff_years_precise()
+            assert result["payoff_years_precise"] <= payoff + 1e-9
+
+    def test_reports_interest_savings(self, input_data):
+        result = optimize_special_payments(input_data, [0, 20000] + [3000] * 30)
+        plain = FinancingCalculator(input_data)
+        payoff_years = plain.calculate_payoff_years()
+        assert result["interest_without_special"] == pytest.approx(
+            plain.get_summary(payoff_years)["total_interest"]
+        )
+        assert result["interest_savings"] == pytest.approx(
+            result["interest_without_special"] - result["total_interest"]
+        )
+        assert result["time_saved_years"] == payoff_years - result["payoff_years"]
+        assert result["input"].annual_special_payment == 0
+
+    def test_negative_liquidity_raises(self, input_data):
+        with pytest.raises(ValueError):
+            optimize_special_payments(input_data, [1000, -500])
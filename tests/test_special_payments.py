@@ -0,0 +1,179 @@
+"""
+Unit tests for special payments that vary by year
+Tests FinancingInput.special_payments and the variable-payment kernel
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import annuity
+import batch
+import montecarlo
+from cache import CanonicalInput
+from calculator import MONTHLY_RESOLUTION, FinancingCalculator, FinancingInput
+from cents import ROUND_HALF_UP
+
+
+@pytest.fixture
+def input_data():
+    return FinancingInput(
+        purchase_price=400000,
+        equity=80000,
+        interest_rate=3.5,
+        initial_amortization=2.0,
+    )
+
+
+class TestVariableKernel:
+    """Tests for annuity.schedule_arrays_variable"""
+
+    def test_constant_payments_match_closed_form(self):
+        variable = annuity.schedule_arrays_variable(250000, 0.04, np.full(40, 15000.0))
+        constant = annuity.schedule_arrays(250000, 0.04, 15000, 40)
+        for key in ("debt_start", "interest", "amortization", "debt_end"):
+            np.testing.assert_allclose(variable[key], constant[key], atol=1e-6)
+
+    def test_matches_recursion(self):
+        payments = np.array([9000, 0, 25000, 9000, 60000, 9000, 9000, 9000, 9000.0])
+        arrays = annuity.schedule_arrays_variable(100000, 0.05, payments)
+        debt = 100000.0
+        for period, payment in enumerate(payments):
+            interest = debt * 0.05
+            amortization = min(payment - interest, debt)
+            assert arrays["debt_start"][period] == pytest.approx(debt)
+            assert arrays["amortization"][period] == pytest.approx(amortization)
+            debt -= amortization
+        assert arrays["debt_end"][-1] == 0
+
+    def test_zero_rate_and_no_periods(self):
+        arrays = annuity.schedule_arrays_variable(1000, 0.0, [300, 300, 300, 300])
+        np.testing.assert_allclose(arrays["debt_end"], [700, 400, 100, 0])
+        assert len(annuity.schedule_arrays_variable(1000, 0.03, [])["period"]) == 0
+
+
+class TestSpecialPaymentSchedules:
+    """Tests for FinancingInput.special_payments in the calculator"""
+
+    @pytest.mark.parametrize("resolution", ["yearly", MONTHLY_RESOLUTION])
+    @pytest.mark.parametrize("rounding", [None, ROUND_HALF_UP])
+    def test_constant_schedule_matches_annual_special_payment(
+        self, input_data, resolution, rounding
+    ):
+        constant = replace(
+            input_data,
+            annual_special_payment=5000,
+            resolution=resolution,
+            rounding=rounding,
+        )
+        variable = replace(
+            constant, annual_special_payment=0, special_payments=[5000] * 100
+        )
+        expected = FinancingCalculator(constant)
+        calc = FinancingCalculator(variable)
+        assert calc.calculate_payoff_years() == expected.calculate_payoff_years()
+        assert calc.calculate_payoff_years_precise() == pytest.approx(
+            expected.calculate_payoff_years_precise()
+        )
+        summary = calc.get_summary(15)
+        for key in ("total_interest", "remaining_debt", "interest_savings"):
+            assert summary[key] == pytest.approx(expected.get_summary(15)[key])
+
+    def test_one_time_payment_in_year_seven(self, input_data):
+        """Test an inheritance paid once in year 7"""
+        data = replace(input_data, special_payments=[0] * 6 + [50000])
+        calc = FinancingCalculator(data)
+        plain = FinancingCalculator(input_data)
+        schedule = calc.compute_schedule(8)
+        reference = plain.compute_schedule(8)
+        np.testing.assert_allclose(schedule.debt_end[:6], reference.debt_end[:6])
+        assert schedule.amortization[6] == pytest.approx(
+            reference.amortization[6] + 50000
+        )
+        assert calc.calculate_payoff_years() < plain.calculate_payoff_years()
+        assert calc.get_summary(10)["interest_savings"] > 0
+
+    def test_matches_iterative_references(self, input_data):
+        calc = FinancingCalculator(
+            replace(input_data, special_payments=[3000, 0, 12000, 0, 0, 20000])
+        )
+        years = calc.calculate_payoff_years()
+        assert years == calc.calculate_payoff_years_iterative()
+        assert calc.calculate_payoff_years_precise() == pytest.approx(
+            calc.calculate_payoff_years_precise_iterative()
+        )
+        iterative = calc.calculate_schedule_iterative(years)
+        np.testing.assert_allclose(
+            calc.compute_schedule(years).debt_end,
+            [entry.debt_end for entry in iterative],
+            atol=1e-6,
+        )
+
+    def test_monthly_amounts(self, input_data):
+        """Test special payments given per month in monthly resolution"""
+        amounts = np.zeros((3, 12))
+        amounts[1, 5] = 10000
+        amounts[2, [2, 8]] = 3000
+        calc = FinancingCalculator(
+            replace(input_data, resolution=MONTHLY_RESOLUTION, special_payments=amounts)
+        )
+        schedule = calc.compute_schedule(4)
+        np.testing.assert_allclose(
+            schedule.amortization,
+            [entry.amortization for entry in calc.iter_schedule(4)],
+        )
+        yearly = FinancingCalculator(replace(input_data, special_payments=amounts))
+        assert yearly.compute_schedule(3).amortization[1] > 10000
+
+    def test_input_is_normalized(self, input_data):
+        data = replace(input_data, special_payments=np.array([1000, -0.0, 2000]))
+        assert data.special_payments == (1000.0, 0.0, 2000.0)
+        assert CanonicalInput.from_input(data) == CanonicalInput.from_input(
+            replace(input_data, special_payments=[1000, 0, 2000])
+        )
+        with pytest.raises(ValueError):
+            replace(input_data, special_payments=[[1000, 2000]])
+
+    def test_rules_default_to_input_special_payments(self, input_data):
+        data = replace(input_data, special_payments=[0, 40000])
+        calc = FinancingCalculator(data)
+        np.testing.assert_allclose(
+            calc.calculate_schedule_with_rules(5).debt_end,
+            calc.compute_schedule(5).debt_end,
+        )
+        limited = calc.calculate_schedule_with_rules(5, special_payment_limit=5)
+        assert limited.amortization[1] == pytest.approx(
+            calc.compute_schedule(2).amortization[1] - 40000 + 16000
+        )
+
+
+class TestUnsupportedAnalyses:
+    """Tests for analyses modeling only annual_special_payment"""
+
+    @pytest.mark.parametrize(
+        "analysis",
+        [
+            lambda calc: calc.calculate_with_rate_change(5.0),
+            lambda calc: calc.calculate_with_rate_path([(10, 3.5), (None, 5.0)]),
+            lambda calc: calc.calculate_years_to_payoff(2000),
+            lambda calc: calc.calculate_years_to_payoff_iterative(2000),
+            lambda calc: calc.calculate_affordability_curve(6000, [20, 30]),
+        ],
+    )
+    def test_calculator_rejects_special_payments(self, input_data, analysis):
+        calc = FinancingCalculator(replace(input_data, special_payments=[10000] * 10))
+        with pytest.raises(ValueError, match="special_payments"):
+            analysis(calc)
+
+    def test_modules_reject_special_payments(self, input_data):
+        data = replace(input_data, special_payments=[10000] * 10)
+        with pytest.raises(ValueError, match="special_payments"):
+            batch.evaluate_sensitivity_grid(data, [3.0, 4.0], [2.0, 3.0])
+        with pytest.raises(ValueError, match="special_payments"):
+            montecarlo.run_monte_carlo(data, paths=10, seed=1, workers=1)
@@ -0,0 +1,152 @@
+"""
+Unit tests for the lazy Summary mapping returned by get_summary
+"""
+
+import json
+import pickle
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from cache import _estimate_size
+from calculator import FinancingCalculator, FinancingInput
+from summary import Summary
+
+SUMMARY_KEYS = [
+    "purchase_price",
+    "equity",
+    "loan_amount",
+    "annual_payment",
+    "monthly_payment",
+    "interest_rate",
+    "initial_amortization",
+    "total_interest",
+    "total_amortization",
+    "remaining_debt",
+    "years",
+    "total_cost_of_ownership",
+    "interest_to_principal_ratio",
+    "ltv_ratio",
+    "interest_savings",
+    "interest_without_special",
+    "interest_with_special",
+    "time_saved_years",
+    "breakeven_year",
+    "cumulative_amortization_at_breakeven",
+    "cumulative_interest_at_breakeven",
+    "equity_buildup_rate",
+    "buffer_ratio",
+    "time_to_50_equity",
+    "rate_sensitivity_score",
+]
+
+
+@pytest.fixture
+def counted_summary():
+    """Summary with two groups that count their evaluations"""
+    calls = {"a": 0, "b": 0}
+
+    def group_a():
+        calls["a"] += 1
+        return {"x": 1, "y": 2}
+
+    def group_b():
+        calls["b"] += 1
+        return {"z": summary["x"] + 10}
+
+    summary = Summary([(("x", "y"), group_a), (("z",), group_b)])
+    return summary, calls
+
+
+class TestSummaryMapping:
+    """Tests for the Summary dict subclass"""
+
+    def test_groups_computed_once_on_access(self, counted_summary):
+        summary, calls = counted_summary
+        assert calls == {"a": 0, "b": 0}
+        assert summary["y"] == 2
+        assert summary["x"] == 1
+        assert calls == {"a": 1, "b": 0}
+        assert summary["z"] == 11
+        assert calls == {"a": 1, "b": 1}
+
+    def test_membership_and_length_do_not_compute(self, counted_summary):
+        summary, calls = counted_summary
+        assert "z" in summary
+        assert "missing" not in summary
+        assert len(summary) == 3
+        assert list(summary) == ["x", "y", "z"]
+        assert calls == {"a": 0, "b": 0}
+        assert not summary.is_evaluated("x")
+
+    def test_behaves_like_dict(self, counted_summary):
+        summary, _ = counted_summary
+        assert summary == {"x": 1, "y": 2, "z": 11}
+        assert summary.get("missing", 5) == 5
+        with pytest.raises(KeyError):
+            summary["missing"]
+        assert json.loads(json.dumps(summary)) == {"x": 1, "y": 2, "z": 11}
+        assert dict(summary) == {**summary} == summary.copy()
+        assert pickle.loads(pickle.dumps(summary)) == summary
+
+    def test_mutation(self, counted_summary):
+        summary, calls = counted_summary
+        assert summary.pop("z") == 11
+        summary["y"] = 5
+        del summary["x"]
+        summary["w"] = 0
+        assert list(summary.items()) == [("y", 5), ("w", 0)]
+        assert len(summary) == 2
+
+
+class TestLazyGetSummary:
+    """Tests for the laziness of FinancingCalculator.get_summary"""
+
+    @pytest.fixture
+    def calculator(self):
+        return FinancingCalculator(
+            FinancingInput(
+                purchase_price=400000,
+                equity=80000,
+                interest_rate=3.5,
+                initial_amortization=2.0,
+                annual_special_payment=5000,
+            )
+        )
+
+    def test_keys_in_original_order(self, calculator):
+        assert list(calculator.get_summary(10)) == SUMMARY_KEYS
+
+    def test_cheap_keys_skip_payoff_kpis(self, calculator):
+        """Test that the counterfactual and equity list are only computed when read"""
+        summary = calculator.get_summary(10)
+        assert summary["monthly_payment"] == calculator.monthly_payment
+        assert summary["total_interest"] > 0
+        assert "counterfactual" not in calculator._kpi_values()
+        assert not summary.is_evaluated("equity_buildup_rate")
+        assert summary["interest_savings"] > 0
+        assert "counterfactual" in calculator._kpi_values()
+        assert "cumulative_equity" not in calculator._kpi_values()
+
+    def test_matches_fully_evaluated_summary(self, calculator):
+        lazy = calculator.get_summary(25)
+        eager = FinancingCalculator(calculator.input).get_summary(25).to_dict()
+        for key in reversed(SUMMARY_KEYS):
+            assert lazy[key] == eager[key]
+
+    def test_keeps_terms_of_the_call(self, calculator):
+        """Test that a later payment change does not reach a pending summary"""
+        expected = FinancingCalculator(calculator.input).get_summary(10).to_dict()
+        summary = calculator.get_summary(10)
+        calculator.calculate_years_to_payoff(2500)
+        assert summary.to_dict() == expected
+        assert calculator.get_summary(10)["monthly_payment"] == 2500
+
+    def test_cache_size_estimate_does_not_compute(self, calculator):
+        summary = calculator.get_summary(10)
+        _estimate_size(summary)
+        assert not summary.is_evaluated("equity_buildup_rate")